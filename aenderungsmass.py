@@ -1,25 +1,27 @@
 import streamlit as st
-import random
+
+import fortschritt
+import problem_pool
 
 
 # ==========================================================
 #   HILFSFUNKTIONEN
 # ==========================================================
 
-def _random_table():
-    years = sorted(random.sample(range(1995, 2025), 4))
-    start = random.uniform(100, 900)
+def _random_table(rng):
+    years = sorted(rng.sample(range(1995, 2025), 4))
+    start = rng.uniform(100, 900)
 
-    scenario = random.choice(["sparbuch", "briefmarken", "muenzen"])
+    scenario = rng.choice(["sparbuch", "briefmarken", "muenzen"])
     values = [round(start, 2)]
 
     for _ in range(3):
         if scenario == "sparbuch":
-            values.append(round(values[-1] + random.uniform(20, 120), 2))
+            values.append(round(values[-1] + rng.uniform(20, 120), 2))
         elif scenario == "briefmarken":
-            values.append(round(values[-1] - random.uniform(10, 80), 2))
+            values.append(round(values[-1] - rng.uniform(10, 80), 2))
         else:
-            values.append(round(values[-1] + random.uniform(50, 200), 2))
+            values.append(round(values[-1] + rng.uniform(50, 200), 2))
 
     return years, values, scenario
 
@@ -36,33 +38,32 @@ def _scenario_text(name, scenario):
 #   ÄNDERUNGSMAßE
 # ==========================================================
 
+def _gen_table_task(rng):
+    years, vals, scen = _random_table(rng)
+    i1, i2 = sorted(rng.sample(range(4), 2))
+    return {
+        "years": years,
+        "vals": vals,
+        "scenario": scen,
+        "name": rng.choice(["Anna", "Ben", "Clara", "David", "Eva", "Felix"]),
+        "i1": i1,
+        "i2": i2,
+    }
+
+
 def _mode_abs():
     key = "aend_abs"
 
     if st.button("Neues Beispiel", key="btn_abs_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        years, vals, scen = _random_table()
-        st.session_state[key] = {
-            "years": years,
-            "vals": vals,
-            "scenario": scen,
-            "name": random.choice(["Anna", "Ben", "Clara", "David", "Eva", "Felix"]),
-            "i1": None,
-            "i2": None,
-        }
-
-    data = st.session_state[key]
+    data = problem_pool.current(key, _gen_table_task)
     years, vals, scen, name = data["years"], data["vals"], data["scenario"], data["name"]
 
     st.subheader("Absolute Änderung")
     st.write(_scenario_text(name, scen))
     st.dataframe({"t [Jahr]": years, "W(t) [Euro]": vals}, hide_index=True)
 
-    if data["i1"] is None:
-        data["i1"], data["i2"] = sorted(random.sample(range(4), 2))
-
     i1, i2 = data["i1"], data["i2"]
     t1, t2 = years[i1], years[i2]
     w1, w2 = vals[i1], vals[i2]
@@ -70,6 +71,7 @@ def _mode_abs():
     st.markdown(f"**Aufgabe:** Ermittle die absolute Änderung zwischen **{t1}** und **{t2}**.")
 
     if st.button("Lösung anzeigen", key="btn_abs_sol"):
+        fortschritt.loesung(key)
         diff = round(w2 - w1, 2)
         st.latex(rf"W({t2}) - W({t1}) = {w2} - {w1} = {diff}\ \text{{Euro}}")
 
@@ -80,27 +82,13 @@ def _mode_mittel():
     if st.button("Neues Beispiel", key="btn_mittel_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        years, vals, scen = _random_table()
-        st.session_state[key] = {
-            "years": years,
-            "vals": vals,
-            "scenario": scen,
-            "name": random.choice(["Anna", "Ben", "Clara", "David", "Eva", "Felix"]),
-            "i1": None,
-            "i2": None,
-        }
-
-    data = st.session_state[key]
+    data = problem_pool.current(key, _gen_table_task)
     years, vals, scen, name = data["years"], data["vals"], data["scenario"], data["name"]
 
     st.subheader("Mittlere Änderung")
     st.write(_scenario_text(name, scen))
     st.dataframe({"t [Jahr]": years, "W(t) [Euro]": vals}, hide_index=True)
 
-    if data["i1"] is None:
-        data["i1"], data["i2"] = sorted(random.sample(range(4), 2))
-
     i1, i2 = data["i1"], data["i2"]
     t1, t2 = years[i1], years[i2]
     w1, w2 = vals[i1], vals[i2]
@@ -108,6 +96,7 @@ def _mode_mittel():
     st.markdown(f"**Aufgabe:** Ermittle die mittlere Änderung zwischen **{t1}** und **{t2}**.")
 
     if st.button("Lösung anzeigen", key="btn_mittel_sol"):
+        fortschritt.loesung(key)
         avg = round((w2 - w1) / (t2 - t1), 2)
         st.latex(
             rf"\frac{{W({t2}) - W({t1})}}{{{t2}-{t1}}} = "
@@ -121,27 +110,13 @@ def _mode_rel():
     if st.button("Neues Beispiel", key="btn_rel_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        years, vals, scen = _random_table()
-        st.session_state[key] = {
-            "years": years,
-            "vals": vals,
-            "scenario": scen,
-            "name": random.choice(["Anna", "Ben", "Clara", "David", "Eva", "Felix"]),
-            "i1": None,
-            "i2": None,
-        }
-
-    data = st.session_state[key]
+    data = problem_pool.current(key, _gen_table_task)
     years, vals, scen, name = data["years"], data["vals"], data["scenario"], data["name"]
 
     st.subheader("Relative Änderung")
     st.write(_scenario_text(name, scen))
     st.dataframe({"t [Jahr]": years, "W(t) [Euro]": vals}, hide_index=True)
 
-    if data["i1"] is None:
-        data["i1"], data["i2"] = sorted(random.sample(range(4), 2))
-
     i1, i2 = data["i1"], data["i2"]
     t1, t2 = years[i1], years[i2]
     w1, w2 = vals[i1], vals[i2]
@@ -149,6 +124,7 @@ def _mode_rel():
     st.markdown(f"**Aufgabe:** Ermittle die relative Änderung zwischen **{t1}** und **{t2}**.")
 
     if st.button("Lösung anzeigen", key="btn_rel_sol"):
+        fortschritt.loesung(key)
         rel_dec = round((w2 - w1) / w1, 4)
         rel_pct = round(rel_dec * 100, 2)
 
@@ -163,55 +139,58 @@ def _mode_rel():
 #   ÄNDERUNGSFAKTOREN
 # ==========================================================
 
+def _gen_changer_single(rng):
+    perc = rng.choice([round(rng.uniform(0.5, 50), 1), rng.randint(1, 70)])
+    direction = rng.choice(["steigt", "sinkt"])
+    item = rng.choice([
+        "Der Wert eines Handys",
+        "Der Preis einer Jacke",
+        "Der Wert einer Aktie",
+        "Der Wert eines Fahrrads"
+    ])
+    return (item, direction, perc)
+
+
 def _changer_single():
     if st.button("Neues Beispiel", key="af_new"):
         st.session_state.pop("af_single", None)
 
-    if "af_single" not in st.session_state:
-        perc = random.choice([round(random.uniform(0.5, 50), 1), random.randint(1, 70)])
-        direction = random.choice(["steigt", "sinkt"])
-        item = random.choice([
-            "Der Wert eines Handys",
-            "Der Preis einer Jacke",
-            "Der Wert einer Aktie",
-            "Der Wert eines Fahrrads"
-        ])
-        st.session_state["af_single"] = (item, direction, perc)
-
-    item, direction, perc = st.session_state["af_single"]
+    item, direction, perc = problem_pool.current("af_single", _gen_changer_single)
 
     st.markdown(f"**Angabe:** {item} {direction} um **{perc}%**.")
     st.markdown("**Aufgabe:** Ermittle den Änderungsfaktor.")
 
     if st.button("Lösung anzeigen", key="af_sol"):
+        fortschritt.loesung("af_single")
         p_dec = round(perc / 100, 4)
         a = 1 + p_dec if direction == "steigt" else 1 - p_dec
         op = "+" if direction == "steigt" else "-"
         st.latex(rf"a = 1 {op} {p_dec} = {a:.4f}")
 
 
-def _changer_total():
-    if st.button("Neues Beispiel", key="afg_new"):
-        st.session_state.pop("af_ges", None)
+def _gen_changer_total(rng):
+    steps = []
+    for _ in range(3):
+        perc = rng.choice([round(rng.uniform(0.5, 50), 1), rng.randint(1, 70)])
+        direction = rng.choice(["steigt", "sinkt"])
+        a = round(1 + perc/100, 4) if direction == "steigt" else round(1 - perc/100, 4)
+        steps.append((direction, perc, a))
+
+    item = rng.choice([
+        "Der Wert eines Handys",
+        "Der Preis einer Jacke",
+        "Der Wert einer Aktie",
+        "Der Wert eines Fahrrads"
+    ])
 
-    if "af_ges" not in st.session_state:
-        steps = []
-        for _ in range(3):
-            perc = random.choice([round(random.uniform(0.5, 50), 1), random.randint(1, 70)])
-            direction = random.choice(["steigt", "sinkt"])
-            a = round(1 + perc/100, 4) if direction == "steigt" else round(1 - perc/100, 4)
-            steps.append((direction, perc, a))
+    return (item, steps)
 
-        item = random.choice([
-            "Der Wert eines Handys",
-            "Der Preis einer Jacke",
-            "Der Wert einer Aktie",
-            "Der Wert eines Fahrrads"
-        ])
 
-        st.session_state["af_ges"] = (item, steps)
+def _changer_total():
+    if st.button("Neues Beispiel", key="afg_new"):
+        st.session_state.pop("af_ges", None)
 
-    item, steps = st.session_state["af_ges"]
+    item, steps = problem_pool.current("af_ges", _gen_changer_total)
 
     text = f"{item} "
     for i, (direction, perc, _) in enumerate(steps):
@@ -227,6 +206,7 @@ def _changer_total():
     st.markdown("**Aufgabe:** Ermittle den gesamten Änderungsfaktor.")
 
     if st.button("Lösung anzeigen", key="afg_sol"):
+        fortschritt.loesung("af_ges")
         facs = [a for (_, _, a) in steps]
         prod = 1
         for f in facs:
@@ -236,32 +216,30 @@ def _changer_total():
         st.latex(rf"a_\text{{gesamt}} = {latex_chain} = {prod:.4f}")
 
 
-def _changer_mean():
-    if "af_mittel" in st.session_state and len(st.session_state["af_mittel"]) != 3:
-        st.session_state.pop("af_mittel")
+def _gen_changer_mean(rng):
+    steps = []
+    for _ in range(3):
+        perc = rng.choice([round(rng.uniform(0.5, 50), 1), rng.randint(1, 70)])
+        direction = rng.choice(["steigt", "sinkt"])
+        a = round(1 + perc/100, 4) if direction == "steigt" else round(1 - perc/100, 4)
+        steps.append((direction, perc, a))
 
-    if st.button("Neues Beispiel", key="afm_new"):
-        st.session_state.pop("af_mittel", None)
+    unit = rng.choice(["Monat", "Woche", "Jahr"])
+    item = rng.choice([
+        "Der Wert eines Handys",
+        "Der Preis einer Jacke",
+        "Der Wert einer Aktie",
+        "Der Wert eines Fahrrads"
+    ])
 
-    if "af_mittel" not in st.session_state:
-        steps = []
-        for _ in range(3):
-            perc = random.choice([round(random.uniform(0.5, 50), 1), random.randint(1, 70)])
-            direction = random.choice(["steigt", "sinkt"])
-            a = round(1 + perc/100, 4) if direction == "steigt" else round(1 - perc/100, 4)
-            steps.append((direction, perc, a))
+    return (item, steps, unit)
 
-        unit = random.choice(["Monat", "Woche", "Jahr"])
-        item = random.choice([
-            "Der Wert eines Handys",
-            "Der Preis einer Jacke",
-            "Der Wert einer Aktie",
-            "Der Wert eines Fahrrads"
-        ])
 
-        st.session_state["af_mittel"] = (item, steps, unit)
+def _changer_mean():
+    if st.button("Neues Beispiel", key="afm_new"):
+        st.session_state.pop("af_mittel", None)
 
-    item, steps, unit = st.session_state["af_mittel"]
+    item, steps, unit = problem_pool.current("af_mittel", _gen_changer_mean)
 
     text = f"{item} "
     for i, (direction, perc, _) in enumerate(steps):
@@ -277,6 +255,7 @@ def _changer_mean():
     st.markdown("**Aufgabe:** Ermittle den mittleren Änderungsfaktor.")
 
     if st.button("Lösung anzeigen", key="afm_sol"):
+        fortschritt.loesung("af_mittel")
         facs = [a for (_, _, a) in steps]
         prod = 1
         for f in facs:
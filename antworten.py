@@ -0,0 +1,212 @@
+# antworten.py
+import functools
+import math
+import re
+from fractions import Fraction
+from typing import NamedTuple
+
+import numpy as np
+import streamlit as st
+
+import fortschritt
+import seeding
+
+
+# ==========================================================
+#   ANTWORTEN PRÜFEN
+# ==========================================================
+# Eingaben sind Text ("3/4", "-2", "1.234,56 €", "x = 0,75"). Verglichen
+# wird mit den Lösungen der reinen _solve_*-Funktionen (über
+# arbeitsblatt.TASKS), nie mit dem, was die Seite anzeigt. Prüfen braucht
+# weder Session noch Streamlit; ganze Klassen werden mit check_batch in
+# einem Durchgang geprüft.
+#
+# Ergebnis je Feld: True (richtig), False (falsch), None (leer/unlesbar).
+
+class Rule(NamedTuple):
+    kind: str                   # "exact" (Bruch/ganze Zahl) oder "round"
+    decimals: int = 0           # "round": Anzahl der Nachkommastellen
+    scale: Fraction = Fraction(1)  # Lösung · scale = erwartete Eingabe (z.B. Cent -> Euro)
+
+    @property
+    def tol(self) -> float:
+        # richtig gerundet oder genauer; etwas Luft für float-Rundung
+        return 0.5 * 10 ** -self.decimals * (1 + 1e-9)
+
+    @property
+    def hint(self) -> str:
+        if self.kind == "exact":
+            return "exakt, z.B. 7 oder -3/4"
+        return f"auf {self.decimals} Nachkommastellen gerundet"
+
+
+EXAKT = Rule("exact")
+GELD = Rule("round", 2)
+CENT = Rule("round", 2, Fraction(1, 100))   # Lösung in Cent, Eingabe in Euro
+PROZENT = Rule("round", 2)
+FAKTOR = Rule("round", 4)
+
+# Aufgabe (Name wie in arbeitsblatt.TASKS) -> {Lösungsfeld: Regel}.
+# Felder, die in einer Lösung fehlen (z.B. K_0 vs. K_n), werden übergangen.
+# Nur ein Teil davon hat im Kapitel Eingabefelder (eingabe); die übrigen
+# (z.B. zz.kest, quad.*, bza.standard, rente.erkennen) prüfen nur
+# abgegebene Arbeitsblätter über check_batch.
+_LGS_XY = {"x": EXAKT, "y": EXAKT}
+_LGS_TEXT = {**_LGS_XY, "x_cent": CENT, "y_cent": CENT}
+_ZZ = {"q": FAKTOR, "K_0": GELD, "K_n": GELD}
+
+RULES = {
+    **{name: _LGS_XY for name in ("lgs.eindeutig", "lgs.eindeutig_A", "lgs.eindeutig_B", "lgs.eindeutig_C",
+                                  "lgs.loesungsmenge", "lgs.loesungsmenge_A", "lgs.loesungsmenge_B",
+                                  "lgs.loesungsmenge_C")},
+    **{name: _LGS_TEXT for name in ("lgs.text", "lgs.text_preise", "lgs.text_tiere")},
+    "lgs.3x3": {**_LGS_XY, "z": EXAKT},
+    "mat.fehlend": {"x": EXAKT},
+
+    "quad.diskriminante": {"D": EXAKT},
+    "quad.erloes_gewinn": {"lo_in": EXAKT, "hi_in": EXAKT, "x_star": GELD, "G_star": GELD},
+
+    **{name: {"x": FAKTOR} for name in ("expgl.gemischt", "expgl.AB", "expgl.CD", "expgl.F",
+                                        *(f"expgl.typ_{t}" for t in "ABCDEF"))},
+
+    "bza.standard": {"value": GELD, "t": GELD},
+
+    "zz.barwert": _ZZ,
+    "zz.endwert": _ZZ,
+    "zz.barwert_mehrere": {"q": FAKTOR, "BW": GELD},
+    "zz.endwert_mehrere": {"q": FAKTOR, "EW": GELD},
+    "zz.angebote": {"q": FAKTOR, "BW_A": GELD, "BW_B": GELD},
+    "zz.kest": {"i_mit": PROZENT, "i_ohne": PROZENT},
+    "zz.theoretisch": {**_ZZ, "n": FAKTOR},
+    "zz.unterjaehrig": {"K_0": GELD, "K_n": GELD, "q_m": FAKTOR},
+    "zz.unbekannt": {"i": PROZENT, "q": FAKTOR, "n_jahre": EXAKT},
+
+    "rente.erkennen": {"q": FAKTOR, "wert": GELD},
+}
+
+
+# ----------------- Eingaben lesen -----------------
+
+_PREFIX = re.compile(r"^[A-Za-z_]\w*=")   # "x=", "K_n=" vor der Zahl
+
+
+@functools.lru_cache(maxsize=4096)
+def parse(text: str) -> Fraction | None:
+    """Eingabe -> exakter Bruch; None, wenn leer oder keine Zahl.
+
+    Dezimalkomma und Tausenderpunkte ("1.234,56") sind erlaubt, ebenso
+    Brüche ("3/4"), Einheiten (€, %) und ein führendes "x =".
+    """
+    s = text.strip().replace(" ", "").replace("−", "-").replace("€", "").replace("%", "")
+    s = _PREFIX.sub("", s)
+    if "," in s:
+        s = s.replace(".", "").replace(",", ".")
+    if not s:
+        return None
+    try:
+        return Fraction(s)
+    except (ValueError, ZeroDivisionError):
+        return None
+
+
+def _expected(value, rule: Rule) -> Fraction:
+    if isinstance(value, float):
+        value = Fraction(value).limit_denominator(10**12)
+    return Fraction(value) * rule.scale
+
+
+def check(text: str, expected, rule: Rule) -> bool | None:
+    """Eine Eingabe gegen einen Lösungswert prüfen."""
+    got = parse(text)
+    if got is None:
+        return None
+    if rule.kind == "exact":
+        return got == _expected(expected, rule)
+    return abs(float(got) - float(expected) * float(rule.scale)) <= rule.tol
+
+
+def check_answers(answers: dict, solution: dict, rules: dict) -> dict:
+    """{feld: eingabe} gegen eine Lösung; nur Felder mit Regel und Lösungswert."""
+    return {
+        f: check(text, solution[f], rules[f])
+        for f, text in answers.items()
+        if f in rules and solution.get(f) is not None
+    }
+
+
+def _task(name: str):
+    import arbeitsblatt  # spät: arbeitsblatt importiert die Kapitel, die dieses Modul nutzen
+    return arbeitsblatt.TASKS[name]
+
+
+def check_task(name: str, problem, answers: dict, solution: dict | None = None) -> dict:
+    """Antworten zu einer Aufgabe aus arbeitsblatt.TASKS prüfen."""
+    if solution is None:
+        solution = _task(name).solve(problem)
+    return check_answers(answers, solution, RULES[name])
+
+
+def check_batch(name: str, problems, answers, solutions=None) -> list[dict]:
+    """Viele Abgaben auf einmal: answers[k] gehört zu problems[k].
+
+    Lösungen werden nur berechnet, wenn sie nicht mitgegeben werden (z.B.
+    aus arbeitsblatt.generate). Gerundete Felder werden je Feld als
+    NumPy-Array verglichen.
+    """
+    rules = RULES[name]
+    if solutions is None:
+        solve = _task(name).solve
+        solutions = [solve(p) for p in problems]
+
+    results = [{} for _ in answers]
+    for field, rule in rules.items():
+        idx = [k for k, (a, s) in enumerate(zip(answers, solutions))
+               if field in a and s.get(field) is not None]
+        if not idx:
+            continue
+        if rule.kind == "exact":
+            for k in idx:
+                results[k][field] = check(answers[k][field], solutions[k][field], rule)
+            continue
+        got = np.array([_as_float(parse(answers[k][field])) for k in idx])
+        expected = np.array([float(solutions[k][field]) for k in idx]) * float(rule.scale)
+        ok = np.abs(got - expected) <= rule.tol
+        for k, g, o in zip(idx, got.tolist(), ok.tolist()):
+            results[k][field] = None if math.isnan(g) else o
+    return results
+
+
+def _as_float(x: Fraction | None) -> float:
+    return math.nan if x is None else float(x)
+
+
+# ----------------- Eingabe im Kapitel -----------------
+
+def eingabe(key: str, name: str, problem, fields: dict):
+    """Eingabefelder und „Antwort prüfen“ unter einer Aufgabe.
+
+    key: Session-Schlüssel der Aufgabe (für den Fortschritt),
+    fields: {lösungsfeld: beschriftung}, z.B. {"x": "x", "y": "y"}.
+    """
+    rules = RULES[name]
+    # Seed im Widget-Schlüssel: nach „Neues Beispiel“ leere Felder statt der alten Antwort
+    ref = st.session_state.get(key)
+    tag = ref.seed if isinstance(ref, seeding.ProblemRef) else ""
+    cols = st.columns(len(fields))
+    answers = {
+        f: col.text_input(label, key=f"{key}_ans_{tag}_{f}", help=rules[f].hint)
+        for col, (f, label) in zip(cols, fields.items())
+    }
+
+    if st.button("Antwort prüfen", key=f"{key}_check"):
+        result = check_task(name, problem, answers)
+        fortschritt.antwort(key, result)
+        falsch = [fields[f] for f, ok in result.items() if ok is False]
+        leer = [fields[f] for f, ok in result.items() if ok is None]
+        if not falsch and not leer:
+            st.success("Richtig!")
+        else:
+            if falsch:
+                st.error("Noch nicht richtig: " + ", ".join(falsch))
+            if leer:
+                st.warning("Keine gültige Zahl: " + ", ".join(leer))
@@ -0,0 +1,108 @@
+# arbeitsblatt.py
+import random
+from typing import Callable, NamedTuple, Optional
+
+import aufgabenraum
+import seeding
+import beschraenkte_zu_abnahme as bza
+import exponentialgleichungen as expgl
+import lineare_gleichungssysteme as lgs
+import matrizen as mat
+import quadratische_funktionen as quad
+import rentenrechnung as rente
+import trigonometrie as trig
+import zinseszins as zz
+
+
+# ==========================================================
+#   AUFGABEN STAPELWEISE (Arbeitsblätter, Schularbeits-Varianten)
+# ==========================================================
+# Nutzt nur die reinen Generator- und Lösungsfunktionen der Kapitel, keine
+# Session und keine Streamlit-Elemente. Ein Stapel ist durch (Aufgabe,
+# Anzahl, Seed) vollständig bestimmt.
+
+class Task(NamedTuple):
+    generator: Callable                  # rng -> Aufgabe
+    solve: Callable                      # Aufgabe -> Lösung (dict)
+    batch: Optional[Callable] = None     # (rng, anzahl) -> (Aufgaben, Lösungen), vektorisiert
+
+
+TASKS = {
+    # Lineare Gleichungssysteme
+    "lgs.eindeutig": Task(lgs._gen_tab1, lgs._solve_tab1),
+    "lgs.eindeutig_A": Task(lgs._gen_unique_formA, lgs._solve_tab1, lgs._batch_unique_formA),
+    "lgs.eindeutig_B": Task(lgs._gen_unique_formB, lgs._solve_tab1),
+    "lgs.eindeutig_C": Task(lgs._gen_unique_formC, lgs._solve_tab1),
+    "lgs.text": Task(lgs._gen_tab2, lgs._solve_tab2),
+    "lgs.text_preise": Task(lgs._gen_text_prices, lgs._solve_tab2),
+    "lgs.text_tiere": Task(lgs._gen_text_animals, lgs._solve_tab2),
+    "lgs.loesungsmenge": Task(lgs._gen_tab3, lgs._solve_tab3),
+    "lgs.loesungsmenge_A": Task(lgs._gen_solution_type_formA_complex, lgs._solve_tab3,
+                                lgs._batch_solution_type_formA_complex),
+    "lgs.3x3": Task(lgs._gen_unique_3x3, lgs._solve_3x3),
+    "lgs.loesungsmenge_B": Task(lgs._gen_solution_type_formB, lgs._solve_tab3),
+    "lgs.loesungsmenge_C": Task(lgs._gen_solution_type_formC, lgs._solve_tab3),
+
+    # Matrizen
+    "mat.fehlend": Task(mat._gen_missing, mat._solve_missing),
+
+    # Quadratische Funktionen
+    "quad.diskriminante": Task(quad._gen_quadratic_eq, quad._solve_quadratic_eq),
+    "quad.erloes_gewinn": Task(quad._gen_economics, quad._solve_economics),
+
+    # Exponentialgleichungen
+    "expgl.gemischt": Task(expgl._random_mixed, expgl._solve_example, expgl._batch_mixed),
+    "expgl.AB": Task(expgl._random_AB, expgl._solve_example, expgl._batch_AB),
+    "expgl.CD": Task(expgl._random_CD, expgl._solve_example, expgl._batch_CD),
+    "expgl.F": Task(expgl._random_F, expgl._solve_example, expgl._batch_F),
+    **{
+        f"expgl.typ_{t}": Task(getattr(expgl, f"_make_example_{t}"), expgl._solve_example)
+        for t in "ABCDEF"
+    },
+
+    # Beschränkte Zu-/Abnahme
+    "bza.standard": Task(bza.generate, bza._solve, bza._batch),
+
+    # Trigonometrie
+    "trig.rechtwinklig": Task(trig.gen_problem, trig.solve_problem,
+                              aufgabenraum.batch("trigonometrie.gen_problem")),
+
+    # Zinseszins
+    "zz.barwert": Task(zz._gen_barwert, zz._solve_barwert),
+    "zz.endwert": Task(zz._gen_endwert, zz._solve_endwert),
+    "zz.barwert_mehrere": Task(zz._gen_barwert_mehrere, zz._solve_barwert_mehrere),
+    "zz.endwert_mehrere": Task(zz._gen_endwert_mehrere, zz._solve_endwert_mehrere),
+    "zz.angebote": Task(zz._gen_angebote, zz._solve_angebote),
+    "zz.kest": Task(zz._gen_kest, zz._solve_kest, aufgabenraum.batch("zinseszins._gen_kest")),
+    "zz.theoretisch": Task(zz._gen_theoretische_verzinsung, zz._solve_theoretische_verzinsung),
+    "zz.unterjaehrig": Task(zz._gen_unterjaehrig, zz._solve_unterjaehrig),
+    "zz.unbekannt": Task(zz._gen_unbekannt, zz._solve_unbekannt),
+
+    # Rentenrechnung
+    "rente.erkennen": Task(rente._gen_renten_erkennen, rente._solve_renten_erkennen,
+                           aufgabenraum.batch("rentenrechnung._gen_renten_erkennen")),
+}
+
+
+def generate(name: str, count: int, seed: int | None = None, vectorized: bool = True) -> list[dict]:
+    """count Aufgaben samt Lösungen als [{"seed", "problem", "solution"}, ...].
+
+    Gleicher seed -> gleiches Arbeitsblatt. Im skalaren Pfad bekommt jede
+    Aufgabe ihren eigenen Seed (seeding.generate(task.generator, seed)
+    erzeugt sie erneut); im vektorisierten Pfad ist "seed" None.
+    """
+    task = TASKS[name]
+    rng = seeding.make_rng(seed)
+
+    if vectorized and task.batch is not None:
+        problems, solutions = task.batch(rng, count)
+        seeds = [None] * count
+    else:
+        seeds = [rng.getrandbits(32) for _ in range(count)]
+        problems = [task.generator(random.Random(s)) for s in seeds]
+        solutions = [task.solve(p) for p in problems]
+
+    return [
+        {"seed": s, "problem": p, "solution": sol}
+        for s, p, sol in zip(seeds, problems, solutions)
+    ]
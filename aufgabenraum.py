@@ -0,0 +1,287 @@
+# aufgabenraum.py
+import random
+import threading
+import time
+from functools import partial
+
+import numpy as np
+import streamlit as st
+
+import fortschritt
+import gesehen
+import seeding
+
+
+# ==========================================================
+#   VOLLSTÄNDIG AUFGEZÄHLTE AUFGABENRÄUME
+# ==========================================================
+# Manche Generatoren wählen nur aus kurzen Listen (trigonometrie.gen_problem:
+# 9 Winkel × 6 Hypotenusen × 9 Angaben = 486 Aufgaben). Für sie werden beim
+# ersten Gebrauch alle Aufgaben samt Lösung einmal erzeugt:
+#
+#   problems, solutions   Tupel, Position k = Aufgabe k
+#   seeds                 uint32, seeding.generate(gen, seeds[k]) == problems[k]
+#   fps / order           sortierte Fingerabdrücke (gesehen.fingerprint) -> k
+#
+# Aufgezählt wird, indem der Generator mit einem Ersatz-rng (_Pfad) jede
+# Folge von Entscheidungen einmal durchläuft; die Listen stehen also nur im
+# Generator. Zu jeder Aufgabe wird danach ein Seed gesucht, damit weiterhin
+# jede Aufgabe eine gewöhnliche ProblemRef (Generator-ID, Seed) hat.
+# Eine neue Aufgabe ist dann nur noch eine Indexziehung (problem_pool), und je
+# Schüler*in lässt sich sagen, wie viel des Raums schon gesehen wurde.
+
+RAEUME = {   # Generator -> Lösungsfunktion
+    "trigonometrie.gen_problem": "trigonometrie.solve_problem",
+    "rentenrechnung._gen_renten_erkennen": "rentenrechnung._solve_renten_erkennen",
+    "zinseszins._gen_kest": "zinseszins._solve_kest",
+}
+
+MAX_SIZE = 100_000         # größere Räume werden nicht aufgezählt
+MAX_SEEDS = 2_000_000      # so viele Seeds höchstens durchprobieren
+
+
+class _Pfad:
+    """Ersatz für random.Random: trifft die Entscheidungen aus choices
+    (danach immer die erste) und merkt sich, wie viele Möglichkeiten es gab."""
+
+    def __init__(self, choices):
+        self.choices = choices
+        self.arity = []
+
+    def _pick(self, n: int) -> int:
+        if n <= 0:
+            raise ValueError("leere Auswahl")
+        i = len(self.arity)
+        self.arity.append(n)
+        return self.choices[i] if i < len(self.choices) else 0
+
+    def choice(self, seq):
+        return seq[self._pick(len(seq))]
+
+    def randint(self, a: int, b: int) -> int:
+        return a + self._pick(b - a + 1)
+
+    def randrange(self, start: int, stop: int | None = None, step: int = 1) -> int:
+        if stop is None:
+            start, stop = 0, start
+        return start + step * self._pick(len(range(start, stop, step)))
+
+    def __getattr__(self, name):
+        raise AttributeError(f"rng.{name} lässt sich nicht aufzählen")
+
+
+def enumerate_problems(generator):
+    """Alle Aufgaben des Generators (ohne Doppelte), in Aufzählungsreihenfolge."""
+    gen_id = seeding.generator_id(generator)
+    problems, seen = [], set()
+    path = []
+    while True:
+        rng = _Pfad(path)
+        problem = generator(rng)
+        fp = gesehen.fingerprint(gen_id, problem)
+        if fp not in seen:
+            seen.add(fp)
+            problems.append(problem)
+            if len(problems) > MAX_SIZE:
+                raise ValueError(f"{gen_id}: mehr als {MAX_SIZE} Aufgaben")
+        # nächste Entscheidungsfolge (wie ein Zählwerk, hinten zuerst)
+        path = [path[i] if i < len(path) else 0 for i in range(len(rng.arity))]
+        while path and path[-1] + 1 >= rng.arity[len(path) - 1]:
+            path.pop()
+        if not path:
+            return problems
+        path[-1] += 1
+
+
+class Index:
+    def __init__(self, generator, solve):
+        self.gen_id = seeding.generator_id(generator)
+        self.problems = tuple(enumerate_problems(generator))
+        self.solutions = tuple(solve(p) for p in self.problems)
+
+        fps = np.array([gesehen.fingerprint(self.gen_id, p) for p in self.problems], dtype=np.uint64)
+        self.order = np.argsort(fps).astype(np.uint32)
+        self.fps = fps[self.order]
+        self.fp_at = fps                # Fingerabdruck je Position
+        self.seeds = self._find_seeds(generator)
+        self._seed_pos = {int(s): k for k, s in enumerate(self.seeds)}
+
+    def __len__(self):
+        return len(self.problems)
+
+    def _find_seeds(self, generator):
+        # Seeds 0, 1, 2, ... durchprobieren, bis jede Aufgabe einen hat
+        seeds = np.zeros(len(self), dtype=np.uint32)
+        missing = np.ones(len(self), dtype=bool)
+        left = len(self)
+        for seed in range(MAX_SEEDS):
+            k = self.position(generator(random.Random(seed)))
+            if k is not None and missing[k]:
+                seeds[k], missing[k] = seed, False
+                left -= 1
+                if not left:
+                    return seeds
+        raise ValueError(f"{self.gen_id}: {left} Aufgaben ohne Seed")
+
+    def position(self, problem) -> int | None:
+        """Position der Aufgabe im Index (None: nicht aus diesem Raum)."""
+        fp = np.uint64(gesehen.fingerprint(self.gen_id, problem))
+        i = int(np.searchsorted(self.fps, fp))
+        return int(self.order[i]) if i < len(self.fps) and self.fps[i] == fp else None
+
+    def position_of(self, seed: int) -> int | None:
+        k = self._seed_pos.get(seed)
+        return k if k is not None else self.position(seeding.generate(self.gen_id, seed))
+
+    def draw(self, rng=random) -> tuple[int, dict]:
+        """(seed, aufgabe) wie problem_pool.draw_seeded, gleichverteilt über den Raum."""
+        k = rng.randrange(len(self))
+        return int(self.seeds[k]), self.problems[k]
+
+    def solution(self, problem) -> dict | None:
+        k = self.position(problem)
+        return None if k is None else self.solutions[k]
+
+    def batch(self, rng, count: int):
+        """Wie arbeitsblatt.Task.batch: count Aufgaben samt Lösung."""
+        ks = np.random.default_rng(rng.getrandbits(64)).integers(len(self), size=count)
+        return [self.problems[k] for k in ks], [self.solutions[k] for k in ks]
+
+
+_INDEX = {}
+_LOCK = threading.Lock()
+
+
+def index_for(generator) -> Index | None:
+    """Index des Generators (beim ersten Aufruf aufgebaut), None = nicht aufgezählt."""
+    gen_id = generator if isinstance(generator, str) else seeding.generator_id(generator)
+    if gen_id not in RAEUME:
+        return None
+    index = _INDEX.get(gen_id)
+    if index is None:
+        with _LOCK:
+            index = _INDEX.get(gen_id)
+            if index is None:
+                index = _INDEX[gen_id] = Index(seeding.resolve(gen_id), seeding.resolve(RAEUME[gen_id]))
+    return index
+
+
+def prepare(module_name: str):
+    """Indizes eines Kapitels im Hintergrund aufbauen (beim Laden des Kapitels)."""
+    for gen_id in RAEUME:
+        if gen_id.rpartition(".")[0] == module_name and gen_id not in _INDEX:
+            threading.Thread(target=_prepare, args=(gen_id,), name="aufgabenraum", daemon=True).start()
+
+
+def _prepare(gen_id):
+    index_for(gen_id)
+    _fill_seen(gen_id)
+
+
+def batch(gen_id: str):
+    """batch-Funktion für arbeitsblatt.Task."""
+    return partial(_batch, gen_id)
+
+
+def _batch(gen_id, rng, count):
+    return index_for(gen_id).batch(rng, count)
+
+
+# ==========================================================
+#   ABDECKUNG JE SCHÜLER*IN
+# ==========================================================
+# Je (Schüler*in, Generator) der Zeitpunkt, zu dem jede Aufgabe im Raum
+# zuletzt gezeigt wurde (0 = noch nie). Einmal pro Prozess aus der
+# Zähler-Tabelle fortschritt.seen gelesen (verschiedene Seeds, nicht der
+# Verlauf), danach über fortschritt-Ereignisse aktuell gehalten (wie
+# wiederholung). Die Position schreibt problem_pool.renew mit dem Ereignis;
+# ältere Ereignisse ohne Position trägt _fill_seen einmal nach, sobald der
+# Index steht. Neue Aufgaben kommen aus den noch nie gezeigten Positionen,
+# erst danach die am längsten nicht gezeigte.
+
+MAX_TRIES = 20   # ungesehene Kandidaten, bevor auch in der Klasse gesehene in Frage kommen
+
+_SEEN = {}   # (student, gen_id) -> np.ndarray[float] (Zeit der letzten Anzeige)
+_FILLED = set()   # gen_ids, für die fortschritt.seen vollständig ist
+
+
+def _fill_seen(gen_id: str):
+    # Positionen außerhalb jeder Transaktion von fortschritt berechnen
+    if gen_id in _FILLED:
+        return
+    if not fortschritt.seen_complete(gen_id):
+        index = index_for(gen_id)
+        rows = []
+        for r in fortschritt.shown_seeds(gen_id):
+            k = index.position_of(r["seed"])
+            if k is not None:
+                rows.append((r["student"], k, r["last"]))
+        fortschritt.fill_seen(gen_id, rows)
+    _FILLED.add(gen_id)
+
+
+def _seen(student: str, gen_id: str) -> np.ndarray:
+    seen = _SEEN.get((student, gen_id))
+    if seen is None:
+        index = index_for(gen_id)
+        seen = np.zeros(len(index))
+        fortschritt.flush()
+        _fill_seen(gen_id)
+        for r in fortschritt.seen_positions(gen_id, student):
+            if r["position"] < len(seen):
+                seen[r["position"]] = r["last"]
+        with _LOCK:
+            seen = _SEEN.setdefault((student, gen_id), seen)
+    return seen
+
+
+def _on_event(student, key, kind, ref, correct):
+    if kind != fortschritt.NEU or ref.gen_id not in RAEUME:
+        return
+    seen = _SEEN.get((student, ref.gen_id))
+    if seen is not None:
+        k = index_for(ref.gen_id).position_of(ref.seed)
+        if k is not None:
+            seen[k] = time.time()
+
+
+fortschritt.subscribe(_on_event)
+
+
+def draw_unseen(index: Index, rng=random) -> tuple[int, dict]:
+    """(seed, aufgabe) aus den Positionen, die die Schüler*in noch nie gesehen
+    hat (möglichst auch nicht die Klasse, siehe gesehen); sind alle gesehen,
+    die am längsten nicht gezeigte."""
+    seen = _seen(fortschritt.student(), index.gen_id)
+    free = np.flatnonzero(seen == 0)
+    if free.size:
+        candidates = rng.sample(free.tolist(), min(MAX_TRIES, free.size))
+        k = next((k for k in candidates if gesehen.status(int(index.fp_at[k])) == 0), candidates[0])
+    else:
+        k = int(np.argmin(seen))
+    return int(index.seeds[k]), index.problems[k]
+
+
+def coverage(student: str, generator) -> tuple[int, int]:
+    """(gesehene verschiedene Aufgaben, Größe des Raums)."""
+    gen_id = generator if isinstance(generator, str) else seeding.generator_id(generator)
+    seen = _seen(student, gen_id)
+    return int(np.count_nonzero(seen)), len(seen)
+
+
+def coverage_by_student(gen_ids, conn=None) -> tuple[dict, int]:
+    """({student: gesehene verschiedene Aufgaben}, Größe aller Räume zusammen);
+    eine Abfrage auf die Zähler-Tabelle fortschritt.seen für alle Schüler*innen."""
+    gen_ids = list(gen_ids)
+    if not gen_ids:
+        return {}, 0
+    total = sum(len(index_for(g)) for g in gen_ids)
+    for g in gen_ids:
+        _fill_seen(g)
+    return {r["student"]: r["n"] for r in fortschritt.seen_counts(gen_ids, conn=conn)}, total
+
+
+def caption(generator):
+    """Kurze Angabe unter einer Aufgabe: wie viel des Raums schon gesehen ist."""
+    done, total = coverage(fortschritt.student(), generator)
+    st.caption(f"Du hast {done} von {total} verschiedenen Aufgaben dieser Art gesehen ({done / total:.0%}).")
@@ -0,0 +1,36 @@
+# benchmarks/bench_arbeitsblatt.py
+#
+# Durchsatz der Stapel-API (arbeitsblatt.generate) in Aufgaben pro Sekunde,
+# jeweils inkl. Lösung. Wo es einen vektorisierten Pfad gibt, wird er mit
+# dem skalaren verglichen.
+#
+#   python -m benchmarks.bench_arbeitsblatt [anzahl]
+import sys
+import time
+
+import arbeitsblatt
+
+
+def _rate(name, n, vectorized, repeat=3):
+    best = float("inf")
+    for r in range(repeat):
+        t0 = time.perf_counter()
+        arbeitsblatt.generate(name, n, seed=r, vectorized=vectorized)
+        best = min(best, time.perf_counter() - t0)
+    return n / best
+
+
+def main(n: int = 500):
+    print(f"{n} Aufgaben je Aufruf (bestes von 3)")
+    print(f"{'Aufgabe':<22}{'skalar [1/s]':>14}{'vektor. [1/s]':>15}{'Faktor':>8}")
+    for name, task in arbeitsblatt.TASKS.items():
+        scalar = _rate(name, n, vectorized=False)
+        if task.batch is None:
+            print(f"{name:<22}{scalar:>14,.0f}{'-':>15}{'-':>8}")
+        else:
+            vec = _rate(name, n, vectorized=True)
+            print(f"{name:<22}{scalar:>14,.0f}{vec:>15,.0f}{vec / scalar:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,47 @@
+# benchmarks/bench_aufgabenraum.py
+#
+# Vollständig aufgezählte Aufgabenräume (aufgabenraum.Index): Aufbau beim
+# ersten Gebrauch, danach eine neue Aufgabe als Indexziehung im Vergleich
+# zum Erzeugen über den Generator, und n Aufgaben samt Lösung für ein
+# Arbeitsblatt.
+#
+#   python -m benchmarks.bench_aufgabenraum [anzahl]
+import random
+import sys
+import time
+
+import aufgabenraum
+import seeding
+
+
+def _per_call(fn, repeat=20_000):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(count: int = 1000):
+    rng = random.Random(1)
+    print(f"{'Generator':<38}{'Größe':>7}{'Aufbau ms':>11}{'Generator µs':>14}"
+          f"{'Index µs':>10}{f'{count} Stück ms':>14}")
+    for gen_id, solve_id in aufgabenraum.RAEUME.items():
+        generator, solve = seeding.resolve(gen_id), seeding.resolve(solve_id)
+
+        start = time.perf_counter()
+        index = aufgabenraum.index_for(gen_id)
+        t_build = time.perf_counter() - start
+
+        t_gen = _per_call(lambda: solve(generator(random.Random(rng.getrandbits(32)))))
+        t_draw = _per_call(lambda: index.draw(rng))
+
+        start = time.perf_counter()
+        index.batch(rng, count)
+        t_batch = time.perf_counter() - start
+
+        print(f"{gen_id:<38}{len(index):>7}{t_build * 1e3:>11.0f}{t_gen * 1e6:>14.1f}"
+              f"{t_draw * 1e6:>10.2f}{t_batch * 1e3:>14.2f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
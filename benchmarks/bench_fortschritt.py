@@ -0,0 +1,79 @@
+# benchmarks/bench_fortschritt.py
+#
+# Fortschritts-Speicher: Kosten pro Ereignis für den Klick (nur
+# Warteschlange) gegenüber einem direkten INSERT mit Commit, die Dauer
+# einer Klassen-Abfrage über den Index (student, chapter, time) und die
+# Abfragen der Lehrkräfte-Übersicht über die Zähler-Tabellen.
+# Schreibt in eine temporäre Datenbank.
+#
+#   python -m benchmarks.bench_fortschritt [ereignisse]
+import os
+import random
+import sys
+import tempfile
+import time
+
+
+def main(n: int = 200_000, n_students: int = 500):
+    tmp = tempfile.mkdtemp()
+    os.environ["PRACTICE_DB"] = os.path.join(tmp, "fortschritt.db")
+    import fortschritt  # liest PRACTICE_DB beim Import
+
+    rng = random.Random(1)
+    students = [f"S{k:03d}" for k in range(n_students)]
+    chapters = ["zinseszins", "lineare_gleichungssysteme", "matrizen", "exponentialgleichungen"]
+    keys = [f"tab{k}" for k in range(8)]
+    t0 = time.time() - 86400 * 120
+    dt = 86400 * 120 / n   # ein Semester
+    rows = [
+        (rng.choice(students), rng.choice(chapters), rng.choice(keys), rng.choice(["neu", "loesung", "antwort"]),
+         "modul._gen", rng.getrandbits(32), rng.choice([None, 0, 1]), t0 + k * dt)
+        for k in range(n)
+    ]
+
+    # direkt: ein INSERT + Commit pro Klick
+    conn = fortschritt.connect()
+    m = 2000
+    start = time.perf_counter()
+    for row in rows[:m]:
+        with conn:
+            conn.execute(fortschritt._INSERT, row)
+    direct = (time.perf_counter() - start) / m
+    conn.execute("DELETE FROM events")
+    conn.commit()
+
+    # gesammelt: der Klick legt nur in die Warteschlange
+    start = time.perf_counter()
+    for row in rows:
+        fortschritt._writer.put(row)
+    queued = (time.perf_counter() - start) / n
+    start = time.perf_counter()
+    fortschritt.flush()
+    flush = time.perf_counter() - start
+    count = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    print(f"{count:,} Ereignisse, {len(students)} Schüler*innen")
+    print(f"direkt (INSERT + Commit)   {direct * 1e6:>9.1f} µs / Klick")
+    print(f"Warteschlange              {queued * 1e6:>9.2f} µs / Klick")
+    print(f"flush (eine Transaktion)   {flush * 1e3:>9.1f} ms gesamt")
+
+    since = time.time() - 7 * 86400
+    start = time.perf_counter()
+    hits = sum(len(fortschritt.events(s, "zinseszins", since, conn=conn)) for s in students[:30])
+    print(f"30 Personen, Kapitel, 7 T.  {(time.perf_counter() - start) * 1e3:>9.1f} ms ({hits} Zeilen)")
+
+    print("Übersicht (Zähler):")
+    for label, query in [
+        ("Tabs gesamt", lambda: fortschritt.tab_stats(conn=conn)),
+        ("Tabs 7 Tage", lambda: fortschritt.tab_stats(7, conn=conn)),
+        ("Verlauf 30 Tage", lambda: fortschritt.daily_stats(30, conn=conn)),
+        ("Schüler*innen 1 Kapitel", lambda: fortschritt.student_stats("zinseszins", conn=conn)),
+    ]:
+        start = time.perf_counter()
+        query()
+        print(f"  {label:<25}{(time.perf_counter() - start) * 1e3:>9.2f} ms")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,80 @@
+# benchmarks/bench_gesehen.py
+#
+# Wiederholte Aufgaben bei n-mal „Neues Beispiel“ mit und ohne Abgleich
+# gegen schon gesehene Aufgaben (gesehen.SeenSet, wie problem_pool.renew),
+# dazu die Kosten für Fingerabdruck und Nachsehen je Aufgabe. Hat ein
+# Generator weniger verschiedene Aufgaben als n, sind Wiederholungen
+# unvermeidbar (Spalte „verschieden“, geschätzt aus 5000 Ziehungen); dann
+# zählt, wie lange die wiederholte Aufgabe zurückliegt.
+#
+#   python -m benchmarks.bench_gesehen [n]
+import random
+import sys
+import time
+
+import exponentialfunktionen
+import gesehen
+import seeding
+import trigonometrie
+import zinseszins
+
+GENERATORS = [trigonometrie.gen_problem, exponentialfunktionen._gen_graph, zinseszins._gen_kest]
+
+
+def _draws(gen, n, dedup, tries=20):
+    rng = random.Random(1)
+    gen_id = seeding.generator_id(gen)
+    seen = gesehen.SeenSet()
+    repeats, gaps, tick = 0, [], 1
+    for _ in range(n):
+        candidates = []
+        for _ in range(tries if dedup else 1):
+            fp = gesehen.fingerprint(gen_id, gen(random.Random(rng.getrandbits(64))))
+            candidates.append(fp)
+            if fp not in seen:
+                break
+        fp = min(candidates, key=seen.seen_at)
+        if fp in seen:
+            repeats += 1
+            gaps.append(tick - seen.seen_at(fp))
+        seen.add(fp)
+        tick += 1
+    return repeats, (sum(gaps) / len(gaps) if gaps else 0)
+
+
+def _distinct(gen, samples=5000):
+    gen_id = seeding.generator_id(gen)
+    return len({gesehen.fingerprint(gen_id, gen(random.Random(k))) for k in range(samples)})
+
+
+def main(n: int = 200):
+    print(f"{n} Aufgaben je Generator, Gedächtnis {gesehen.SESSION_CAPACITY}")
+    print("Wiederholungen (mittlerer Abstand zur letzten Begegnung, in Aufgaben)")
+    print(f"{'Generator':<34}{'verschieden':>12}{'ohne':>14}{'mit':>14}")
+    for gen in GENERATORS:
+        row = f"{seeding.generator_id(gen):<34}{_distinct(gen):>12}"
+        for dedup in (False, True):
+            repeats, gap = _draws(gen, n, dedup)
+            row += f"{repeats:>7} ({gap:4.1f})"
+        print(row)
+
+    gen = trigonometrie.gen_problem
+    gen_id = seeding.generator_id(gen)
+    problems = [gen(random.Random(k)) for k in range(10_000)]
+    start = time.perf_counter()
+    fps = [gesehen.fingerprint(gen_id, p) for p in problems]
+    t_fp = (time.perf_counter() - start) / len(problems)
+
+    bloom = gesehen.BloomFilter()
+    for fp in fps:
+        bloom.add(fp)
+    start = time.perf_counter()
+    for fp in fps:
+        fp in bloom
+    t_bloom = (time.perf_counter() - start) / len(fps)
+    print(f"\nFingerabdruck {t_fp * 1e6:.1f} µs, Bloom-Abfrage {t_bloom * 1e6:.1f} µs "
+          f"({len(bloom._bits) / 1024:.0f} KiB je Klasse)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,65 @@
+# benchmarks/bench_lgs_solver.py
+#
+# Exakter n×n-Löser: Bareiss (lineare_gleichungssysteme._solve_nxn) gegen
+# klassische Gauß-Elimination mit Fraction. Zufällige reguläre Systeme mit
+# ganzzahligen Koeffizienten -9..9; Zeit pro System und größter Nenner der
+# Zwischenwerte beim Fraction-Gauß.
+#
+#   python -m benchmarks.bench_lgs_solver [anzahl]
+import random
+import sys
+import time
+from fractions import Fraction
+
+import lineare_gleichungssysteme as lgs
+
+
+def fraction_gauss(A, rhs):
+    n = len(A)
+    M = [[Fraction(v) for v in row] + [Fraction(r)] for row, r in zip(A, rhs)]
+    max_den = 1
+    for c in range(n):
+        p = next(i for i in range(c, n) if M[i][c] != 0)
+        M[c], M[p] = M[p], M[c]
+        for i in range(c + 1, n):
+            f = M[i][c] / M[c][c]
+            M[i] = [x - f * y for x, y in zip(M[i], M[c])]
+            max_den = max(max_den, *(v.denominator for v in M[i]))
+    x = [Fraction(0)] * n
+    for i in range(n - 1, -1, -1):
+        x[i] = (M[i][n] - sum(M[i][j] * x[j] for j in range(i + 1, n))) / M[i][i]
+    return x, max_den
+
+
+def _systems(n, count, seed=0):
+    rng = random.Random(seed)
+    out = []
+    while len(out) < count:
+        A = [[rng.randint(-9, 9) for _ in range(n)] for __ in range(n)]
+        rhs = [rng.randint(-9, 9) for _ in range(n)]
+        if lgs._solve_nxn(A, rhs)["L"] == "one":
+            out.append((A, rhs))
+    return out
+
+
+def main(count: int = 300):
+    print(f"{count} Systeme je Größe")
+    print(f"{'n':>3}{'Bareiss [µs]':>14}{'Fraction [µs]':>15}{'Faktor':>8}{'max. Nenner':>14}")
+    for n in (2, 3, 5, 8, 12):
+        systems = _systems(n, count)
+
+        t0 = time.perf_counter()
+        ref = [lgs._solve_nxn(A, rhs)["x"] for A, rhs in systems]
+        t_bareiss = (time.perf_counter() - t0) / count * 1e6
+
+        t0 = time.perf_counter()
+        out = [fraction_gauss(A, rhs) for A, rhs in systems]
+        t_frac = (time.perf_counter() - t0) / count * 1e6
+
+        assert ref == [x for x, _ in out]
+        max_den = max(d for _, d in out)
+        print(f"{n:>3}{t_bareiss:>14.1f}{t_frac:>15.1f}{t_frac / t_bareiss:>8.1f}{max_den.bit_length():>10d} bit")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
@@ -0,0 +1,110 @@
+# benchmarks/bench_matrix_kernel.py
+#
+# matrix_kernel (int64-NumPy mit exaktem Rückfall) gegen die früheren
+# Listen-von-Listen-Funktionen aus matrizen (_add/_mul) bzw. eine
+# Fraction-Gauß-Elimination für Determinante und Inverse.
+# "Kern" rechnet mit Listen rein/Tupeln raus (wie matrizen._add/_mul),
+# "Arrays" mit bereits konvertierten Arrays (Matrizenketten).
+#
+#   python -m benchmarks.bench_matrix_kernel
+import random
+import time
+from fractions import Fraction
+
+import matrix_kernel as mk
+
+
+# ----------------- frühere Listen-Implementierung -----------------
+def legacy_add(A, B):
+    return [[A[i][j] + B[i][j] for j in range(len(A[0]))] for i in range(len(A))]
+
+
+def legacy_mul(A, B):
+    r, k = len(A), len(A[0])
+    k2, c = len(B), len(B[0])
+    assert k == k2
+    out = [[0 for _ in range(c)] for __ in range(r)]
+    for i in range(r):
+        for j in range(c):
+            out[i][j] = sum(A[i][t] * B[t][j] for t in range(k))
+    return out
+
+
+def legacy_power(A, k):
+    out = [[int(i == j) for j in range(len(A))] for i in range(len(A))]
+    for _ in range(k):
+        out = legacy_mul(out, A)
+    return out
+
+
+def legacy_det_inv(A):
+    # Gauß-Jordan mit Fraction auf [A | I]
+    n = len(A)
+    M = [[Fraction(v) for v in row] + [Fraction(int(i == j)) for j in range(n)] for i, row in enumerate(A)]
+    d = Fraction(1)
+    for c in range(n):
+        p = next(i for i in range(c, n) if M[i][c] != 0)
+        if p != c:
+            M[c], M[p] = M[p], M[c]
+            d = -d
+        d *= M[c][c]
+        piv = M[c][c]
+        M[c] = [v / piv for v in M[c]]
+        for i in range(n):
+            if i != c and M[i][c] != 0:
+                f = M[i][c]
+                M[i] = [x - f * y for x, y in zip(M[i], M[c])]
+    return d, [row[n:] for row in M]
+
+
+# ----------------- Messung -----------------
+def _time(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def _regular(rng, n):
+    while True:
+        A = [[rng.randint(-9, 9) for _ in range(n)] for __ in range(n)]
+        if mk.det(A) != 0:
+            return A
+
+
+def main():
+    rng = random.Random(1)
+    print(f"{'Operation':<22}{'Listen [ms]':>13}{'Kern [ms]':>12}{'Faktor':>8}{'Arrays [ms]':>13}{'Faktor':>8}")
+
+    for n in (3, 10, 50, 150):
+        A = [[rng.randint(-9, 9) for _ in range(n)] for __ in range(n)]
+        B = [[rng.randint(-9, 9) for _ in range(n)] for __ in range(n)]
+        a, b = mk.as_array(A), mk.as_array(B)
+        repeat = 200 if n <= 10 else 5
+        for label, old, new, arr in [
+            (f"add {n}×{n}", lambda: legacy_add(A, B), lambda: mk.to_tuples(mk.add(A, B)), lambda: mk.add(a, b)),
+            (f"mul {n}×{n}", lambda: legacy_mul(A, B), lambda: mk.to_tuples(mk.mul(A, B)), lambda: mk.mul(a, b)),
+        ]:
+            t_old, t_new, t_arr = _time(old, repeat), _time(new, repeat), _time(arr, repeat)
+            print(f"{label:<22}{t_old:>13.3f}{t_new:>12.3f}{t_old / t_new:>8.1f}{t_arr:>13.3f}{t_old / t_arr:>8.1f}")
+
+    for n, k in ((3, 20), (10, 20), (3, 200)):
+        A = [[rng.randint(-3, 3) for _ in range(n)] for __ in range(n)]
+        assert mk.to_tuples(mk.power(A, k)) == tuple(map(tuple, legacy_power(A, k)))
+        t_old = _time(lambda: legacy_power(A, k), 5)
+        t_new = _time(lambda: mk.to_tuples(mk.power(A, k)), 5)
+        print(f"{f'pow {n}×{n} ^{k}':<22}{t_old:>13.3f}{t_new:>12.3f}{t_old / t_new:>8.1f}")
+
+    for n in (3, 8, 20):
+        A = _regular(rng, n)
+        d_old, inv_old = legacy_det_inv(A)
+        assert mk.det(A) == d_old and mk.to_tuples(mk.inverse(A)) == tuple(map(tuple, inv_old))
+        t_old = _time(lambda: legacy_det_inv(A), 5)
+        t_new = _time(lambda: (mk.det(A), mk.inverse(A)), 5)
+        print(f"{f'det+inv {n}×{n}':<22}{t_old:>13.3f}{t_new:>12.3f}{t_old / t_new:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
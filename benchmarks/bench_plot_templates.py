@@ -0,0 +1,52 @@
+# benchmarks/bench_plot_templates.py
+#
+# Renderzeit der Funktionsgraphen ohne Bild-Cache: komplett neu gerendert
+# (plotting.BLITTING = False) gegen Achsen-Vorlage mit gecachtem Hintergrund.
+# Der erste Aufruf je Vorlage baut den Hintergrund und zählt nicht mit.
+#
+#   python -m benchmarks.bench_plot_templates [wiederholungen]
+import random
+import sys
+import time
+
+import funktionen_allgemein as fa
+import lineare_funktionen as lf
+import plotting
+import render_cache
+
+
+def _cases():
+    rng = random.Random(0)
+    for s in range(3):
+        k, d = rng.choice([-2, -0.5, 0.5, 1.5, 3]), rng.randint(-6, 6)
+        yield "lin_line", (k, d, True), (lambda ax, k=k, d=d: lf.plot_line_with_triangle(ax, k, d, True)), \
+            lf.AXES, (7, 7)
+        prob = fa.new_cubic(random.Random(s))
+        yield "poly", (tuple(prob["poly"].coeffs), True), \
+            (lambda ax, prob=prob: fa.plot_poly_with_markers(ax, prob, True)), fa.POLY_AXES, (7.8, 5.4)
+
+
+def _time(blitting: bool, repeat: int) -> dict:
+    plotting.BLITTING = blitting
+    times = {}
+    for name, params, draw, template, figsize in _cases():
+        plotting.cached_image(name, params, draw, template=template, figsize=figsize)  # Hintergrund bauen
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            render_cache.CACHE.clear()
+            plotting.cached_image(name, params, draw, template=template, figsize=figsize)
+        times.setdefault(name, []).append((time.perf_counter() - t0) / repeat)
+    return {name: sum(t) / len(t) for name, t in times.items()}
+
+
+def main(repeat: int = 5):
+    full = _time(False, repeat)
+    blit = _time(True, repeat)
+    plotting.BLITTING = True
+    print(f"{'Graph':<12}{'neu [ms]':>10}{'Vorlage [ms]':>14}{'Faktor':>8}")
+    for name in full:
+        print(f"{name:<12}{full[name] * 1e3:>10.0f}{blit[name] * 1e3:>14.0f}{full[name] / blit[name]:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
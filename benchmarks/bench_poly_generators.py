@@ -0,0 +1,97 @@
+# benchmarks/bench_poly_generators.py
+#
+# Vergleicht das frühere Rejection Sampling in funktionen_allgemein mit den
+# konstruktiven Generatoren: Versuche pro akzeptierter Aufgabe und Latenz.
+#
+#   python -m benchmarks.bench_poly_generators [anzahl]
+import sys
+import time
+
+import numpy as np
+
+import funktionen_allgemein as fa
+
+
+# ----------------- frühere Generatoren (mit Versuchszähler) -----------------
+def legacy_build_cubic_coeff(rng: np.random.Generator):
+    tries = 0
+    while True:
+        tries += 1
+        a = (-1 if rng.random() < 0.5 else 1) * rng.uniform(0.15, 0.30)
+        b = rng.uniform(1.0, 2.0) if rng.random() < 0.5 else rng.uniform(-2.0, -1.0)
+        c = float(rng.uniform(0.1, 3.0))
+        d = float(rng.uniform(-2.0, 2.0))
+        poly = np.poly1d([a, b, c, d])
+
+        der = poly.deriv()
+        crit = [z.real for z in der.r if abs(z.imag) < 1e-10]
+        if len(crit) != 2:
+            continue
+        crit.sort()
+        if not all(-8.0 <= x0 <= 8.0 for x0 in crit):
+            continue
+
+        y_abs = [abs(float(poly(x0))) for x0 in crit]
+        poly = poly * (rng.uniform(5.0, 7.5) / max(np.mean(y_abs), 1e-9))
+        roots = [r.real for r in poly.r if abs(r.imag) < 1e-10]
+
+        ok = True
+        for x0 in crit:
+            y0 = float(poly(x0))
+            if not (4.0 <= abs(y0) <= 9.0):
+                ok = False
+                break
+            if roots and min(abs(x0 - r) for r in roots) < 1.0:
+                ok = False
+                break
+        if ok:
+            return poly, tries
+
+
+def legacy_build_quadratic_roots(rng: np.random.Generator):
+    candidates = [x for x in np.arange(-6.0, 6.5, 0.5) if abs(x) > 1e-9]
+    tries = 0
+    while True:
+        tries += 1
+        r1, r2 = rng.choice(candidates, size=2, replace=False)
+        if abs(r2 - r1) < 0.75:
+            continue
+        s = float(rng.choice([1, -1, 2, -2]))
+        poly = np.poly1d([s, -s * (r1 + r2), s * r1 * r2])
+        xv = s * (r1 + r2) / (2 * s)
+        if not (-8 <= xv <= 8):
+            continue
+        if not (3.0 <= abs(float(poly(xv))) <= 8.0):
+            continue
+        return poly, tries
+
+
+# ----------------- Messung -----------------
+def _measure(gen, n, counts_tries):
+    rng = np.random.default_rng(12345)
+    times, tries = [], []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        out = gen(rng)
+        times.append(time.perf_counter() - t0)
+        tries.append(out[1] if counts_tries else 1)
+    ms = np.array(times) * 1000
+    return np.mean(tries), np.max(tries), np.median(ms), np.percentile(ms, 99)
+
+
+def main(n: int = 2000):
+    rows = [
+        ("kubisch  alt", legacy_build_cubic_coeff, True),
+        ("kubisch  neu", fa.build_cubic_coeff, False),
+        ("quadrat. alt", legacy_build_quadratic_roots, True),
+        ("quadrat. neu", fa.build_quadratic_roots, False),
+    ]
+    print(f"{n} Aufgaben je Generator")
+    print(f"{'Generator':<14}{'Versuche Ø':>12}{'max':>6}{'p50 [ms]':>11}{'p99 [ms]':>11}")
+    for name, gen, counts in rows:
+        mean_t, max_t, p50, p99 = _measure(gen, n, counts)
+        print(f"{name:<14}{mean_t:>12.2f}{max_t:>6d}{p50:>11.3f}{p99:>11.3f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,54 @@
+# benchmarks/bench_sampling.py
+#
+# Adaptive Abtastung (plotting.sample_curve) gegen die früheren festen
+# linspace-Gitter: Anzahl Stützstellen, Zeit und größte sichtbare
+# Abweichung (Anteil der Fensterhöhe, gemessen an 20001 Stellen).
+#
+#   python -m benchmarks.bench_sampling [anzahl_polynome]
+import random
+import sys
+import time
+
+import numpy as np
+
+import beschraenkte_zu_abnahme as bza
+import funktionen_allgemein as fa
+import plotting
+
+
+def _error(f, x, y, xlim, ylim):
+    xx = np.linspace(*xlim, 20001)
+    yt, yi = f(xx), np.interp(xx, x, y)
+    if ylim is None:
+        return float(np.max(np.abs(yt - yi)) / np.ptp(yt))
+    return float(np.max(np.abs(np.clip(yt, *ylim) - np.clip(yi, *ylim))) / (ylim[1] - ylim[0]))
+
+
+def _cases(n):
+    yield "Gerade", lambda x: 1.5 * x + 2, (-10, 10), (-10, 10), 801
+    for s in range(n):
+        prob = (fa.new_cubic if s % 2 else fa.new_quadratic)(random.Random(s))
+        yield "Polynom", prob["poly"], (-10, 10), (-10, 10), 1600
+    for s in range(n):
+        d = bza.generate(random.Random(s))
+        yield "Zu-/Abnahme", (lambda t, d=d: bza.N(d, t)), (0, 20), None, 200
+
+
+def main(n: int = 200):
+    rows = {}
+    for name, f, xlim, ylim, fixed in _cases(n):
+        t0 = time.perf_counter()
+        x, y = plotting.sample_curve(f, xlim, ylim)
+        dt = time.perf_counter() - t0
+        r = rows.setdefault(name, {"fixed": fixed, "points": [], "ms": [], "err": []})
+        r["points"].append(len(x))
+        r["ms"].append(dt * 1e3)
+        r["err"].append(_error(f, x, y, xlim, ylim))
+    print(f"{'Kurve':<14}{'vorher':>8}{'adaptiv Ø':>11}{'max':>6}{'Zeit [ms]':>11}{'max. Fehler':>13}")
+    for name, r in rows.items():
+        print(f"{name:<14}{r['fixed']:>8}{np.mean(r['points']):>11.0f}{max(r['points']):>6}"
+              f"{np.mean(r['ms']):>11.2f}{max(r['err']):>13.1e}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
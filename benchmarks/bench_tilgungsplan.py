@@ -0,0 +1,48 @@
+# benchmarks/bench_tilgungsplan.py
+#
+# Vektorisierter Tilgungs-/Sparplan (rentenrechnung) gegen eine Schleife
+# Periode für Periode, 30 Jahre monatlich (360 Perioden).
+#
+#   python -m benchmarks.bench_tilgungsplan
+import time
+
+import cashflow
+import rentenrechnung as rr
+
+
+def loop_tilgungsplan(K, i, n, m=1):
+    q = cashflow.period_factor(i, m)
+    A = K * q ** n * (q - 1) / (q ** n - 1)
+    rows, B = [], K
+    for k in range(1, n + 1):
+        z = B * (q - 1)
+        t = A - z
+        B -= t
+        rows.append((k, z, t, A, B))
+    return rows
+
+
+def _best_ms(fn, repeat=200):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main():
+    K, i, n, m = 250000, 3.5, 360, 12
+    rows = [
+        ("Schleife", lambda: loop_tilgungsplan(K, i, n, m)),
+        ("Annuität (NumPy)", lambda: rr.tilgungsplan(K, i, n, m, "annuitaet")),
+        ("Raten (NumPy)", lambda: rr.tilgungsplan(K, i, n, m, "raten")),
+        ("Sparplan (NumPy)", lambda: rr.sparplan(300, i, n, m)),
+    ]
+    print(f"{n} Perioden, bestes von 200")
+    for name, fn in rows:
+        print(f"{name:<20}{_best_ms(fn):>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
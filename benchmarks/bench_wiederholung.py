@@ -0,0 +1,39 @@
+# benchmarks/bench_wiederholung.py
+#
+# Adaptive Aufgabenwahl (wiederholung.Plan): Zeit für eine Auswahl samt
+# Bewertung, nachdem der Plan schon n Aufgaben lang gelaufen ist. Die
+# Kosten sollen nicht mit dem Verlauf wachsen.
+#
+#   python -m benchmarks.bench_wiederholung [familien]
+import random
+import sys
+import time
+
+import wiederholung
+
+
+def main(families: int = 6):
+    rng = random.Random(1)
+    names = [f"F{k}" for k in range(families)]
+    skill = {f: 0.95 - 0.7 * k / max(1, families - 1) for k, f in enumerate(names)}
+    plan = wiederholung.Plan(names)
+
+    print(f"{families} Familien")
+    print(f"{'Verlauf':>10}{'µs / Auswahl':>15}{'Heap':>7}")
+    done = 0
+    for n in (100, 1_000, 10_000, 100_000, 1_000_000):
+        m = min(10_000, n - done)   # gemessen werden die letzten m Auswahlen
+        for _ in range(n - done - m):
+            f = plan.next()
+            plan.grade(rng.random() < skill[f])
+        start = time.perf_counter()
+        for _ in range(m):
+            f = plan.next()
+            plan.grade(rng.random() < skill[f])
+        per = (time.perf_counter() - start) / m
+        done = n
+        print(f"{n:>10,}{per * 1e6:>15.2f}{len(plan._heap):>7}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
@@ -1,20 +1,15 @@
 import streamlit as st
-import random
 import math
 import numpy as np
-import matplotlib.pyplot as plt
+
+import fortschritt
+import plotting
+import problem_pool
 
 def run():
     st.title("Beschränkte Zu-/Abnahme")
 
-    # Fix für alte session_state Daten
-    if "bza_data" in st.session_state and "context" not in st.session_state.bza_data:
-        del st.session_state["bza_data"]
-
-    if "bza_data" not in st.session_state:
-        st.session_state.bza_data = generate()
-
-    d = st.session_state.bza_data
+    d = problem_pool.current("bza_data", generate)
 
     st.markdown("### Aufgabe")
     st.write(d["context"])
@@ -27,20 +22,31 @@ def run():
     st.write("3. Bestimme die Schranke der Funktion.")
 
     if st.button("Lösung anzeigen"):
+        fortschritt.loesung("bza_data")
         solve(d)
 
     if st.button("Neues Beispiel"):
-        st.session_state.bza_data = generate()
+        problem_pool.renew("bza_data", generate)
         st.rerun()
 
 
-def generate():
-    S = random.choice([5000, 8000, 10000, 12000, 15000])
-    a = round(random.uniform(0.70, 0.95), 2)
+S_CHOICES = [5000, 8000, 10000, 12000, 15000]
+T1_CHOICES = [2, 3, 4, 5, 6]
+TARGET_SHARES = [0.5, 0.6, 0.7, 0.8, 0.9]
+
+
+def generate(rng):
+    S = rng.choice(S_CHOICES)
+    a = round(rng.uniform(0.70, 0.95), 2)
     lam = round(math.log(a), 3)
 
-    typ = random.choice([1, 2])
+    typ = rng.choice([1, 2])
+    t1 = rng.choice(T1_CHOICES)
+    target = int(S * rng.choice(TARGET_SHARES))
+    return _problem(S, a, lam, typ, t1, target)
+
 
+def _problem(S, a, lam, typ, t1, target):
     if typ == 1:
         func = rf"N(t) = {S}\cdot(1 - {a}^t)"
         plain = f"{S}*(1-{a}^t)"
@@ -50,9 +56,6 @@ def generate():
         plain = f"{S}*(1-e^({lam}t))"
         mode = "e"
 
-    t1 = random.choice([2, 3, 4, 5, 6])
-    target = int(S * random.choice([0.5, 0.6, 0.7, 0.8, 0.9]))
-
     context = (
         "Die Nutzerzahl einer neuen Lernplattform wächst mit der Zeit. "
         "Sie nähert sich langfristig einer maximalen Nutzerzahl an."
@@ -71,11 +74,49 @@ def generate():
     }
 
 
+# ----------------- Modell -----------------
+# N(t) = S·(1 − e^(k·t)) mit k = ln a (Form a^t) bzw. k = λ (Form e^(λt)).
+# t und alle Einträge von d ("mode" eingeschlossen) dürfen NumPy-Arrays
+# sein -> ganze Kurven, Parameterreihen oder viele Aufgaben auf einmal.
+
+def _k(d):
+    return np.where(np.asarray(d["mode"]) == "a", np.log(d["a"]), d["lam"])
+
+
 def N(d, t):
-    if d["mode"] == "a":
-        return d["S"] * (1 - d["a"]**t)
-    else:
-        return d["S"] * (1 - math.e**(d["lam"] * t))
+    """Funktionswert N(t) (1 − e^x als −expm1(x), genau auch für kleine t)."""
+    return -d["S"] * np.expm1(_k(d) * np.asarray(t, dtype=float))
+
+
+def T(d, n):
+    """Umkehrfunktion: Zeitpunkt t mit N(t) = n; inf für n = S, nan für n > S."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.log1p(-np.asarray(n, dtype=float) / d["S"]) / _k(d)
+
+
+def _solve(d):
+    return {"value": float(N(d, d["t1"])), "t": float(T(d, d["target"])), "S": d["S"]}
+
+
+def _batch(rng, count):
+    # gleiche Verteilung wie generate, Lösungen in einem NumPy-Aufruf
+    g = np.random.default_rng(rng.getrandbits(64))
+    S = np.array(S_CHOICES)[g.integers(0, len(S_CHOICES), count)]
+    a = np.round(g.uniform(0.70, 0.95, count), 2)
+    lam = np.round(np.log(a), 3)
+    typ = g.integers(1, 3, count)
+    t1 = np.array(T1_CHOICES)[g.integers(0, len(T1_CHOICES), count)]
+    target = (S * np.array(TARGET_SHARES)[g.integers(0, len(TARGET_SHARES), count)]).astype(int)
+
+    d = {"S": S, "a": a, "lam": lam, "mode": np.where(typ == 1, "a", "e")}
+    values, ts = N(d, t1), T(d, target)
+
+    problems = [
+        _problem(*row)
+        for row in zip(S.tolist(), a.tolist(), lam.tolist(), typ.tolist(), t1.tolist(), target.tolist())
+    ]
+    solutions = [{"value": v, "t": t, "S": s} for v, t, s in zip(values.tolist(), ts.tolist(), S.tolist())]
+    return problems, solutions
 
 
 def solve(d):
@@ -83,12 +124,8 @@ def solve(d):
     t1 = d["t1"]
     target = d["target"]
 
-    value = N(d, t1)
-
-    if d["mode"] == "a":
-        t = math.log(1 - target / S) / math.log(d["a"])
-    else:
-        t = math.log(1 - target / S) / d["lam"]
+    sol = _solve(d)
+    value, t = sol["value"], sol["t"]
 
     st.markdown("### Lösung")
 
@@ -105,14 +142,12 @@ def solve(d):
     st.latex(rf"S = {S}")
 
     st.markdown("### Plot")
-    x = np.linspace(0, 20, 200)
-    y = [N(d, xi) for xi in x]
+    plotting.show("bza_plot", (d["mode"], S, d["a"], d["lam"]), lambda ax: _plot(ax, d),
+                  template=plotting.ZEITVERLAUF)
 
-    fig, ax = plt.subplots()
-    ax.plot(x, y)
-    ax.axhline(S, linestyle="--")
-    ax.set_xlabel("t")
-    ax.set_ylabel("N(t)")
-    ax.grid(True)
 
-    st.pyplot(fig)
\ No newline at end of file
+def _plot(ax, d):
+    x, y = plotting.sample_curve(lambda t: N(d, t), (0, 20))
+
+    ax.plot(x, y)
+    ax.axhline(d["S"], linestyle="--")
@@ -0,0 +1,208 @@
+# cashflow.py
+import functools
+import math
+import threading
+
+import numpy as np
+
+
+# ==========================================================
+#   ZAHLUNGSSTRÖME
+# ==========================================================
+# Ein Zahlungsstrom ist eine beliebige Folge von (t, betrag)-Paaren, auch
+# ein Generator. Alle Werte werden in einem Durchlauf berechnet, ohne
+# Zwischenlisten; summiert wird mit math.fsum (bei tausenden Zahlungen
+# bleibt das Ergebnis auf den Cent genau).
+#
+# Zeit t in Perioden, m Perioden pro Jahr (1 = jährlich, 2 = Semester,
+# 4 = Quartale, 12 = Monate). i ist der effektive Jahreszinssatz in %,
+# pro Periode wird mit dem konformen Faktor q_m = (1 + i/100)^(1/m)
+# gerechnet – wie in zinseszins._mode_unterjaehrig.
+
+def period_factor(i: float, m: int = 1) -> float:
+    """Aufzinsungsfaktor pro Periode zum effektiven Jahreszinssatz i (in %)."""
+    q = 1 + i / 100
+    return q if m == 1 else q ** (1 / m)
+
+
+def value_at(flows, i: float, t_ref: float | None = 0, m: int = 1) -> float:
+    """Wert aller Zahlungen zum Zeitpunkt t_ref (auf- bzw. abgezinst).
+
+    t_ref=None: Zeitpunkt der letzten Zahlung (Endwert).
+    """
+    q = period_factor(i, m)
+    t_last = -math.inf
+
+    def discounted():
+        nonlocal t_last
+        for t, amount in flows:
+            if t > t_last:
+                t_last = t
+            yield amount * q ** (-t)
+
+    pv = math.fsum(discounted())
+    if t_ref is None:
+        t_ref = t_last if t_last > -math.inf else 0
+    return pv * q ** t_ref if t_ref else pv
+
+
+def present_value(flows, i: float, m: int = 1) -> float:
+    """Barwert (Wert zum Zeitpunkt 0)."""
+    return value_at(flows, i, 0, m)
+
+
+def future_value(flows, i: float, t_end: float | None = None, m: int = 1) -> float:
+    """Endwert zum Zeitpunkt t_end (Standard: letzte Zahlung)."""
+    return value_at(flows, i, t_end, m)
+
+
+# ----------------- typische Ströme (als Generatoren) -----------------
+
+def single(t: float, amount: float):
+    yield t, amount
+
+
+def annuity(R: float, n: int, vorschuessig: bool = False, start: float = 0):
+    """n gleiche Raten R, nachschüssig ab start+1 bzw. vorschüssig ab start."""
+    t0 = start if vorschuessig else start + 1
+    for k in range(n):
+        yield t0 + k, R
+
+
+# ==========================================================
+#   UNBEKANNTER ZINSSATZ / UNBEKANNTE LAUFZEIT
+# ==========================================================
+# Gesichertes Newton-Verfahren (wie rtsafe): Newton-Schritt, solange er im
+# aktuellen Vorzeichenwechsel-Intervall bleibt und mindestens halb so groß
+# wie der vorletzte ist, sonst Bisektion. Das Intervall wird in jedem
+# Schritt kleiner, daher höchstens MAX_ITER Iterationen (in der Praxis
+# unter 10). Gestartet wird beim zuletzt gefundenen Wert (Warmstart, von
+# allen Sessions geteilt, daher mit Lock), gleiche Anfragen kommen aus
+# einem LRU-Cache.
+
+MAX_ITER = 100
+TOL = 1e-12
+RATE_RANGE = (-99.0, 1000.0)     # i in % p.a.
+TERM_RANGE = (0.0, 10000.0)      # n in Perioden
+
+EXP_LIMIT = 600.0                # |Exponent| für exp/q^n, bleibt samt Beträgen im float-Bereich
+
+_warm = {"rate": math.log(1.03), "term": 10.0}
+_warm_lock = threading.Lock()
+
+
+def _warm_get(name: str) -> float:
+    with _warm_lock:
+        return _warm[name]
+
+
+def _warm_set(name: str, value: float):
+    with _warm_lock:
+        _warm[name] = value
+
+
+def _bracketed_newton(f, lo, hi, x0, tol=TOL, max_iter=MAX_ITER):
+    """Nullstelle von f in [lo, hi], f(x) -> (wert, ableitung); None ohne Vorzeichenwechsel."""
+    f_lo, _ = f(lo)
+    f_hi, _ = f(hi)
+    if f_lo == 0:
+        return lo
+    if f_hi == 0:
+        return hi
+    if (f_lo > 0) == (f_hi > 0):
+        return None
+    if f_lo > 0:
+        lo, hi = hi, lo  # so, dass f(lo) < 0 < f(hi)
+
+    x = x0 if min(lo, hi) < x0 < max(lo, hi) else (lo + hi) / 2
+    dx_old = dx = abs(hi - lo)
+    for _ in range(max_iter):
+        fx, dfx = f(x)
+        if fx == 0:
+            return x
+        if fx < 0:
+            lo = x
+        else:
+            hi = x
+        eps = tol * max(1.0, abs(x))
+        x_new = x - fx / dfx if dfx else None
+        if x_new is not None and abs(x_new - x) <= eps:
+            return x_new
+        if x_new is None or not min(lo, hi) < x_new < max(lo, hi) or abs(2 * fx) > abs(dx_old * dfx):
+            x_new = (lo + hi) / 2  # Bisektion
+        dx_old, dx = dx, abs(x_new - x)
+        if dx <= eps:
+            return x_new
+        x = x_new
+    return x
+
+
+@functools.lru_cache(maxsize=1024)
+def _solve_rate(flows, target, t_ref, m):
+    t = np.array([f[0] for f in flows], dtype=float)
+    a = np.array([f[1] for f in flows], dtype=float)
+    dt = t_ref - t
+
+    def f(x):
+        # x = ln(q_m): Wert und Ableitung in einem Durchgang
+        e = np.exp(dt * x)
+        return float(a @ e) - target, float((a * dt) @ e)
+
+    lo, hi = (math.log1p(r / 100) / m for r in RATE_RANGE)
+    # bei langen Laufzeiten Intervall so begrenzen, dass exp(dt * x) nicht
+    # überläuft (nur auf der Seite mit positivem Exponenten, Unterlauf ist harmlos)
+    if dt.size and dt.max() > 0:
+        hi = min(hi, EXP_LIMIT / float(dt.max()))
+    if dt.size and dt.min() < 0:
+        lo = max(lo, EXP_LIMIT / float(dt.min()))
+    with np.errstate(over="ignore"):
+        x = _bracketed_newton(f, lo, hi, _warm_get("rate") / m)
+    if x is None:
+        return None
+    _warm_set("rate", x * m)
+    return math.expm1(x * m) * 100
+
+
+def solve_rate(flows, target: float = 0.0, t_ref: float = 0, m: int = 1):
+    """Effektiver Jahreszinssatz i (in %) mit value_at(flows, i, t_ref, m) == target.
+
+    Mit target=0 und Ein-/Auszahlungen mit Vorzeichen ist das der interne
+    Zinssatz. None, wenn es in RATE_RANGE keine Lösung gibt.
+    """
+    key = tuple((float(t), float(amount)) for t, amount in flows)
+    return _solve_rate(key, float(target), float(t_ref), m)
+
+
+@functools.lru_cache(maxsize=1024)
+def _solve_term(K0, target, i, R, m, vorschuessig):
+    q = period_factor(i, m)
+    ln_q = math.log(q)
+    r = R * (q if vorschuessig else 1) / (q - 1) if q != 1 else 0.0
+
+    def f(n):
+        if q == 1:
+            return K0 + R * n - target, R
+        qn = q ** n
+        return K0 * qn + r * (qn - 1) - target, (K0 + r) * qn * ln_q
+
+    lo, hi = TERM_RANGE
+    if ln_q > 0:
+        hi = min(hi, EXP_LIMIT / ln_q)  # q^n bleibt im float-Bereich
+    n = _bracketed_newton(f, lo, hi, _warm_get("term"))
+    if n is not None:
+        _warm_set("term", n)
+    return n
+
+
+def solve_term(K0: float, target: float, i: float, R: float = 0.0, m: int = 1,
+               vorschuessig: bool = False):
+    """Laufzeit n (in Perioden, nicht gerundet), nach der K0 samt Raten R den Wert target hat.
+
+    K0·q^n + R·(q^n − 1)/(q − 1) (·q vorschüssig) = target; für die Restlaufzeit
+    eines Kredits K0 = −Kredit, target = 0. None, wenn es keine Lösung gibt.
+    """
+    return _solve_term(float(K0), float(target), float(i), float(R), m, vorschuessig)
+
+
+def cache_info() -> dict:
+    return {"rate": _solve_rate.cache_info()._asdict(), "term": _solve_term.cache_info()._asdict()}
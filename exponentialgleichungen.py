@@ -1,63 +1,68 @@
 import streamlit as st
-import random
 import math
+import numpy as np
+
+import antworten
+import fortschritt
+import problem_pool
+import wiederholung
 
 
 # ============================
 #   EXAMPLE-GENERATOREN
 # ============================
 
-def _make_example_A():
-    a = random.randint(11, 100) / 10
-    b = random.randint(10, 200) / 10
-    c = random.randint(10, 300) / 10
+def _make_example_A(rng):
+    a = rng.randint(11, 100) / 10
+    b = rng.randint(10, 200) / 10
+    c = rng.randint(10, 300) / 10
     q = b + c
     w = math.log(q) / a
     return {"type": "A", "a": a, "b": b, "c": c, "q": q, "w": w}
 
 
-def _make_example_B():
-    a = random.randint(11, 100) / 10
-    b = random.randint(10, 200) / 10
-    c = random.randint(10, 300) / 10
+def _make_example_B(rng):
+    a = rng.randint(11, 100) / 10
+    b = rng.randint(10, 200) / 10
+    c = rng.randint(10, 300) / 10
     q = c
     w = math.log(q) / a
     return {"type": "B", "a": a, "b": b, "c": c, "q": q, "w": w}
 
 
-def _make_example_C():
-    a = random.randint(11, 100) / 10
-    b = random.randint(10, 200) / 10
-    c = random.randint(10, 300) / 10
+def _make_example_C(rng):
+    a = rng.randint(11, 100) / 10
+    b = rng.randint(10, 200) / 10
+    c = rng.randint(10, 300) / 10
     q = b + c
     w = math.log10(q) / a
     return {"type": "C", "a": a, "b": b, "c": c, "q": q, "w": w}
 
 
-def _make_example_D():
-    a = random.randint(11, 100) / 10
-    b = random.randint(10, 200) / 10
-    c = random.randint(10, 300) / 10
+def _make_example_D(rng):
+    a = rng.randint(11, 100) / 10
+    b = rng.randint(10, 200) / 10
+    c = rng.randint(10, 300) / 10
     q = c
     w = math.log10(q) / a
     return {"type": "D", "a": a, "b": b, "c": c, "q": q, "w": w}
 
 
-def _make_example_E():
-    n = random.randint(2, 10)
-    a = random.randint(11, 100) / 10
-    b = random.randint(10, 200) / 10
-    c = random.randint(10, 300) / 10
+def _make_example_E(rng):
+    n = rng.randint(2, 10)
+    a = rng.randint(11, 100) / 10
+    b = rng.randint(10, 200) / 10
+    c = rng.randint(10, 300) / 10
     q = b + c
     w = math.log(q) / math.log(n) - a
     return {"type": "E", "n": n, "a": a, "b": b, "c": c, "q": q, "w": w}
 
 
-def _make_example_F():
-    n = random.randint(2, 10)
-    a = random.randint(1, 5)
-    b = random.randint(10, 200) / 10
-    c = random.randint(10, 300) / 10
+def _make_example_F(rng):
+    n = rng.randint(2, 10)
+    a = rng.randint(1, 5)
+    b = rng.randint(10, 200) / 10
+    c = rng.randint(10, 300) / 10
     q = b + c
     w = (q / n) ** (1 / a)
     return {"type": "F", "n": n, "a": a, "b": b, "c": c, "q": q, "w": w}
@@ -67,31 +72,89 @@ def _make_example_F():
 #   ZUFALLS-LOGIK
 # ============================
 
-def _random_mixed():
-    r = random.randint(1, 115)
+def _random_mixed(rng):
+    r = rng.randint(1, 115)
     if r <= 30:
-        return _make_example_A()
+        return _make_example_A(rng)
     if r <= 60:
-        return _make_example_B()
+        return _make_example_B(rng)
     if r <= 75:
-        return _make_example_C()
+        return _make_example_C(rng)
     if r <= 90:
-        return _make_example_D()
+        return _make_example_D(rng)
     if r <= 100:
-        return _make_example_E()
-    return _make_example_F()
+        return _make_example_E(rng)
+    return _make_example_F(rng)
+
+
+def _random_AB(rng):
+    return _make_example_A(rng) if rng.random() < 0.5 else _make_example_B(rng)
+
+
+def _random_CD(rng):
+    return _make_example_C(rng) if rng.random() < 0.5 else _make_example_D(rng)
+
+
+def _random_F(rng):
+    return _make_example_F(rng)
+
+
+def _solve_example(ex):
+    # die Lösung steckt schon im Beispiel (w)
+    return {"x": ex["w"]}
+
+
+# ============================
+#   STAPEL (vektorisiert)
+# ============================
+# Gleiche Verteilung wie _random_mixed/_AB/_CD/_F, aber alle Parameter
+# eines Stapels in einem NumPy-Aufruf. Für Arbeitsblätter (arbeitsblatt.py);
+# Rückgabe (aufgaben, lösungen).
+
+MIXED_WEIGHTS = {"A": 30, "B": 30, "C": 15, "D": 15, "E": 10, "F": 15}
+
+
+def _batch_examples(rng, count, weights):
+    g = np.random.default_rng(rng.getrandbits(64))
+    types = list(weights)
+    p = np.array([weights[t] for t in types], dtype=float)
+    t = np.array(types)[g.choice(len(types), size=count, p=p / p.sum())]
+
+    n = g.integers(2, 11, count)
+    a = np.where(t == "F", g.integers(1, 6, count), g.integers(11, 101, count) / 10)
+    b = g.integers(10, 201, count) / 10
+    c = g.integers(10, 301, count) / 10
+    q = np.where((t == "B") | (t == "D"), c, b + c)
+    w = np.select(
+        [(t == "A") | (t == "B"), (t == "C") | (t == "D"), t == "E"],
+        [np.log(q) / a, np.log10(q) / a, np.log(q) / np.log(n) - a],
+        (q / n) ** (1 / a),
+    )
+
+    problems = []
+    for ti, ni, ai, bi, ci, qi, wi in zip(t.tolist(), n.tolist(), a.tolist(),
+                                          b.tolist(), c.tolist(), q.tolist(), w.tolist()):
+        ex = {"type": ti, "a": int(ai) if ti == "F" else ai, "b": bi, "c": ci, "q": qi, "w": wi}
+        if ti in ("E", "F"):
+            ex["n"] = ni
+        problems.append(ex)
+    return problems, [{"x": wi} for wi in w.tolist()]
 
 
-def _random_AB():
-    return _make_example_A() if random.random() < 0.5 else _make_example_B()
+def _batch_mixed(rng, count):
+    return _batch_examples(rng, count, MIXED_WEIGHTS)
 
 
-def _random_CD():
-    return _make_example_C() if random.random() < 0.5 else _make_example_D()
+def _batch_AB(rng, count):
+    return _batch_examples(rng, count, {"A": 1, "B": 1})
 
 
-def _random_F():
-    return _make_example_F()
+def _batch_CD(rng, count):
+    return _batch_examples(rng, count, {"C": 1, "D": 1})
+
+
+def _batch_F(rng, count):
+    return _batch_examples(rng, count, {"F": 1})
 
 
 # ============================
@@ -131,11 +194,14 @@ def _render_example(ex, key_suffix: str):
         n = ex["n"]
         st.latex(rf"{n}\cdot x^{{{a}}} - {b} = {c}")
 
+    antworten.eingabe(f"exp_example_{key_suffix}", f"expgl.typ_{t}", ex, {"x": "x"})
+
     st.write("")
     st.markdown("**Lösung**")
 
     if not st.button("Lösung anzeigen", key=f"btn_solution_{key_suffix}"):
         return
+    fortschritt.loesung(f"exp_example_{key_suffix}")
 
     if t == "A":
         st.latex(
@@ -214,40 +280,37 @@ def _render_example(ex, key_suffix: str):
 #   MODI (Tabs)
 # ============================
 
+# Typen leicht -> schwer, für die adaptive Auswahl im Tab „Gemischt“
+TYPES_BY_DIFFICULTY = [_make_example_B, _make_example_D, _make_example_A, _make_example_C,
+                       _make_example_F, _make_example_E]
+
+
 def _mode_mixed():
     key = "exp_example_mixed"
     if st.button("Neues Beispiel", key="btn_new_mixed"):
-        st.session_state[key] = _random_mixed()
-    if key not in st.session_state:
-        st.session_state[key] = _random_mixed()
-    _render_example(st.session_state[key], key_suffix="mixed")
+        wiederholung.renew(key, TYPES_BY_DIFFICULTY)
+    _render_example(wiederholung.current(key, TYPES_BY_DIFFICULTY), key_suffix="mixed")
 
 
 def _mode_AB():
     key = "exp_example_AB"
     if st.button("Neues Beispiel", key="btn_new_AB"):
-        st.session_state[key] = _random_AB()
-    if key not in st.session_state:
-        st.session_state[key] = _random_AB()
-    _render_example(st.session_state[key], key_suffix="AB")
+        problem_pool.renew(key, _random_AB)
+    _render_example(problem_pool.current(key, _random_AB), key_suffix="AB")
 
 
 def _mode_CD():
     key = "exp_example_CD"
     if st.button("Neues Beispiel", key="btn_new_CD"):
-        st.session_state[key] = _random_CD()
-    if key not in st.session_state:
-        st.session_state[key] = _random_CD()
-    _render_example(st.session_state[key], key_suffix="CD")
+        problem_pool.renew(key, _random_CD)
+    _render_example(problem_pool.current(key, _random_CD), key_suffix="CD")
 
 
 def _mode_F():
     key = "exp_example_F"
     if st.button("Neues Beispiel", key="btn_new_F"):
-        st.session_state[key] = _random_F()
-    if key not in st.session_state:
-        st.session_state[key] = _random_F()
-    _render_example(st.session_state[key], key_suffix="F")
+        problem_pool.renew(key, _random_F)
+    _render_example(problem_pool.current(key, _random_F), key_suffix="F")
 
 
 # ============================
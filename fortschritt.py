@@ -0,0 +1,418 @@
+# fortschritt.py
+import atexit
+import logging
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import date
+
+import streamlit as st
+
+import seeding
+
+
+# ==========================================================
+#   FORTSCHRITT (server-seitig)
+# ==========================================================
+# Jede Aktion (neue Aufgabe, Lösung angezeigt, Antwort geprüft) wird als
+# Zeile in einer SQLite-Datenbank im WAL-Modus abgelegt; Zeilen werden nur
+# angehängt, nie geändert. record() legt das Ereignis nur in eine
+# Warteschlange (O(1)), ein Hintergrund-Thread schreibt gesammelt in einer
+# Transaktion, spätestens alle FLUSH_INTERVAL Sekunden. Ein Klick wartet
+# also nie auf die Platte. Die Aufgabe selbst wird als ProblemRef
+# (Generator-ID, Seed) gespeichert und lässt sich daraus neu erzeugen.
+#
+# Für die Übersicht der Lehrkraft werden in derselben Transaktion Zähler
+# mitgeführt (totals: je Kapitel, Tab und Schüler*in; daily: je Tag und
+# Tab; seen: je Schüler*in die verschiedenen gezeigten Aufgaben der
+# aufgezählten Räume in aufgabenraum, als Position im Raum; die Position gibt
+# der Aufrufer mit, fortschritt kennt die Räume nicht).
+# Auswertungen lesen nur diese Tabellen, nie den ganzen Verlauf.
+
+DB_PATH = os.environ.get(
+    "PRACTICE_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "fortschritt.db")
+)
+FLUSH_INTERVAL = 1.0   # Sekunden
+BATCH_SIZE = 500       # früher schreiben, wenn so viele Ereignisse warten
+
+NEU, LOESUNG, ANTWORT = "neu", "loesung", "antwort"
+
+_log = logging.getLogger(__name__)
+
+STUDENT_KEY = "student"                # Name aus der Seitenleiste
+_ANONYM_KEY = "student_anonym"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id          INTEGER PRIMARY KEY,
+    student     TEXT NOT NULL,
+    chapter     TEXT NOT NULL,      -- Modul, z.B. "zinseszins"
+    problem_key TEXT NOT NULL,      -- Session-Schlüssel, z.B. "zz_barwert"
+    kind        TEXT NOT NULL,      -- "neu" | "loesung" | "antwort"
+    gen_id      TEXT NOT NULL,
+    seed        INTEGER NOT NULL,
+    correct     INTEGER,            -- nur "antwort": 1/0, NULL = unvollständig
+    time        REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_student_chapter_time ON events (student, chapter, time);
+CREATE TABLE IF NOT EXISTS seen (
+    gen_id TEXT NOT NULL, student TEXT NOT NULL,
+    position INTEGER NOT NULL,      -- Aufgabe im Raum (aufgabenraum.Index)
+    last REAL NOT NULL,             -- zuletzt gezeigt
+    PRIMARY KEY (gen_id, student, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS seen_generators (   -- für diese ist seen vollständig
+    gen_id TEXT PRIMARY KEY
+) WITHOUT ROWID;
+"""
+
+# Zähler: neu, loesung, antwort (geprüft), richtig
+_COUNTERS = "neu INTEGER NOT NULL, loesung INTEGER NOT NULL, antwort INTEGER NOT NULL, richtig INTEGER NOT NULL"
+
+_SCHEMA_AGG = f"""
+CREATE TABLE totals (
+    chapter TEXT NOT NULL, problem_key TEXT NOT NULL, student TEXT NOT NULL,
+    {_COUNTERS}, last REAL NOT NULL,
+    PRIMARY KEY (chapter, problem_key, student)
+) WITHOUT ROWID;
+CREATE TABLE daily (
+    day INTEGER NOT NULL,           -- date.toordinal() (lokales Datum)
+    chapter TEXT NOT NULL, problem_key TEXT NOT NULL,
+    {_COUNTERS},
+    PRIMARY KEY (day, chapter, problem_key)
+) WITHOUT ROWID;
+"""
+
+_UPSERT_TOTALS = (
+    "INSERT INTO totals VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (chapter, problem_key, student) DO UPDATE SET "
+    "neu = neu + excluded.neu, loesung = loesung + excluded.loesung, "
+    "antwort = antwort + excluded.antwort, richtig = richtig + excluded.richtig, "
+    "last = max(last, excluded.last)"
+)
+_UPSERT_DAILY = (
+    "INSERT INTO daily VALUES (?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (day, chapter, problem_key) DO UPDATE SET "
+    "neu = neu + excluded.neu, loesung = loesung + excluded.loesung, "
+    "antwort = antwort + excluded.antwort, richtig = richtig + excluded.richtig"
+)
+_UPSERT_SEEN = (
+    "INSERT INTO seen VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (gen_id, student, position) DO UPDATE SET last = max(last, excluded.last)"
+)
+_KIND_INDEX = {NEU: 0, LOESUNG: 1, ANTWORT: 2}
+
+_INSERT = (
+    "INSERT INTO events (student, chapter, problem_key, kind, gen_id, seed, correct, time) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+def connect(path: str | None = None) -> sqlite3.Connection:
+    conn = sqlite3.connect(path or DB_PATH, timeout=30)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")   # im WAL-Modus sicher bei Abstürzen der App
+    conn.executescript(_SCHEMA)
+    if not _has_counters(conn):
+        _create_counters(conn)
+    return conn
+
+
+def _has_counters(conn) -> bool:
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'totals'").fetchone() is not None
+
+
+def _create_counters(conn):
+    # Datenbank aus der Zeit vor den Zählern: einmal aus events aufbauen;
+    # BEGIN IMMEDIATE, damit das nur eine Verbindung macht
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if not _has_counters(conn):
+            for stmt in _SCHEMA_AGG.split(";"):
+                if stmt.strip():
+                    conn.execute(stmt)
+            _rebuild(conn)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+
+def _add_counts(conn, rows):
+    # Zähler für einen Stapel Zeilen (wie _INSERT, dazu die Position im Raum
+    # oder None) erhöhen
+    totals = defaultdict(lambda: [0, 0, 0, 0, 0.0])
+    daily = defaultdict(lambda: [0, 0, 0, 0])
+    seen = {}
+    for student, chapter, key, kind, gen_id, seed, correct, t, k in rows:
+        i = _KIND_INDEX[kind]
+        tot = totals[chapter, key, student]
+        day = daily[date.fromtimestamp(t).toordinal(), chapter, key]
+        tot[i] += 1
+        day[i] += 1
+        if correct:
+            tot[3] += 1
+            day[3] += 1
+        tot[4] = max(tot[4], t)
+        if k is not None:
+            seen[gen_id, student, k] = max(seen.get((gen_id, student, k), t), t)
+    conn.executemany(_UPSERT_TOTALS, [(*k, *v) for k, v in totals.items()])
+    conn.executemany(_UPSERT_DAILY, [(*k, *v) for k, v in daily.items()])
+    conn.executemany(_UPSERT_SEEN, [(*k, t) for k, t in seen.items()])
+
+
+def _rebuild(conn):
+    cur = conn.execute(
+        "SELECT student, chapter, problem_key, kind, gen_id, seed, correct, time, NULL FROM events"
+    )
+    while rows := cur.fetchmany(50_000):
+        _add_counts(conn, rows)
+
+
+# ----------------- Schreiben (gesammelt, im Hintergrund) -----------------
+
+class _Writer:
+    def __init__(self):
+        self._queue = deque()
+        self._wake = threading.Event()
+        self._write_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+
+    def put(self, row):
+        self._queue.append(row)
+        if self._thread is None:
+            self._start()
+        if len(self._queue) >= BATCH_SIZE:
+            self._wake.set()
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="fortschritt", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        # Fehler (z.B. Datenbank gesperrt, Platte voll) nur melden: die
+        # Ereignisse bleiben in der Warteschlange, nächster Versuch in
+        # FLUSH_INTERVAL Sekunden mit neuer Verbindung
+        conn = None
+        while True:
+            self._wake.wait(FLUSH_INTERVAL)
+            self._wake.clear()
+            try:
+                conn = conn or connect()
+                self._write(conn)
+            except Exception:
+                _log.exception("fortschritt: Schreiben fehlgeschlagen (%d Ereignisse warten)", len(self._queue))
+                if conn is not None:
+                    conn.close()
+                    conn = None
+
+    def _write(self, conn):
+        with self._write_lock:
+            rows = []
+            while self._queue:
+                rows.append(self._queue.popleft())
+            if not rows:
+                return
+            try:
+                with conn:
+                    conn.executemany(_INSERT, [r[:8] for r in rows])
+                    _add_counts(conn, rows)
+            except BaseException:
+                # zurück an den Anfang, in der ursprünglichen Reihenfolge
+                self._queue.extendleft(reversed(rows))
+                raise
+
+    def flush(self):
+        """Wartende Ereignisse sofort schreiben (Dashboard, Programmende).
+
+        Schlägt das fehl, bleiben sie in der Warteschlange (Fehler wird gemeldet).
+        """
+        if not self._queue:
+            return
+        try:
+            conn = connect()
+            try:
+                self._write(conn)
+            finally:
+                conn.close()
+        except Exception:
+            _log.exception("fortschritt: Schreiben fehlgeschlagen (%d Ereignisse warten)", len(self._queue))
+
+
+_writer = _Writer()
+flush = _writer.flush
+atexit.register(flush)
+
+
+# ----------------- Ereignisse aus der App -----------------
+
+_listeners = []
+
+
+def subscribe(fn):
+    """fn(student, key, kind, ref, correct) wird bei jedem Ereignis aufgerufen."""
+    _listeners.append(fn)
+
+
+def student() -> str:
+    """Name aus der Seitenleiste, sonst eine zufällige ID für diese Session."""
+    name = (st.session_state.get(STUDENT_KEY) or "").strip()
+    if name:
+        return name
+    if _ANONYM_KEY not in st.session_state:
+        st.session_state[_ANONYM_KEY] = f"anonym-{secrets.token_hex(4)}"
+    return st.session_state[_ANONYM_KEY]
+
+
+def record(kind: str, key: str, correct: bool | None = None, position: int | None = None):
+    """Ereignis zur aktuellen Aufgabe unter key (ohne ProblemRef: nichts);
+    position: Aufgabe im aufgezählten Raum (nur "neu", zählt in seen)."""
+    ref = st.session_state.get(key)
+    if not isinstance(ref, seeding.ProblemRef):
+        return
+    name = student()
+    chapter = ref.gen_id.rpartition(".")[0]
+    _writer.put((name, chapter, key, kind, ref.gen_id, ref.seed,
+                 None if correct is None else int(correct), time.time(), position))
+    for fn in _listeners:
+        fn(name, key, kind, ref, correct)
+
+
+def neu(key: str, position: int | None = None):
+    record(NEU, key, position=position)
+
+
+def loesung(key: str):
+    record(LOESUNG, key)
+
+
+def antwort(key: str, result: dict):
+    """result wie aus antworten.check_task: richtig nur, wenn alle Felder stimmen."""
+    values = list(result.values())
+    correct = None if not values or None in values else all(values)
+    record(ANTWORT, key, correct)
+
+
+# ----------------- Lesen -----------------
+
+def events(student: str | None = None, chapter: str | None = None, since: float | None = None,
+           conn: sqlite3.Connection | None = None) -> list[sqlite3.Row]:
+    """Ereignisse nach Zeit sortiert; Filter nutzen den Index (student, chapter, time)."""
+    where, params = [], []
+    for col, val in (("student", student), ("chapter", chapter)):
+        if val is not None:
+            where.append(f"{col} = ?")
+            params.append(val)
+    if since is not None:
+        where.append("time >= ?")
+        params.append(since)
+    sql = "SELECT * FROM events" + (" WHERE " + " AND ".join(where) if where else "") + " ORDER BY time"
+    return _query(sql, params, conn)
+
+
+# ----------------- Auswertung (nur Zähler-Tabellen) -----------------
+
+def _sums(prefix: str = "") -> str:
+    return ", ".join(f"SUM({prefix}{c}) AS {c}" for c in ("neu", "loesung", "antwort", "richtig"))
+
+
+def tab_stats(days: int | None = None, conn: sqlite3.Connection | None = None) -> list[sqlite3.Row]:
+    """Je (chapter, problem_key): neu, loesung, antwort, richtig, schueler.
+
+    days=None: gesamt (aus totals), sonst die letzten days Tage inkl. heute
+    (aus daily; schueler ist dann NULL).
+    """
+    if days is None:
+        sql = (f"SELECT chapter, problem_key, {_sums()}, COUNT(*) AS schueler "
+               "FROM totals GROUP BY chapter, problem_key")
+        params = ()
+    else:
+        sql = (f"SELECT chapter, problem_key, {_sums()}, NULL AS schueler "
+               "FROM daily WHERE day > ? GROUP BY chapter, problem_key")
+        params = (date.today().toordinal() - days,)
+    return _query(sql, params, conn)
+
+
+def daily_stats(days: int = 30, chapter: str | None = None,
+                conn: sqlite3.Connection | None = None) -> list[sqlite3.Row]:
+    """Je Tag (day = date.toordinal()) die Summen der letzten days Tage."""
+    sql = f"SELECT day, {_sums()} FROM daily WHERE day > ?"
+    params = [date.today().toordinal() - days]
+    if chapter is not None:
+        sql += " AND chapter = ?"
+        params.append(chapter)
+    return _query(sql + " GROUP BY day ORDER BY day", params, conn)
+
+
+def student_stats(chapter: str, conn: sqlite3.Connection | None = None) -> list[sqlite3.Row]:
+    """Je Schüler*in die Summen in einem Kapitel (gesamt) und die letzte Aktivität."""
+    sql = (f"SELECT student, {_sums()}, MAX(last) AS last FROM totals "
+           "WHERE chapter = ? GROUP BY student ORDER BY student")
+    return _query(sql, (chapter,), conn)
+
+
+def seen_positions(gen_id: str, student: str,
+                   conn: sqlite3.Connection | None = None) -> list[sqlite3.Row]:
+    """(position, last) der gezeigten Aufgaben von gen_id (nur aufgezählte Räume)."""
+    return _query("SELECT position, last FROM seen WHERE gen_id = ? AND student = ?",
+                  (gen_id, student), conn)
+
+
+def seen_counts(gen_ids, conn: sqlite3.Connection | None = None) -> list[sqlite3.Row]:
+    """Je Schüler*in die Zahl verschiedener gezeigter Aufgaben der Generatoren gen_ids."""
+    gen_ids = list(gen_ids)
+    sql = (f"SELECT student, COUNT(*) AS n FROM seen WHERE gen_id IN ({', '.join('?' * len(gen_ids))}) "
+           "GROUP BY student")
+    return _query(sql, gen_ids, conn)
+
+
+# ----------------- seen aus älteren Ereignissen nachtragen -----------------
+# Ereignisse aus der Zeit vor seen (oder vor der Aufzählung eines Generators)
+# haben keine Position. aufgabenraum liest dafür einmal die verschiedenen
+# Seeds, rechnet sie selbst in Positionen um und gibt fertige Zeilen zurück;
+# die Transaktion hier führt nur noch SQL aus.
+
+def seen_complete(gen_id: str, conn: sqlite3.Connection | None = None) -> bool:
+    """Ist seen für gen_id vollständig (schon nachgetragen)?"""
+    return bool(_query("SELECT 1 FROM seen_generators WHERE gen_id = ?", (gen_id,), conn))
+
+
+def shown_seeds(gen_id: str, conn: sqlite3.Connection | None = None) -> list[sqlite3.Row]:
+    """(student, seed, last) je verschiedener gezeigter Aufgabe von gen_id aus events."""
+    return _query("SELECT student, seed, MAX(time) AS last FROM events WHERE gen_id = ? AND kind = ? "
+                  "GROUP BY student, seed", (gen_id, NEU), conn)
+
+
+def fill_seen(gen_id: str, rows):
+    """rows (student, position, last) in seen eintragen und gen_id als
+    vollständig markieren; hat das schon ein anderer Prozess getan, nichts."""
+    conn = connect()
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT 1 FROM seen_generators WHERE gen_id = ?", (gen_id,)).fetchone() is None:
+                conn.executemany(_UPSERT_SEEN, [(gen_id, *r) for r in rows])
+                conn.execute("INSERT INTO seen_generators VALUES (?)", (gen_id,))
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    finally:
+        conn.close()
+
+
+def _query(sql, params, conn):
+    own = conn is None
+    conn = conn or connect()
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        if own:
+            conn.close()
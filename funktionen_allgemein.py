@@ -1,10 +1,12 @@
 import random
 from dataclasses import dataclass
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.ticker as ticker
 import streamlit as st
 
+import plotting
+import problem_pool
+import seeding
+
 
 # ==========================================================
 #   FUNKTIONEN ALLGEMEIN
@@ -22,153 +24,140 @@ STATEMENT_STAGE_KEY  = "variable_statement_stage_v2"
 
 
 # ----------------- Dataclass -----------------
-@dataclass
+@dataclass(frozen=True)
 class CriticalPoint:
     x: float
     y: float
     kind: str  # "Maximum" or "Minimum"
 
 
-# ----------------- Helpers -----------------
-def _axes_origin(ax):
-    for s in ("right", "top"):
-        ax.spines[s].set_color("none")
-    ax.spines["left"].set_position("zero")
-    ax.spines["bottom"].set_position("zero")
-    ax.spines["left"].set_linewidth(1.2)
-    ax.spines["bottom"].set_linewidth(1.2)
-    ax.set_xlabel("")
-    ax.set_ylabel("")
-    ax.set_title("")
-    ax.grid(True, linestyle="--", alpha=0.35)
-
-
 # ----------------- Generators -----------------
 def build_cubic_coeff(rng: np.random.Generator) -> dict:
-    def pick_ab():
-        a = (-1 if rng.random() < 0.5 else 1) * rng.uniform(0.15, 0.30)
-        b = rng.uniform(1.0, 2.0) if rng.random() < 0.5 else rng.uniform(-2.0, -1.0)
-        return float(a), float(b)
-
-    while True:
-        a, b = pick_ab()
-        c = float(rng.uniform(0.1, 3.0))
-        d = float(rng.uniform(-2.0, 2.0))
-        poly = np.poly1d([a, b, c, d])
-
-        der = poly.deriv()
-        crit = [z.real for z in der.r if abs(z.imag) < 1e-10]
-        if len(crit) != 2:
-            continue
-        crit.sort()
-
-        if not all(-8.0 <= x0 <= 8.0 for x0 in crit):
-            continue
-
-        y_abs = [abs(float(poly(x0))) for x0 in crit]
-        mean_abs = max(np.mean(y_abs), 1e-9)
-        target = rng.uniform(5.0, 7.5)
-        scale = target / mean_abs
-        poly = poly * scale
-
-        roots = [r.real for r in poly.r if abs(r.imag) < 1e-10]
-
-        cps = []
-        ok = True
-        for x0 in crit:
-            y0 = float(poly(x0))
-            if not (4.0 <= abs(y0) <= 9.0):
-                ok = False
-                break
-            if roots and min(abs(x0 - r) for r in roots) < 1.0:
-                ok = False
-                break
-            k2 = float(poly.deriv(2)(x0))
-            kind = "Maximum" if k2 < 0 else "Minimum"
-            cps.append(CriticalPoint(x=float(x0), y=y0, kind=kind))
-
-        if not ok:
-            continue
-
-        return {
-            "degree": 3,
-            "poly": poly,
-            "roots": roots,
-            "critical_points": cps,
-            "intercept": (0.0, float(poly(0.0))),
-        }
+    # Konstruktiv statt Rejection Sampling: zuerst Extremstellen x1 < x2 und
+    # Extremwerte y1, y2 wählen, dann die Koeffizienten daraus ableiten.
+    # Mit h = x2 - x1 und t = (x - x1) / h gilt f(x) = y1 + (y2 - y1)(3t² - 2t³).
+    # Für |y| in [4, 9] liegt jede Nullstelle mindestens 0.29·h von beiden
+    # Extremstellen entfernt; h >= 4 garantiert also den Abstand 1.0.
+    h = float(rng.uniform(4.0, 8.0))
+    x1 = float(rng.uniform(-8.0, 8.0 - h))
+    x2 = x1 + h
+
+    if rng.random() < 0.75:
+        # Max oberhalb, Min unterhalb der x-Achse -> drei Nullstellen
+        y_max = float(rng.uniform(4.0, 9.0))
+        y_min = -float(rng.uniform(4.0, 9.0))
+    else:
+        # beide Extrema auf derselben Seite -> eine Nullstelle
+        y_lo = float(rng.uniform(4.0, 7.0))
+        y_hi = float(rng.uniform(y_lo + 2.0, 9.0))
+        if rng.random() < 0.5:
+            y_max, y_min = y_hi, y_lo
+        else:
+            y_max, y_min = -y_lo, -y_hi
+
+    # links Maximum (a > 0) oder links Minimum (a < 0)
+    if rng.random() < 0.5:
+        y1, y2 = y_max, y_min
+    else:
+        y1, y2 = y_min, y_max
+
+    a = -2.0 * (y2 - y1) / h**3
+    b = -1.5 * a * (x1 + x2)
+    c = 3.0 * a * x1 * x2
+    d = y1 - (a * x1**3 + b * x1**2 + c * x1)
+    poly = np.poly1d([a, b, c, d])
+
+    roots = [r.real for r in poly.r if abs(r.imag) < 1e-10]
+    cps = [
+        CriticalPoint(x=x1, y=y1, kind="Maximum" if y1 > y2 else "Minimum"),
+        CriticalPoint(x=x2, y=y2, kind="Maximum" if y2 > y1 else "Minimum"),
+    ]
+
+    return {
+        "degree": 3,
+        "poly": poly,
+        "roots": roots,
+        "critical_points": cps,
+        "intercept": (0.0, float(poly(0.0))),
+    }
+
+
+def _quadratic_choices() -> list:
+    # alle (s, r1, r2), die die Bedingungen erfüllen; eine gleichverteilte Wahl
+    # daraus entspricht genau dem früheren Rejection Sampling.
+    candidates = [float(x) for x in np.arange(-6.0, 6.5, 0.5) if abs(x) > 1e-9]
+    out = []
+    for s in (1, -1, 2, -2):
+        for r1 in candidates:
+            for r2 in candidates:
+                if r1 == r2 or abs(r2 - r1) < 0.75:
+                    continue
+                xv = (r1 + r2) / 2
+                yv = -s * (r2 - r1) ** 2 / 4
+                if -8 <= xv <= 8 and 3.0 <= abs(yv) <= 8.0:
+                    out.append((float(s), r1, r2))
+    return out
+
+
+QUADRATIC_CHOICES = _quadratic_choices()
 
 
 def build_quadratic_roots(rng: np.random.Generator) -> dict:
-    scale_choices = [1, -1, 2, -2]
-    candidates = [x for x in np.arange(-6.0, 6.5, 0.5) if abs(x) > 1e-9]
-
-    while True:
-        r1, r2 = rng.choice(candidates, size=2, replace=False)
-        if abs(r2 - r1) < 0.75:
-            continue
-        s = float(rng.choice(scale_choices))
-
-        a = s
-        b = -s * (r1 + r2)
-        c = s * r1 * r2
-        poly = np.poly1d([a, b, c])
-
-        xv = -b / (2 * a)
-        if not (-8 <= xv <= 8):
-            continue
-        yv = float(poly(xv))
-        if not (3.0 <= abs(yv) <= 8.0):
-            continue
-
-        y0 = float(poly(0.0))
-        if abs(y0) < 1e-9:
-            continue
-
-        kind = "Minimum" if a > 0 else "Maximum"
-        cps = [CriticalPoint(x=float(xv), y=float(yv), kind=kind)]
-        roots = [float(r1), float(r2)]
-        return {
-            "degree": 2,
-            "poly": poly,
-            "roots": roots,
-            "critical_points": cps,
-            "intercept": (0.0, y0),
-        }
+    s, r1, r2 = QUADRATIC_CHOICES[rng.integers(len(QUADRATIC_CHOICES))]
+
+    a = s
+    b = -s * (r1 + r2)
+    c = s * r1 * r2
+    poly = np.poly1d([a, b, c])
+
+    xv = -b / (2 * a)
+    yv = float(poly(xv))
+    y0 = float(poly(0.0))
+
+    kind = "Minimum" if a > 0 else "Maximum"
+    cps = [CriticalPoint(x=float(xv), y=float(yv), kind=kind)]
+    roots = [float(r1), float(r2)]
+    return {
+        "degree": 2,
+        "poly": poly,
+        "roots": roots,
+        "critical_points": cps,
+        "intercept": (0.0, y0),
+    }
+
+
+def new_quadratic(rng: random.Random) -> dict:
+    return build_quadratic_roots(np.random.default_rng(rng.getrandbits(64)))
+
+
+def new_cubic(rng: random.Random) -> dict:
+    return build_cubic_coeff(np.random.default_rng(rng.getrandbits(64)))
 
 
 def generate_alternating_poly() -> dict:
-    rng = np.random.default_rng()
     last = st.session_state.get(POLY_LAST_DEGREE, 3)
     if last == 3:
-        prob = build_quadratic_roots(rng)
+        prob = problem_pool.renew(POLY_PROBLEM_KEY, new_quadratic)
         st.session_state[POLY_LAST_DEGREE] = 2
     else:
-        prob = build_cubic_coeff(rng)
+        prob = problem_pool.renew(POLY_PROBLEM_KEY, new_cubic)
         st.session_state[POLY_LAST_DEGREE] = 3
     return prob
 
 
 # ----------------- Plot -----------------
-def plot_poly_with_markers(problem: dict, show_solution: bool):
+POLY_AXES = plotting.KOORDINATENKREUZ._replace(tight_layout=True)
+
+
+def plot_poly_with_markers(ax, problem: dict, show_solution: bool):
     poly = problem["poly"]
     x_left, x_right = -10.0, 10.0
     y_bottom, y_top = -10.0, 10.0
 
-    fig, ax = plt.subplots(figsize=(7.8, 5.4))
-
-    xx = np.linspace(x_left - 2, x_right + 2, 1600)
-    yy = poly(xx)
+    xx, yy = plotting.sample_curve(poly, (x_left, x_right), (y_bottom, y_top))
     line, = ax.plot(xx, yy, linewidth=2.0)
     line.set_clip_on(True)
 
-    _axes_origin(ax)
-    ax.set_xlim(x_left, x_right)
-    ax.set_ylim(y_bottom, y_top)
-
-    ax.xaxis.set_major_locator(ticker.MultipleLocator(1))
-    ax.yaxis.set_major_locator(ticker.MultipleLocator(1))
-
     if show_solution:
         roots = [r.real for r in problem.get("poly").r if abs(r.imag) < 1e-10]
         for r in roots:
@@ -191,9 +180,6 @@ def plot_poly_with_markers(problem: dict, show_solution: bool):
                 ax.annotate(label, xy=(cp.x, cp.y), xytext=(6, 12), textcoords="offset points",
                             color=color, fontsize=12, fontweight="bold")
 
-    fig.tight_layout()
-    return fig
-
 
 # ----------------- Variable-Tab -----------------
 VARIABLE_EXAMPLES = [
@@ -230,27 +216,27 @@ VARIABLE_EXAMPLES = [
 ]
 
 
-def get_new_variable_problem() -> dict:
-    return random.choice(VARIABLE_EXAMPLES)
+def get_new_variable_problem(rng: random.Random) -> dict:
+    return rng.choice(VARIABLE_EXAMPLES)
 
 
-def generate_statement_for(problem: dict) -> dict:
+def generate_statement_for(problem: dict, rng: random.Random) -> dict:
     ind, dep = problem["independent"], problem["dependent"]
-    x = random.choice(range(1, 11))
+    x = rng.choice(range(1, 11))
     unit = dep["unit"]
 
     if unit in ("°C", "C°"):
-        y = random.randint(10, 30)
+        y = rng.randint(10, 30)
     elif unit == "m":
-        y = random.randint(50, 500)
+        y = rng.randint(50, 500)
     elif unit == "cm":
-        y = random.randint(50, 150)
+        y = rng.randint(50, 150)
     elif unit == "kWh":
-        y = random.randint(1, 20)
+        y = rng.randint(1, 20)
     elif unit == "m/s":
-        y = random.randint(1, 15)
+        y = rng.randint(1, 15)
     else:
-        y = random.randint(1, 50)
+        y = rng.randint(1, 50)
 
     if ind["unit"] in ("h", "Stunden", "Std.", "hour"):
         time_phrase = f"nach {x} Stunden"
@@ -276,11 +262,11 @@ def generate_statement_for(problem: dict) -> dict:
 def run():
     if POLY_PROBLEM_KEY not in st.session_state:
         st.session_state[POLY_LAST_DEGREE] = 2
-        st.session_state[POLY_PROBLEM_KEY] = generate_alternating_poly()
+        generate_alternating_poly()
         st.session_state[POLY_SHOW_KEY] = False
 
     if VARIABLE_PROBLEM_KEY not in st.session_state:
-        st.session_state[VARIABLE_PROBLEM_KEY] = get_new_variable_problem()
+        problem_pool.renew(VARIABLE_PROBLEM_KEY, get_new_variable_problem)
         st.session_state[VARIABLE_SHOW_KEY] = False
 
     if STATEMENT_STAGE_KEY not in st.session_state:
@@ -293,7 +279,7 @@ def run():
     tab1, tab2 = st.tabs(["Besondere Punkte einer Funktion", "Abhängige & unabhängige Variablen"])
 
     with tab1:
-        problem = st.session_state[POLY_PROBLEM_KEY]
+        problem = problem_pool.current(POLY_PROBLEM_KEY, new_cubic)
         show = st.session_state[POLY_SHOW_KEY]
 
         st.subheader("Aufgabenstellung")
@@ -306,19 +292,23 @@ def run():
             """
         )
 
-        st.pyplot(plot_poly_with_markers(problem, show))
+        plotting.show(
+            "poly", (tuple(problem["poly"].coeffs), show),
+            lambda ax: plot_poly_with_markers(ax, problem, show),
+            template=POLY_AXES, figsize=(7.8, 5.4),
+        )
 
         c1, c2 = st.columns(2)
         if c1.button("Lösung"):
             st.session_state[POLY_SHOW_KEY] = True
             st.rerun()
         if c2.button("Neue Funktion"):
-            st.session_state[POLY_PROBLEM_KEY] = generate_alternating_poly()
+            generate_alternating_poly()
             st.session_state[POLY_SHOW_KEY] = False
             st.rerun()
 
     with tab2:
-        vp = st.session_state[VARIABLE_PROBLEM_KEY]
+        vp = problem_pool.current(VARIABLE_PROBLEM_KEY, get_new_variable_problem)
         show_vars = st.session_state[VARIABLE_SHOW_KEY]
         stage = st.session_state[STATEMENT_STAGE_KEY]
 
@@ -332,7 +322,8 @@ def run():
         if st.button("Lösung (Variablen)"):
             st.session_state[VARIABLE_SHOW_KEY] = True
             st.session_state[STATEMENT_STAGE_KEY] = 1
-            st.session_state[STATEMENT_DATA_KEY] = generate_statement_for(vp)
+            # nur den Seed merken, die Aussage wird daraus neu erzeugt
+            st.session_state[STATEMENT_DATA_KEY] = seeding.new_seed()
             st.rerun()
 
         if show_vars:
@@ -341,7 +332,7 @@ def run():
             st.success(f"Abhängige Variable: {dep['symbol']} … {dep['description']} ({dep['unit']})")
 
         if stage >= 1 and st.session_state[STATEMENT_DATA_KEY] is not None:
-            s = st.session_state[STATEMENT_DATA_KEY]
+            s = generate_statement_for(vp, seeding.make_rng(st.session_state[STATEMENT_DATA_KEY]))
             st.markdown("---")
             st.subheader("Mathematische Aussage formulieren")
             ind, dep = vp["independent"], vp["dependent"]
@@ -358,7 +349,7 @@ def run():
                 st.success(s["expr"])
 
             if st.button("Neues Beispiel"):
-                st.session_state[VARIABLE_PROBLEM_KEY] = get_new_variable_problem()
+                problem_pool.renew(VARIABLE_PROBLEM_KEY, get_new_variable_problem)
                 st.session_state[VARIABLE_SHOW_KEY] = False
                 st.session_state[STATEMENT_STAGE_KEY] = 0
                 st.session_state[STATEMENT_DATA_KEY] = None
@@ -0,0 +1,160 @@
+# gesehen.py
+import hashlib
+import math
+import threading
+from collections import OrderedDict
+
+import streamlit as st
+
+
+# ==========================================================
+#   SCHON GESEHENE AUFGABEN
+# ==========================================================
+# Manche Generatoren haben nur wenige verschiedene Aufgaben (z.B.
+# trigonometrie.gen_problem: 9 Winkel × 6 Hypotenusen). Damit „Neues
+# Beispiel“ nicht dieselbe Aufgabe noch einmal bringt, bekommt jede Aufgabe
+# einen Fingerabdruck ihres Inhalts (nicht des Seeds: verschiedene Seeds
+# können dieselbe Aufgabe liefern). Gemerkt wird
+#
+#   je Session  in einer begrenzten Menge (die ältesten fallen heraus),
+#   je Klasse   in einem Bloom-Filter, prozessweit (optional, wenn in der
+#               Seitenleiste eine Klasse angegeben ist).
+#
+# Nachsehen und Eintragen kosten O(1), ohne den Verlauf durchzugehen.
+# Ist der Aufgabenraum erschöpft, wählt problem_pool.renew die Aufgabe,
+# die am längsten nicht mehr gezeigt wurde.
+
+SESSION_CAPACITY = 256
+CLASS_CAPACITY = 20_000      # Einträge je Klasse, bevor der Filter neu beginnt
+CLASS_FP_RATE = 0.01         # Anteil fälschlich als „gesehen“ gemeldeter Aufgaben
+
+SESSION_KEY = "gesehen"
+KLASSE_KEY = "klasse"        # Klasse aus der Seitenleiste
+
+
+def _canonical(x):
+    # gleiche Aufgabe -> gleiche Form (Reihenfolge der Schlüssel, Liste/Tupel, 2.0/2)
+    if isinstance(x, dict):
+        return tuple(sorted((k, _canonical(v)) for k, v in x.items()))
+    if isinstance(x, (list, tuple)):
+        return tuple(_canonical(v) for v in x)
+    if isinstance(x, float) and x.is_integer():
+        return int(x)
+    return x
+
+
+def fingerprint(gen_id: str, problem) -> int:
+    """64-bit-Fingerabdruck, stabil über Prozesse hinweg (anders als hash())."""
+    data = repr((gen_id, _canonical(problem))).encode()
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+class SeenSet:
+    """Menge mit fester Größe; beim Überlauf fällt der am längsten nicht
+    gesehene Eintrag heraus."""
+
+    def __init__(self, capacity: int = SESSION_CAPACITY):
+        self._items = OrderedDict()   # fp -> Zeitpunkt (Zähler), älteste zuerst
+        self._tick = 0
+        self.capacity = capacity
+
+    def __contains__(self, fp: int) -> bool:
+        return fp in self._items
+
+    def seen_at(self, fp: int) -> int:
+        """Wann zuletzt gesehen (größer = später), -1 = nicht gesehen."""
+        return self._items.get(fp, -1)
+
+    def add(self, fp: int):
+        self._tick += 1
+        self._items[fp] = self._tick
+        self._items.move_to_end(fp)
+        if len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+
+    def __len__(self):
+        return len(self._items)
+
+
+class BloomFilter:
+    """Bloom-Filter über 64-bit-Fingerabdrücke; keine falschen „neu“-Antworten.
+
+    Ist er mit capacity Einträgen voll, beginnt ein neuer, der alte wird
+    noch eine Runde mitgefragt (so vergisst er nicht alles auf einmal).
+    """
+
+    def __init__(self, capacity: int = CLASS_CAPACITY, fp_rate: float = CLASS_FP_RATE):
+        self.capacity = capacity
+        self.m = max(64, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.k = max(1, round(self.m / capacity * math.log(2)))
+        self._bits = bytearray((self.m + 7) // 8)
+        self._old = None
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _positions(self, fp: int):
+        # Doppel-Hashing aus den beiden 32-bit-Hälften
+        h1, h2 = fp & 0xFFFFFFFF, (fp >> 32) | 1
+        return [(h1 + i * h2) % self.m for i in range(self.k)]
+
+    @staticmethod
+    def _has(bits, positions) -> bool:
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in positions)
+
+    def __contains__(self, fp: int) -> bool:
+        pos = self._positions(fp)
+        with self._lock:
+            return self._has(self._bits, pos) or (self._old is not None and self._has(self._old, pos))
+
+    def add(self, fp: int):
+        pos = self._positions(fp)
+        with self._lock:
+            if self._count >= self.capacity:
+                self._old, self._bits, self._count = self._bits, bytearray(len(self._bits)), 0
+            for p in pos:
+                self._bits[p >> 3] |= 1 << (p & 7)
+            self._count += 1
+
+
+# ----------------- Session / Klasse -----------------
+
+_CLASSES = {}
+_CLASSES_LOCK = threading.Lock()
+
+
+def _session() -> SeenSet:
+    seen = st.session_state.get(SESSION_KEY)
+    if not isinstance(seen, SeenSet):
+        seen = st.session_state[SESSION_KEY] = SeenSet()
+    return seen
+
+
+def _klasse() -> BloomFilter | None:
+    name = (st.session_state.get(KLASSE_KEY) or "").strip().lower()
+    if not name:
+        return None
+    bloom = _CLASSES.get(name)
+    if bloom is None:
+        with _CLASSES_LOCK:
+            bloom = _CLASSES.setdefault(name, BloomFilter())
+    return bloom
+
+
+def status(fp: int) -> int:
+    """0 = neu, 1 = nur in der Klasse gesehen, 2 = in dieser Session gesehen."""
+    if fp in _session():
+        return 2
+    klasse = _klasse()
+    return 1 if klasse is not None and fp in klasse else 0
+
+
+def seen_at(fp: int) -> int:
+    """Wann in dieser Session zuletzt gesehen (größer = später), -1 = nie."""
+    return _session().seen_at(fp)
+
+
+def mark(fp: int):
+    _session().add(fp)
+    klasse = _klasse()
+    if klasse is not None:
+        klasse.add(fp)
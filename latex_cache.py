@@ -0,0 +1,44 @@
+# latex_cache.py
+import functools
+
+
+# ==========================================================
+#   LATEX-FORMATIERER MEMOISIEREN
+# ==========================================================
+# Jeder Button-Klick führt das ganze Skript erneut aus; die Formatierer
+# bauen dabei immer wieder dieselben Strings. Mit @memoized wird jeder
+# Formatierer zu einem begrenzten LRU-Cache über seine (unveränderlichen)
+# Argumente -> Tupel statt Listen übergeben. Prozessweit, also für alle
+# Sessions gemeinsam; functools.lru_cache ist threadsicher.
+
+MAXSIZE = 2048
+
+_REGISTRY = {}
+
+
+def memoized(fn=None, *, maxsize: int = MAXSIZE):
+    """Decorator: @memoized oder @memoized(maxsize=...)."""
+    def deco(f):
+        # typed=True: 2 und 2.0 ergeben unterschiedliche Strings ("2x" vs. "2.0x")
+        cached = functools.lru_cache(maxsize=maxsize, typed=True)(f)
+        _REGISTRY[f"{f.__module__}.{f.__qualname__}"] = cached
+        return cached
+    return deco(fn) if fn is not None else deco
+
+
+def stats() -> dict:
+    """Treffer/Fehlgriffe je Formatierer, z.B. {"matrizen._latex_matrix": {...}}."""
+    return {
+        name: {"hits": i.hits, "misses": i.misses, "entries": i.currsize, "maxsize": i.maxsize}
+        for name, i in ((name, f.cache_info()) for name, f in _REGISTRY.items())
+    }
+
+
+def totals() -> dict:
+    s = stats().values()
+    return {"hits": sum(v["hits"] for v in s), "misses": sum(v["misses"] for v in s)}
+
+
+def clear():
+    for f in _REGISTRY.values():
+        f.cache_clear()
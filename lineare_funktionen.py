@@ -4,11 +4,13 @@ from dataclasses import dataclass
 from fractions import Fraction
 from typing import Tuple, Dict
 
-import matplotlib.pyplot as plt
-import numpy as np
 import pandas as pd
 import streamlit as st
-from matplotlib.ticker import MultipleLocator
+
+import fortschritt
+import latex_cache
+import plotting
+import problem_pool
 
 
 # ==========================================================
@@ -16,25 +18,25 @@ from matplotlib.ticker import MultipleLocator
 # ==========================================================
 
 # -------- Hilfsfunktionen --------
-def choose_int_excluding(low: int, high: int, exclude: set[int]) -> int:
+def choose_int_excluding(rng: random.Random, low: int, high: int, exclude: set[int]) -> int:
     candidates = [v for v in range(low, high + 1) if v not in exclude]
-    return random.choice(candidates)
+    return rng.choice(candidates)
 
-def choose_k_simple() -> int:
-    return choose_int_excluding(-5, 5, {0})
+def choose_k_simple(rng: random.Random) -> int:
+    return choose_int_excluding(rng, -5, 5, {0})
 
-def choose_d_simple() -> int:
-    return choose_int_excluding(-4, 4, {0})
+def choose_d_simple(rng: random.Random) -> int:
+    return choose_int_excluding(rng, -4, 4, {0})
 
-def choose_d_simple_limited() -> int:
-    return random.choice([-2, -1, 1, 2])
+def choose_d_simple_limited(rng: random.Random) -> int:
+    return rng.choice([-2, -1, 1, 2])
 
-def choose_k_hard_limited() -> float:
+def choose_k_hard_limited(rng: random.Random) -> float:
     nums = list(range(-5, 6))
     dens = list(range(1, 6))
     while True:
-        n = random.choice(nums)
-        d = random.choice(dens)
+        n = rng.choice(nums)
+        d = rng.choice(dens)
         if n == 0:
             return 0.0
         frac = Fraction(n, d).limit_denominator(5)
@@ -42,8 +44,8 @@ def choose_k_hard_limited() -> float:
         if abs(k) <= 5:
             return k
 
-def choose_d_hard_limited() -> int:
-    return random.choice([-2, -1, 0, 1, 2])
+def choose_d_hard_limited(rng: random.Random) -> int:
+    return rng.choice([-2, -1, 0, 1, 2])
 
 def ensure_not_both_zero(k: float, d: float) -> Tuple[float, float]:
     if abs(k) < 1e-12 and abs(d) < 1e-12:
@@ -60,6 +62,7 @@ def slope_triangle_run_rise(k: float) -> Tuple[int, int]:
     rise = int(frac.numerator)
     return run, rise
 
+@latex_cache.memoized
 def latex_linear(k: float, d: float) -> str:
     if abs(k - round(k)) < 1e-12:
         k_int = int(round(k))
@@ -87,27 +90,12 @@ def latex_linear(k: float, d: float) -> str:
 
 
 # -------- Achsen & Plot --------
-def apply_axes_style(ax):
-    ax.set_xlim(-10, 10)
-    ax.set_ylim(-10, 10)
-    ax.xaxis.set_major_locator(MultipleLocator(1))
-    ax.yaxis.set_major_locator(MultipleLocator(1))
-    ax.grid(True, which="both", linestyle="--", alpha=0.4)
-    ax.spines["left"].set_position("zero")
-    ax.spines["bottom"].set_position("zero")
-    ax.spines["right"].set_color("none")
-    ax.spines["top"].set_color("none")
-    ax.spines["left"].set_linewidth(1.2)
-    ax.spines["bottom"].set_linewidth(1.2)
-    ax.set_xlabel("")
-    ax.set_ylabel("")
-    ax.set_aspect("equal", adjustable="box")
+AXES = plotting.KOORDINATENKREUZ._replace(equal=True)
 
 def plot_line_with_triangle(ax, k: float, d: float, show_triangle: bool):
-    x = np.linspace(-10, 10, 801)
-    y = k * x + d
+    # Achsen kommen aus der Vorlage AXES
+    x, y = plotting.sample_curve(lambda x: k * x + d, AXES.xlim, AXES.ylim)
     ax.plot(x, y, linewidth=2.5)
-    apply_axes_style(ax)
 
     if show_triangle:
         run, rise = slope_triangle_run_rise(k)
@@ -118,75 +106,82 @@ def plot_line_with_triangle(ax, k: float, d: float, show_triangle: bool):
 
 
 # -------- Dataclass --------
-@dataclass
+@dataclass(frozen=True)
 class LinFunc:
     k: float
     d: float
 
 
 # -------- Problem-Generatoren (Tabs 1-4) --------
-def gen_tab1() -> LinFunc:
+def gen_tab1(rng: random.Random) -> LinFunc:
     while True:
-        k = float(choose_k_simple())
-        d = float(choose_d_simple())
+        k = float(choose_k_simple(rng))
+        d = float(choose_d_simple(rng))
         if abs(k) > 1e-12 or abs(d) > 1e-12:
             return LinFunc(k, d)
 
-def gen_tab2() -> LinFunc:
+def gen_tab2(rng: random.Random) -> LinFunc:
     while True:
-        k = choose_k_hard_limited()
-        d = float(choose_d_hard_limited())
+        k = choose_k_hard_limited(rng)
+        d = float(choose_d_hard_limited(rng))
         k, d = ensure_not_both_zero(k, d)
         if abs(k) > 1e-12 or abs(d) > 1e-12:
             return LinFunc(k, d)
 
-def gen_tab3() -> LinFunc:
+def gen_tab3(rng: random.Random) -> LinFunc:
     while True:
-        k = float(choose_k_simple())
-        d = float(choose_d_simple_limited())
+        k = float(choose_k_simple(rng))
+        d = float(choose_d_simple_limited(rng))
         if abs(k) > 1e-12 or abs(d) > 1e-12:
             return LinFunc(k, d)
 
-def gen_tab4() -> LinFunc:
+def gen_tab4(rng: random.Random) -> LinFunc:
     while True:
-        k = choose_k_hard_limited()
-        d = float(random.randint(-4, 4))
+        k = choose_k_hard_limited(rng)
+        d = float(rng.randint(-4, 4))
         k, d = ensure_not_both_zero(k, d)
         if abs(k) > 1e-12 or abs(d) > 1e-12:
             return LinFunc(k, d)
 
 
 # -------- Tab 5: Differenzenquotient --------
-def gen_tab5_points() -> Dict:
-    xs = sorted(random.sample(range(1, 11), 3))
+def gen_tab5_points(rng: random.Random) -> Dict:
+    xs = sorted(rng.sample(range(1, 11), 3))
     while abs(xs[1] - xs[0]) == abs(xs[2] - xs[1]):
-        xs = sorted(random.sample(range(1, 11), 3))
+        xs = sorted(rng.sample(range(1, 11), 3))
 
-    func_type = "linear" if random.random() < 0.75 else "quadratic"
+    func_type = "linear" if rng.random() < 0.75 else "quadratic"
 
     def pick_quarter(vmin, vmax, step=0.25):
         n = int((vmax - vmin) / step)
-        return round(vmin + random.randint(0, n) * step, 2)
+        return round(vmin + rng.randint(0, n) * step, 2)
 
     if func_type == "linear":
         k = pick_quarter(0.25, 2.5, 0.25)
         d = pick_quarter(0.5, 5.0, 0.25)
         f = lambda x: k * x + d
     else:
-        a = random.choice([0.25, 0.5, 0.75, 1.0])
+        a = rng.choice([0.25, 0.5, 0.75, 1.0])
         b = pick_quarter(0.25, 2.0, 0.25)
         c = pick_quarter(0.5, 5.0, 0.25)
         f = lambda x: a * x * x + b * x + c
 
     ys = [round(f(x), 2) for x in xs]
     if any(y <= 0 for y in ys):
-        return gen_tab5_points()
+        return gen_tab5_points(rng)
 
     points = [{"x": xs[i], "fx": ys[i]} for i in range(3)]
     return {"func_type": func_type, "points": points}
 
 
 # -------- Rendering Tabs 1-4 --------
+def _show_line(prob: LinFunc, show_triangle: bool):
+    plotting.show(
+        "lin_line", (prob.k, prob.d, show_triangle),
+        lambda ax: plot_line_with_triangle(ax, prob.k, prob.d, show_triangle=show_triangle),
+        template=AXES, figsize=(7, 7),
+    )
+
 def draw_tab(prob: LinFunc, show: bool, mode: str, key_prefix: str):
     st.subheader("Aufgabe")
 
@@ -199,31 +194,26 @@ def draw_tab(prob: LinFunc, show: bool, mode: str, key_prefix: str):
 
     c1, c2 = st.columns(2)
     if c1.button("Lösung anzeigen", key=f"{key_prefix}_show_btn"):
+        fortschritt.loesung(f"{key_prefix}_prob")
         st.session_state[f"{key_prefix}_show"] = True
         st.rerun()
     if c2.button("Neue Aufgabe", key=f"{key_prefix}_new_btn"):
         gen = {"t1": gen_tab1, "t2": gen_tab2, "t3": gen_tab3, "t4": gen_tab4}[key_prefix]
-        st.session_state[f"{key_prefix}_prob"] = gen()
+        problem_pool.renew(f"{key_prefix}_prob", gen)
         st.session_state[f"{key_prefix}_show"] = False
         st.rerun()
 
     if mode.startswith("draw"):
         if show:
-            fig, ax = plt.subplots(figsize=(7, 7))
-            plot_line_with_triangle(ax, prob.k, prob.d, show_triangle=True)
-            st.pyplot(fig)
+            _show_line(prob, show_triangle=True)
             st.markdown(f"**k =** {prob.k:g}, **d =** {prob.d:g}")
     else:
         if not show:
-            fig, ax = plt.subplots(figsize=(7, 7))
-            plot_line_with_triangle(ax, prob.k, prob.d, show_triangle=False)
-            st.pyplot(fig)
+            _show_line(prob, show_triangle=False)
         else:
             st.markdown(f"**k =** {prob.k:g}, **d =** {prob.d:g}")
             st.latex(latex_linear(prob.k, prob.d))
-            fig, ax = plt.subplots(figsize=(7, 7))
-            plot_line_with_triangle(ax, prob.k, prob.d, show_triangle=True)
-            st.pyplot(fig)
+            _show_line(prob, show_triangle=True)
 
 
 # ==========================================================
@@ -238,28 +228,27 @@ def run():
     )
 
     # Session Init
+    probs = {}
     for t in ["t1", "t2", "t3", "t4"]:
-        if f"{t}_prob" not in st.session_state:
-            st.session_state[f"{t}_prob"] = {"t1": gen_tab1, "t2": gen_tab2, "t3": gen_tab3, "t4": gen_tab4}[t]()
+        gen = {"t1": gen_tab1, "t2": gen_tab2, "t3": gen_tab3, "t4": gen_tab4}[t]
+        probs[t] = problem_pool.current(f"{t}_prob", gen)
         if f"{t}_show" not in st.session_state:
             st.session_state[f"{t}_show"] = False
 
-    if "t5_prob" not in st.session_state:
-        st.session_state["t5_prob"] = gen_tab5_points()
     if "t5_stage" not in st.session_state:
         st.session_state["t5_stage"] = 0
 
     with tab1:
-        draw_tab(st.session_state["t1_prob"], st.session_state["t1_show"], "draw_easy", "t1")
+        draw_tab(probs["t1"], st.session_state["t1_show"], "draw_easy", "t1")
     with tab2:
-        draw_tab(st.session_state["t2_prob"], st.session_state["t2_show"], "draw_hard", "t2")
+        draw_tab(probs["t2"], st.session_state["t2_show"], "draw_hard", "t2")
     with tab3:
-        draw_tab(st.session_state["t3_prob"], st.session_state["t3_show"], "det_easy", "t3")
+        draw_tab(probs["t3"], st.session_state["t3_show"], "det_easy", "t3")
     with tab4:
-        draw_tab(st.session_state["t4_prob"], st.session_state["t4_show"], "det_hard", "t4")
+        draw_tab(probs["t4"], st.session_state["t4_show"], "det_hard", "t4")
 
     with tab5:
-        data = st.session_state["t5_prob"]
+        data = problem_pool.current("t5_prob", gen_tab5_points)
         stage = st.session_state["t5_stage"]
 
         st.subheader("Differenzenquotient aus drei Punkten")
@@ -276,10 +265,11 @@ def run():
 
         c1, c2 = st.columns(2)
         if c1.button("Lösung (Steigungen)", key="t5_sol1"):
+            fortschritt.loesung("t5_prob")
             st.session_state["t5_stage"] = 1
             st.rerun()
         if c2.button("Neues Beispiel", key="t5_new"):
-            st.session_state["t5_prob"] = gen_tab5_points()
+            problem_pool.renew("t5_prob", gen_tab5_points)
             st.session_state["t5_stage"] = 0
             st.rerun()
 
@@ -1,8 +1,15 @@
 # lineare_gleichungssysteme.py
 import streamlit as st
-import random
+import math
+import numpy as np
 from fractions import Fraction
 
+import antworten
+import fortschritt
+import latex_cache
+import problem_pool
+import wiederholung
+
 
 # ==========================================================
 #   HELPERS
@@ -35,21 +42,22 @@ def _solve_2x2(a, b, c, d, e, f):
     y = Fraction(a*f - c*d, det)
     return x, y
 
-def _rand_nonzero(lo, hi, exclude=None):
+def _rand_nonzero(rng, lo, hi, exclude=None):
     exclude = exclude or set()
     while True:
-        v = random.randint(lo, hi)
+        v = rng.randint(lo, hi)
         if v != 0 and v not in exclude:
             return v
 
-def _pick_name_gender():
+def _pick_name_gender(rng):
     male = ["Ben", "David", "Lukas", "Jonas", "Felix", "Max"]
     female = ["Anna", "Clara", "Eva", "Mia", "Sophie", "Lea"]
-    return (random.choice(male), "m") if random.random() < 0.5 else (random.choice(female), "w")
+    return (rng.choice(male), "m") if rng.random() < 0.5 else (rng.choice(female), "w")
 
 def _pronouns(g):
     return ("Er", "er") if g == "m" else ("Sie", "sie")
 
+@latex_cache.memoized
 def _latex_eq_axby(a, b, c):
     def part(coeff, var):
         if coeff == 1:
@@ -60,6 +68,7 @@ def _latex_eq_axby(a, b, c):
     left = f"{part(a,'x')} + {part(b,'y')}" if b > 0 else f"{part(a,'x')} - {part(abs(b),'y')}"
     return rf"{left} = {c}"
 
+@latex_cache.memoized
 def _latex_line_from_axby(a, b, c):
     # ax+by=c  -> y=mx+n or x=const
     if b != 0:
@@ -72,35 +81,120 @@ def _latex_line_from_axby(a, b, c):
     return rf"x = {_fmt_frac(x0)}"
 
 
+# ==========================================================
+#   EXAKTER LGS-LÖSER (n×n, BAREISS)
+# ==========================================================
+# Bruchfreie Gauß-Elimination: alle Zwischenwerte sind ganzzahlige
+# Unterdeterminanten, die Division durch den vorigen Pivot geht immer auf.
+# Damit wachsen die Zahlen nur wie die Determinante statt wie bei Brüchen
+# mit jedem Schritt. Fraction entsteht erst für das Ergebnis.
+
+def _integer_rows(A, rhs):
+    # erweiterte Matrix [A | rhs] als Liste von int-Zeilen
+    rows = [list(row) + [r] for row, r in zip(A, rhs)]
+    if all(type(v) is int for row in rows for v in row):
+        return rows  # schneller Pfad: schon ganzzahlig
+    out = []
+    for row in rows:
+        row = [Fraction(v) for v in row]
+        m = math.lcm(*(v.denominator for v in row))
+        out.append([int(v * m) for v in row])
+    return out
+
+def _bareiss(M):
+    """Bruchfreie Elimination von M (in place) -> Pivotspalten.
+
+    Zeilen unterhalb des Rangs sind danach 0; ein Pivot in der letzten
+    Spalte (rechte Seite) bedeutet ein widersprüchliches System.
+    """
+    rows, cols = len(M), len(M[0])
+    prev = 1
+    pivots = []
+    r = 0
+    for c in range(cols):
+        if r == rows:
+            break
+        p = next((i for i in range(r, rows) if M[i][c] != 0), None)
+        if p is None:
+            continue
+        M[r], M[p] = M[p], M[r]
+        piv, row_r = M[r][c], M[r]
+        for i in range(r + 1, rows):
+            row_i = M[i]
+            f = row_i[c]
+            for j in range(c + 1, cols):
+                row_i[j] = (row_i[j] * piv - f * row_r[j]) // prev
+            row_i[c] = 0
+        prev = piv
+        pivots.append(c)
+        r += 1
+    return pivots
+
+def _solve_nxn(A, rhs):
+    """Ax = rhs exakt lösen (A: m×n mit int/Fraction-Einträgen).
+
+    Rückgabe wie bei _solve_tab3: {"L": "one", "x": [Fraction, ...]},
+    {"L": "inf", "rank": r} oder {"L": "none"}.
+    """
+    n = len(A[0])
+    M = _integer_rows(A, rhs)
+    pivots = _bareiss(M)
+
+    if pivots and pivots[-1] == n:
+        return {"L": "none"}
+    if len(pivots) < n:
+        return {"L": "inf", "rank": len(pivots)}
+
+    # Rückwärts einsetzen, ganzzahlig: x_i = num_i / det (Cramer-Zähler)
+    det = M[n - 1][n - 1]
+    num = [0] * n
+    for i in range(n - 1, -1, -1):
+        s = det * M[i][n] - sum(M[i][j] * num[j] for j in range(i + 1, n))
+        num[i] = s // M[i][i]
+    return {"L": "one", "x": [Fraction(v, det) for v in num]}
+
+def _as_system(data):
+    # (A, rhs) zu den Aufgabenformen aus Tab 1 und Tab 3
+    kind = data[0]
+    if kind in ("A", "A3"):
+        a, b, c, d, e, f = data[-6:]
+        return [[a, b], [d, e]], [c, f]
+    if kind in ("B", "B3"):
+        _, a, b, c, d0 = data          # y = ax + b, y = cx + d0
+        return [[-a, 1], [-c, 1]], [b, d0]
+    _, a, b, c, d0, e0 = data          # C/C3: x = d0 + e0*y ; C3P: x - e0*y = d0
+    return [[a, b], [1, -e0]], [c, d0]
+
+
 # ==========================================================
 #   TAB 1 – EINDEUTIG LÖSBAR (3 FORMEN)
 # ==========================================================
 
-def _gen_unique_formA():
-    x0 = random.randint(-6, 6)
-    y0 = random.randint(-6, 6)
+def _gen_unique_formA(rng):
+    x0 = rng.randint(-6, 6)
+    y0 = rng.randint(-6, 6)
     if x0 == 0 and y0 == 0:
         x0 = 2
 
-    a = _rand_nonzero(-7, 7)
-    b = _rand_nonzero(-7, 7)
-    d = _rand_nonzero(-7, 7, exclude={a})
-    e = _rand_nonzero(-7, 7, exclude={b})
+    a = _rand_nonzero(rng, -7, 7)
+    b = _rand_nonzero(rng, -7, 7)
+    d = _rand_nonzero(rng, -7, 7, exclude={a})
+    e = _rand_nonzero(rng, -7, 7, exclude={b})
 
     while a*e - b*d == 0:
-        d = _rand_nonzero(-7, 7, exclude={a})
-        e = _rand_nonzero(-7, 7, exclude={b})
+        d = _rand_nonzero(rng, -7, 7, exclude={a})
+        e = _rand_nonzero(rng, -7, 7, exclude={b})
 
     c = a*x0 + b*y0
     f = d*x0 + e*y0
     return ("A", a, b, c, d, e, f)
 
-def _gen_unique_formB():
-    a = _rand_nonzero(-5, 5)
-    c = _rand_nonzero(-5, 5, exclude={a})
+def _gen_unique_formB(rng):
+    a = _rand_nonzero(rng, -5, 5)
+    c = _rand_nonzero(rng, -5, 5, exclude={a})
 
-    x0 = random.randint(-6, 6)
-    y0 = random.randint(-6, 6)
+    x0 = rng.randint(-6, 6)
+    y0 = rng.randint(-6, 6)
     if x0 == 0 and y0 == 0:
         y0 = 3
 
@@ -108,22 +202,22 @@ def _gen_unique_formB():
     d0 = y0 - c*x0
     return ("B", a, b, c, d0)
 
-def _gen_unique_formC():
-    x0 = random.randint(-6, 6)
-    y0 = random.randint(-6, 6)
+def _gen_unique_formC(rng):
+    x0 = rng.randint(-6, 6)
+    y0 = rng.randint(-6, 6)
     if x0 == 0 and y0 == 0:
         x0 = 4
 
-    a = _rand_nonzero(-7, 7)
-    b = _rand_nonzero(-7, 7)
+    a = _rand_nonzero(rng, -7, 7)
+    b = _rand_nonzero(rng, -7, 7)
 
-    e0 = random.choice([-3, -2, -1, 0, 1, 2, 3])
+    e0 = rng.choice([-3, -2, -1, 0, 1, 2, 3])
     d0 = x0 - e0*y0
     c = a*x0 + b*y0
 
     if a*e0 + b == 0:
         choices = [-3, -2, -1, 1, 2, 3]
-        random.shuffle(choices)
+        rng.shuffle(choices)
         for ee in choices:
             if a*ee + b != 0:
                 e0 = ee
@@ -132,16 +226,21 @@ def _gen_unique_formC():
 
     return ("C", a, b, c, d0, e0)
 
+def _gen_tab1(rng):
+    form = rng.choice(["A", "B", "C"])
+    return {"A": _gen_unique_formA, "B": _gen_unique_formB, "C": _gen_unique_formC}[form](rng)
+
+def _solve_tab1(data):
+    x, y = _solve_nxn(*_as_system(data))["x"]
+    return {"x": x, "y": y}
+
 def _tab1_unique():
     key = "lgs_tab1"
+    forms = [_gen_unique_formB, _gen_unique_formA, _gen_unique_formC]  # leicht -> schwer
     if st.button("Neues Beispiel", key="lgs_tab1_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        form = random.choice(["A", "B", "C"])
-        st.session_state[key] = {"A": _gen_unique_formA, "B": _gen_unique_formB, "C": _gen_unique_formC}[form]()
-
-    data = st.session_state[key]
+    data = wiederholung.current(key, forms)
 
     st.subheader("Eindeutig lösbares LGS")
     st.markdown("**Aufgabe:** Ermittle $x$ und $y$.")
@@ -150,35 +249,31 @@ def _tab1_unique():
         _, a, b, c, d, e, f = data
         st.latex(rf"\text{{I: }} {_latex_eq_axby(a,b,c)}")
         st.latex(rf"\text{{II: }} {_latex_eq_axby(d,e,f)}")
-        if st.button("Lösung anzeigen", key="lgs_tab1_sol"):
-            x, y = _solve_2x2(a, b, c, d, e, f)
-            st.latex(rf"x = {_fmt_frac(x)}, \quad y = {_fmt_frac(y)}")
 
     elif data[0] == "B":
         _, a, b, c, d0 = data
         st.latex(rf"\text{{I: }} y = {a}x + {b}")
         st.latex(rf"\text{{II: }} y = {c}x + {d0}")
-        if st.button("Lösung anzeigen", key="lgs_tab1_sol"):
-            x = Fraction(d0 - b, a - c)
-            y = Fraction(a, 1)*x + Fraction(b, 1)
-            st.latex(rf"x = {_fmt_frac(x)}, \quad y = {_fmt_frac(y)}")
 
     else:
         _, a, b, c, d0, e0 = data
         st.latex(rf"\text{{I: }} {_latex_eq_axby(a,b,c)}")
         st.latex(rf"\text{{II: }} x = {d0} + {e0}y")
-        if st.button("Lösung anzeigen", key="lgs_tab1_sol"):
-            y = Fraction(c - a*d0, a*e0 + b)
-            x = Fraction(d0, 1) + Fraction(e0, 1)*y
-            st.latex(rf"x = {_fmt_frac(x)}, \quad y = {_fmt_frac(y)}")
+
+    antworten.eingabe(key, "lgs.eindeutig", data, {"x": "x", "y": "y"})
+
+    if st.button("Lösung anzeigen", key="lgs_tab1_sol"):
+        fortschritt.loesung(key)
+        sol = _solve_tab1(data)
+        st.latex(rf"x = {_fmt_frac(sol['x'])}, \quad y = {_fmt_frac(sol['y'])}")
 
 
 # ==========================================================
 #   TAB 2 – TEXTBEISPIELE (PREISE / KÖPFE-BEINE)
 # ==========================================================
 
-def _gen_text_prices():
-    name, g = _pick_name_gender()
+def _gen_text_prices(rng):
+    name, g = _pick_name_gender(rng)
     _, subj = _pronouns(g)
 
     locals_ = [
@@ -188,24 +283,24 @@ def _gen_text_prices():
         ("Kebapstand", ["Döner", "Getränk"], (2.0, 10.0)),
         ("Bäckerei", ["Semmel", "Croissant"], (0.8, 3.5)),
     ]
-    place, (A, B), (pmin, pmax) = random.choice(locals_)
+    place, (A, B), (pmin, pmax) = rng.choice(locals_)
 
     def pick_price():
         steps = int((pmax - pmin) / 0.5)
-        return round(pmin + 0.5*random.randint(0, steps), 2)
+        return round(pmin + 0.5*rng.randint(0, steps), 2)
 
     pA = pick_price()
     pB = pick_price()
     while abs(pA - pB) < 1e-9:
         pB = pick_price()
 
-    a = random.randint(1, 4)
-    b = random.randint(1, 4)
-    d = random.randint(1, 4)
-    e = random.randint(1, 4)
+    a = rng.randint(1, 4)
+    b = rng.randint(1, 4)
+    d = rng.randint(1, 4)
+    e = rng.randint(1, 4)
     while a*e - b*d == 0:
-        d = random.randint(1, 4)
-        e = random.randint(1, 4)
+        d = rng.randint(1, 4)
+        e = rng.randint(1, 4)
 
     c = round(a*pA + b*pB, 2)
     f = round(d*pA + e*pB, 2)
@@ -217,30 +312,41 @@ def _gen_text_prices():
         "d": d, "e": e, "f": f
     }
 
-def _gen_text_animals():
+def _gen_text_animals(rng):
     animals4 = ["Kühe", "Schafe", "Pferde", "Lamas", "Ziegen"]
     animals2 = ["Hühner", "Gänse", "Truthähne", "Pfaue"]
 
-    A4 = random.choice(animals4)
-    A2 = random.choice(animals2)
+    A4 = rng.choice(animals4)
+    A2 = rng.choice(animals2)
 
-    x = random.randint(3, 20)
-    y = random.randint(3, 30)
+    x = rng.randint(3, 20)
+    y = rng.randint(3, 30)
 
     heads = x + y
     legs = 4*x + 2*y
 
     return {"type": "animals", "A4": A4, "A2": A2, "heads": heads, "legs": legs, "x": x, "y": y}
 
+def _gen_tab2(rng):
+    return rng.choice([_gen_text_prices, _gen_text_animals])(rng)
+
+def _solve_tab2(data):
+    if data["type"] == "prices":
+        # in Cent rechnen, damit die Brüche exakt bleiben
+        c_cent = int(round(data["c"]*100))
+        f_cent = int(round(data["f"]*100))
+        x_cent, y_cent = _solve_2x2(data["a"], data["b"], c_cent, data["d"], data["e"], f_cent)
+        return {"x_cent": x_cent, "y_cent": y_cent}
+    x = Fraction(data["legs"] - 2*data["heads"], 2)
+    y = Fraction(data["heads"], 1) - x
+    return {"x": x, "y": y}
+
 def _tab2_text():
     key = "lgs_tab2"
     if st.button("Neues Beispiel", key="lgs_tab2_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        st.session_state[key] = random.choice([_gen_text_prices(), _gen_text_animals()])
-
-    data = st.session_state[key]
+    data = problem_pool.current(key, _gen_tab2)
     st.subheader("Textaufgaben")
 
     if data["type"] == "prices":
@@ -256,15 +362,17 @@ def _tab2_text():
             f"**Aufgabe:** Ermittle den Preis des jeweiligen Produkts."
         )
 
+        antworten.eingabe(key, "lgs.text", data, {"x_cent": f"{A} (€)", "y_cent": f"{B} (€)"})
+
         if st.button("Lösung anzeigen", key="lgs_tab2_sol"):
+            fortschritt.loesung(key)
             st.markdown("**a) LGS aufstellen**")
             st.latex(rf"\text{{I: }} {a}x + {b}y = {_fmt_money_2(c)}")
             st.latex(rf"\text{{II: }} {d}x + {e}y = {_fmt_money_2(f)}")
 
             st.markdown("**b) LGS lösen**")
-            c_cent = int(round(c*100))
-            f_cent = int(round(f*100))
-            x_cent, y_cent = _solve_2x2(a, b, c_cent, d, e, f_cent)
+            sol = _solve_tab2(data)
+            x_cent, y_cent = sol["x_cent"], sol["y_cent"]
             st.latex(rf"x = {_fmt_frac(x_cent)}\text{{ Cent}}, \quad y = {_fmt_frac(y_cent)}\text{{ Cent}}")
 
             st.markdown("**c) Lösung interpretieren**")
@@ -281,14 +389,17 @@ def _tab2_text():
             f"**Aufgabe:** Ermittle die Anzahl der jeweiligen Tiere."
         )
 
+        antworten.eingabe(key, "lgs.text", data, {"x": A4, "y": A2})
+
         if st.button("Lösung anzeigen", key="lgs_tab2_sol"):
+            fortschritt.loesung(key)
             st.markdown("**a) LGS aufstellen**")
             st.latex(rf"\text{{I: }} x + y = {heads}")
             st.latex(rf"\text{{II: }} 4x + 2y = {legs}")
 
             st.markdown("**b) LGS lösen**")
-            x = Fraction(legs - 2*heads, 2)
-            y = Fraction(heads, 1) - x
+            sol = _solve_tab2(data)
+            x, y = sol["x"], sol["y"]
             st.latex(rf"x = {_fmt_frac(x)}, \quad y = {_fmt_frac(y)}")
 
             st.markdown("**c) Lösung interpretieren**")
@@ -299,102 +410,110 @@ def _tab2_text():
 #   TAB 3 – LÖSUNGSMENGE + GRAFIK-KONTEXT
 # ==========================================================
 
-def _gen_solution_type_formA_complex():
+def _gen_solution_type_formA_complex(rng):
     # returns ("A3", soltype, a,b,c,d,e,f)
-    soltype = random.choice(["one", "none", "inf"])
+    soltype = rng.choice(["one", "none", "inf"])
 
-    a = _rand_nonzero(-6, 6)
-    b = _rand_nonzero(-6, 6)
+    a = _rand_nonzero(rng, -6, 6)
+    b = _rand_nonzero(rng, -6, 6)
 
     if soltype == "one":
-        d = _rand_nonzero(-6, 6)
-        e = _rand_nonzero(-6, 6)
+        d = _rand_nonzero(rng, -6, 6)
+        e = _rand_nonzero(rng, -6, 6)
         while a*e - b*d == 0:
-            d = _rand_nonzero(-6, 6)
-            e = _rand_nonzero(-6, 6)
-        x0 = random.randint(-5, 5)
-        y0 = random.randint(-5, 5)
+            d = _rand_nonzero(rng, -6, 6)
+            e = _rand_nonzero(rng, -6, 6)
+        x0 = rng.randint(-5, 5)
+        y0 = rng.randint(-5, 5)
         c = a*x0 + b*y0
         f = d*x0 + e*y0
         return ("A3", soltype, a, b, c, d, e, f)
 
     # complex: II is a multiple of I (and for "none" constant differs)
-    k = random.choice([2, 3, -2, -3, 4, -4])
-    x0 = random.randint(-5, 5)
-    y0 = random.randint(-5, 5)
+    k = rng.choice([2, 3, -2, -3, 4, -4])
+    x0 = rng.randint(-5, 5)
+    y0 = rng.randint(-5, 5)
     c = a*x0 + b*y0
 
     d, e = k*a, k*b
-    f = k*c if soltype == "inf" else k*c + random.choice([1, -1, 2, -2, 3, -3])
+    f = k*c if soltype == "inf" else k*c + rng.choice([1, -1, 2, -2, 3, -3])
 
     return ("A3", soltype, a, b, c, d, e, f)
 
-def _gen_solution_type_formB():
+def _gen_solution_type_formB(rng):
     # returns ("B3", a,b,c,d0)
-    soltype = random.choice(["one", "none", "inf"])
+    soltype = rng.choice(["one", "none", "inf"])
 
     if soltype == "one":
-        a = _rand_nonzero(-5, 5)
-        c = _rand_nonzero(-5, 5, exclude={a})
-        x0 = random.randint(-5, 5)
-        y0 = random.randint(-5, 5)
+        a = _rand_nonzero(rng, -5, 5)
+        c = _rand_nonzero(rng, -5, 5, exclude={a})
+        x0 = rng.randint(-5, 5)
+        y0 = rng.randint(-5, 5)
         b = y0 - a*x0
         d0 = y0 - c*x0
         return ("B3", a, b, c, d0)
 
-    a = _rand_nonzero(-5, 5)
-    b = random.randint(-6, 6)
+    a = _rand_nonzero(rng, -5, 5)
+    b = rng.randint(-6, 6)
 
     if soltype == "inf":
         c, d0 = a, b
     else:
-        c, d0 = a, b + random.choice([1, -1, 2, -2, 3])
+        c, d0 = a, b + rng.choice([1, -1, 2, -2, 3])
 
     return ("B3", a, b, c, d0)
 
-def _gen_solution_type_formC():
+def _gen_solution_type_formC(rng):
     # returns ("C3", a,b,c,d0,e0) or ("C3P", a,b,c1,d0,e0) for parallel/same construction
-    soltype = random.choice(["one", "none", "inf"])
+    soltype = rng.choice(["one", "none", "inf"])
 
-    a = _rand_nonzero(-6, 6)
-    b = _rand_nonzero(-6, 6)
+    a = _rand_nonzero(rng, -6, 6)
+    b = _rand_nonzero(rng, -6, 6)
 
     if soltype == "one":
-        e0 = random.choice([-3, -2, -1, 0, 1, 2, 3])
+        e0 = rng.choice([-3, -2, -1, 0, 1, 2, 3])
         while a*e0 + b == 0:
-            e0 = random.choice([-3, -2, -1, 1, 2, 3])
+            e0 = rng.choice([-3, -2, -1, 1, 2, 3])
 
-        x0 = random.randint(-5, 5)
-        y0 = random.randint(-5, 5)
+        x0 = rng.randint(-5, 5)
+        y0 = rng.randint(-5, 5)
         c = a*x0 + b*y0
         d0 = x0 - e0*y0
         return ("C3", a, b, c, d0, e0)
 
     # build II: x - e y = d0 ; I is multiple of that (complex)
-    e0 = random.choice([-3, -2, -1, 1, 2, 3])
-    d0 = random.randint(-6, 6)
-    k = random.choice([2, 3, -2, -3, 4, -4])
+    e0 = rng.choice([-3, -2, -1, 1, 2, 3])
+    d0 = rng.randint(-6, 6)
+    k = rng.choice([2, 3, -2, -3, 4, -4])
 
     a1, b1, c1 = k*1, k*(-e0), k*d0
     if soltype == "inf":
         return ("C3P", a1, b1, c1, d0, e0)
-    return ("C3P", a1, b1, c1 + random.choice([1, -1, 2, -2, 3]), d0, e0)
+    return ("C3P", a1, b1, c1 + rng.choice([1, -1, 2, -2, 3]), d0, e0)
+
+def _gen_tab3(rng):
+    form = rng.choice(["A", "B", "C"])
+    if form == "A":
+        return _gen_solution_type_formA_complex(rng)
+    if form == "B":
+        return _gen_solution_type_formB(rng)
+    return _gen_solution_type_formC(rng)
+
+def _solve_tab3(data):
+    # {"L": "one", "x": .., "y": ..} | {"L": "inf"} | {"L": "none"}
+    sol = _solve_nxn(*_as_system(data))
+    if sol["L"] == "one":
+        x, y = sol["x"]
+        return {"L": "one", "x": x, "y": y}
+    return {"L": sol["L"]}
 
 def _tab3_solution_set():
     key = "lgs_tab3"
+    forms = [_gen_solution_type_formB, _gen_solution_type_formA_complex, _gen_solution_type_formC]
     if st.button("Neues Beispiel", key="lgs_tab3_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        form = random.choice(["A", "B", "C"])
-        if form == "A":
-            st.session_state[key] = _gen_solution_type_formA_complex()
-        elif form == "B":
-            st.session_state[key] = _gen_solution_type_formB()
-        else:
-            st.session_state[key] = _gen_solution_type_formC()
-
-    data = st.session_state[key]
+    data = wiederholung.current(key, forms)
     st.subheader("Lösungsmenge + grafischer Kontext")
     st.markdown("**Aufgabe:** Ermittle die Lösungsmenge. Gib auch die Bedeutung im grafischen Kontext an.")
 
@@ -406,14 +525,14 @@ def _tab3_solution_set():
         st.latex(rf"\text{{II: }} {_latex_eq_axby(d,e,f)}")
 
         if st.button("Lösung anzeigen", key="lgs_tab3_sol"):
-            det = a*e - b*d
-            if det != 0:
-                x, y = _solve_2x2(a, b, c, d, e, f)
+            fortschritt.loesung(key)
+            sol = _solve_tab3(data)
+            if sol["L"] == "one":
+                x, y = sol["x"], sol["y"]
                 st.latex(rf"L = \left\{{\left({_fmt_frac(x)}/{_fmt_frac(y)}\right)\right\}}")
                 st.success("Grafisch: zwei Geraden schneiden sich in genau **einem** Punkt.")
             else:
-                inf = (a*f - c*d == 0) and (b*f - c*e == 0)
-                if inf:
+                if sol["L"] == "inf":
                     line = _latex_line_from_axby(a, b, c)
                     st.latex(rf"L = \left\{{(x/y)\in\mathbb{{R}}^2 \mid {line}\right\}}")
                     st.success("Grafisch: **dieselbe** Gerade → unendlich viele Lösungen.")
@@ -427,13 +546,14 @@ def _tab3_solution_set():
         st.latex(rf"\text{{II: }} y = {c}x + {d0}")
 
         if st.button("Lösung anzeigen", key="lgs_tab3_sol"):
-            if a != c:
-                x = Fraction(d0 - b, a - c)
-                y = Fraction(a, 1)*x + Fraction(b, 1)
+            fortschritt.loesung(key)
+            sol = _solve_tab3(data)
+            if sol["L"] == "one":
+                x, y = sol["x"], sol["y"]
                 st.latex(rf"L = \left\{{\left({_fmt_frac(x)}/{_fmt_frac(y)}\right)\right\}}")
                 st.success("Grafisch: Geraden mit **verschiedenen Steigungen** → Schnittpunkt.")
             else:
-                if b == d0:
+                if sol["L"] == "inf":
                     st.latex(rf"L = \left\{{(x/y)\in\mathbb{{R}}^2 \mid y = {a}x + {b}\right\}}")
                     st.success("Grafisch: **dieselbe** Gerade → unendlich viele Lösungen.")
                 else:
@@ -446,14 +566,14 @@ def _tab3_solution_set():
         st.latex(rf"\text{{II: }} x = {d0} + {e0}y")
 
         if st.button("Lösung anzeigen", key="lgs_tab3_sol"):
-            denom = a*e0 + b
-            if denom != 0:
-                y = Fraction(c - a*d0, denom)
-                x = Fraction(d0, 1) + Fraction(e0, 1)*y
+            fortschritt.loesung(key)
+            sol = _solve_tab3(data)
+            if sol["L"] == "one":
+                x, y = sol["x"], sol["y"]
                 st.latex(rf"L = \left\{{\left({_fmt_frac(x)}/{_fmt_frac(y)}\right)\right\}}")
                 st.success("Grafisch: zwei Geraden schneiden sich in genau **einem** Punkt.")
             else:
-                if c == a*d0:
+                if sol["L"] == "inf":
                     line = _latex_line_from_axby(a, b, c)
                     st.latex(rf"L = \left\{{(x/y)\in\mathbb{{R}}^2 \mid {line}\right\}}")
                     st.success("Grafisch: **dieselbe** Gerade → unendlich viele Lösungen.")
@@ -467,9 +587,8 @@ def _tab3_solution_set():
         st.latex(rf"\text{{II: }} x - ({e0})y = {d0}")
 
         if st.button("Lösung anzeigen", key="lgs_tab3_sol"):
-            # both are parallel/same by construction
-            same_dir = (a * (-e0) == b)
-            if same_dir and (a*d0 == c1):
+            fortschritt.loesung(key)
+            if _solve_tab3(data)["L"] == "inf":
                 line = _latex_line_from_axby(a, b, c1)
                 st.latex(rf"L = \left\{{(x/y)\in\mathbb{{R}}^2 \mid {line}\right\}}")
                 st.success("Grafisch: **dieselbe** Gerade → unendlich viele Lösungen.")
@@ -478,6 +597,127 @@ def _tab3_solution_set():
                 st.success("Grafisch: **parallele** Geraden → keine Lösung.")
 
 
+# ==========================================================
+#   3 UNBEKANNTE (Arbeitsblätter)
+# ==========================================================
+
+def _gen_unique_3x3(rng):
+    # ganzzahlige Lösung, Koeffizienten -5..5, Matrix regulär
+    sol = [rng.randint(-5, 5) for _ in range(3)]
+    while True:
+        A = [[rng.randint(-5, 5) for _ in range(3)] for __ in range(3)]
+        if _solve_nxn(A, [0, 0, 0])["L"] == "one":
+            break
+    rhs = [sum(a*x for a, x in zip(row, sol)) for row in A]
+    return ("3x3", tuple(map(tuple, A)), tuple(rhs))
+
+def _solve_3x3(data):
+    x, y, z = _solve_nxn(data[1], data[2])["x"]
+    return {"x": x, "y": y, "z": z}
+
+
+# ==========================================================
+#   STAPEL (vektorisiert) – FORM A / A3
+# ==========================================================
+# Für große Pools und Schularbeits-Sätze (arbeitsblatt.py): Koeffizienten
+# für tausende Systeme auf einmal ziehen, singuläre Systeme über die
+# vektorisierte Determinante aussortieren und nur diese neu ziehen.
+# Lösungen exakt mit Ganzzahlen (Cramer + ggT); Fraction nur für die Ausgabe.
+# Rückgabe wie bei den Generatoren/_solve_tab*, als (aufgaben, lösungen).
+
+def _np_nonzero(g, lo, hi, size):
+    # gleichverteilt auf lo..hi ohne 0 (lo < 0 < hi)
+    v = g.integers(lo, hi, size)
+    return v + (v >= 0)
+
+def _np_reduce(num, den):
+    # num/den kürzen, Nenner positiv; den == 0 bleibt 0
+    g = np.gcd(num, den)
+    g = np.where(g == 0, 1, g) * np.where(den < 0, -1, 1)
+    return num // g, den // g
+
+def _np_cramer_2x2(a, b, c, d, e, f):
+    """Gekürzte Lösungen (x_num, x_den, y_num, y_den) für ax+by=c, dx+ey=f; singulär: den == 0."""
+    det = a*e - b*d
+    xn, xd = _np_reduce(c*e - b*f, det)
+    yn, yd = _np_reduce(a*f - c*d, det)
+    return xn, xd, yn, yd
+
+def _np_redraw_singular(g, a, b, d, e, lo, hi, idx, exclude_ab=False):
+    # d, e an den Stellen idx ziehen, bis a*e - b*d != 0 (optional d != a, e != b)
+    while idx.size:
+        d[idx] = _np_nonzero(g, lo, hi, idx.size)
+        e[idx] = _np_nonzero(g, lo, hi, idx.size)
+        bad = a[idx]*e[idx] - b[idx]*d[idx] == 0
+        if exclude_ab:
+            bad |= (d[idx] == a[idx]) | (e[idx] == b[idx])
+        idx = idx[bad]
+
+def _batch_unique_formA(rng, count):
+    g = np.random.default_rng(rng.getrandbits(64))
+    x0 = g.integers(-6, 7, count)
+    y0 = g.integers(-6, 7, count)
+    x0[(x0 == 0) & (y0 == 0)] = 2
+
+    a = _np_nonzero(g, -7, 7, count)
+    b = _np_nonzero(g, -7, 7, count)
+    d = np.zeros(count, dtype=np.int64)
+    e = np.zeros(count, dtype=np.int64)
+    _np_redraw_singular(g, a, b, d, e, -7, 7, np.arange(count), exclude_ab=True)
+
+    c = a*x0 + b*y0
+    f = d*x0 + e*y0
+    xn, xd, yn, yd = _np_cramer_2x2(a, b, c, d, e, f)
+
+    cols = [v.tolist() for v in (a, b, c, d, e, f)]
+    problems = [("A", *row) for row in zip(*cols)]
+    solutions = [
+        {"x": Fraction(*x), "y": Fraction(*y)}
+        for x, y in zip(zip(xn.tolist(), xd.tolist()), zip(yn.tolist(), yd.tolist()))
+    ]
+    return problems, solutions
+
+SOLTYPES = np.array(["one", "none", "inf"])
+
+def _batch_solution_type_formA_complex(rng, count):
+    g = np.random.default_rng(rng.getrandbits(64))
+    soltype = SOLTYPES[g.integers(0, 3, count)]
+    one = soltype == "one"
+
+    a = _np_nonzero(g, -6, 6, count)
+    b = _np_nonzero(g, -6, 6, count)
+    x0 = g.integers(-5, 6, count)
+    y0 = g.integers(-5, 6, count)
+    c = a*x0 + b*y0
+
+    # "one": eigene zweite Gleichung mit det != 0
+    d = np.zeros(count, dtype=np.int64)
+    e = np.zeros(count, dtype=np.int64)
+    _np_redraw_singular(g, a, b, d, e, -6, 6, np.flatnonzero(one))
+    f = d*x0 + e*y0
+
+    # "none"/"inf": II ist ein Vielfaches von I (bei "none" mit anderer Konstante)
+    k = np.array([2, 3, -2, -3, 4, -4])[g.integers(0, 6, count)]
+    shift = np.array([1, -1, 2, -2, 3, -3])[g.integers(0, 6, count)]
+    d = np.where(one, d, k*a)
+    e = np.where(one, e, k*b)
+    f = np.where(one, f, k*c + np.where(soltype == "none", shift, 0))
+
+    xn, xd, yn, yd = _np_cramer_2x2(a, b, c, d, e, f)
+    inf = (a*f - c*d == 0) & (b*f - c*e == 0)
+
+    cols = [v.tolist() for v in (a, b, c, d, e, f)]
+    problems = [("A3", t, *row) for t, row in zip(soltype.tolist(), zip(*cols))]
+    solutions = []
+    for is_one, is_inf, x, y in zip((xd != 0).tolist(), inf.tolist(),
+                                    zip(xn.tolist(), xd.tolist()), zip(yn.tolist(), yd.tolist())):
+        if is_one:
+            solutions.append({"L": "one", "x": Fraction(*x), "y": Fraction(*y)})
+        else:
+            solutions.append({"L": "inf" if is_inf else "none"})
+    return problems, solutions
+
+
 # ==========================================================
 #   RUN
 # ==========================================================
@@ -1,18 +1,48 @@
 # main.py
+import importlib
+
 import streamlit as st
 
-import funktionen_allgemein
-import lineare_funktionen
-import lineare_gleichungssysteme
-import matrizen
-import quadratische_funktionen
-import trigonometrie
-import exponentialfunktionen
-import aenderungsmass
-import exponentialgleichungen
-import beschraenkte_zu_abnahme
-import zinseszins
-import rentenrechnung
+# =========================
+#   KAPITEL-REGISTRY
+# =========================
+# Seitentitel -> Modulname. Ein Kapitel (und mit ihm matplotlib, numpy,
+# pandas) wird erst importiert, wenn seine Seite zum ersten Mal gewählt wird.
+CHAPTERS = {
+    "Funktionen allgemein": "funktionen_allgemein",
+    "Lineare Funktionen": "lineare_funktionen",
+    "Lineare Gleichungssysteme": "lineare_gleichungssysteme",
+    "Matrizen": "matrizen",
+    "Quadratische Funktionen": "quadratische_funktionen",
+    "Trigonometrie": "trigonometrie",
+    "Exponentialfunktionen": "exponentialfunktionen",
+    "Änderungsmaße": "aenderungsmass",
+    "Exponentialgleichungen": "exponentialgleichungen",
+    "Beschränkte Zu-/Abnahme": "beschraenkte_zu_abnahme",
+    "Zinseszins": "zinseszins",
+    "Rentenrechnung": "rentenrechnung",
+}
+
+# Kapitel mit Graphen -> Darstellung (siehe plotting.BACKENDS). Zum
+# Vergleichen kann sie in der Seitenleiste je Kapitel umgestellt werden.
+PLOT_BACKENDS = {
+    "funktionen_allgemein": "png",
+    "lineare_funktionen": "png",
+    "exponentialfunktionen": "png",
+    "beschraenkte_zu_abnahme": "png",
+    "zinseszins": "png",
+}
+PLOT_CHOICES_KEY = "plot_backend_choices"
+
+UEBERSICHT = "📊 Übersicht (Lehrkräfte)"
+
+
+@st.cache_resource(show_spinner=False)
+def load_chapter(module_name: str):
+    module = importlib.import_module(module_name)
+    import aufgabenraum  # erst mit dem ersten Kapitel (numpy)
+    aufgabenraum.prepare(module_name)
+    return module
 
 
 st.set_page_config(
@@ -23,23 +53,20 @@ st.set_page_config(
 
 st.sidebar.title("Navigation")
 
+st.sidebar.text_input(
+    "Dein Name",
+    key="student",  # fortschritt.STUDENT_KEY
+    help="Damit deine Lehrkraft deinen Fortschritt sieht. Leer lassen = anonym.",
+)
+st.sidebar.text_input(
+    "Klasse (optional)",
+    key="klasse",  # gesehen.KLASSE_KEY
+    help="Innerhalb einer Klasse bekommt möglichst niemand eine Aufgabe doppelt.",
+)
+
 page = st.sidebar.radio(
     "Kapitel",
-    [
-        "🏠 Start",
-        "Funktionen allgemein",
-        "Lineare Funktionen",
-        "Lineare Gleichungssysteme",
-        "Matrizen",
-        "Quadratische Funktionen",
-        "Trigonometrie",
-        "Exponentialfunktionen",
-        "Änderungsmaße",
-        "Exponentialgleichungen",
-        "Beschränkte Zu-/Abnahme",
-        "Zinseszins",
-        "Rentenrechnung",
-    ]
+    ["🏠 Start", *CHAPTERS, UEBERSICHT],
 )
 
 # =========================
@@ -56,6 +83,8 @@ if page == "🏠 Start":
         Bei jedem Beispiel kannst du über die Schaltflächen  
         *„Lösung anzeigen“* und *„Neues Beispiel“* selbstständig üben,
         vergleichen und beliebig viele neue Aufgaben generieren.
+        Bei vielen Aufgaben kannst du dein Ergebnis auch eintippen und
+        mit *„Antwort prüfen“* kontrollieren.
 
         Wenn du Fragen hast oder dir irgendwo ein Fehler auffällt,
         kannst du mich jederzeit über den **Chat auf Microsoft Teams** erreichen.
@@ -63,40 +92,32 @@ if page == "🏠 Start":
     )
 
 # =========================
-#   KAPITEL
+#   ÜBERSICHT (Lehrkräfte)
 # =========================
-elif page == "Funktionen allgemein":
-    funktionen_allgemein.run()
-
-elif page == "Lineare Funktionen":
-    lineare_funktionen.run()
-
-elif page == "Lineare Gleichungssysteme":
-    lineare_gleichungssysteme.run()
-
-elif page == "Matrizen":
-    matrizen.run()
+elif page == UEBERSICHT:
+    import uebersicht
 
-elif page == "Quadratische Funktionen":
-    quadratische_funktionen.run()
+    uebersicht.run(CHAPTERS)
 
-elif page == "Trigonometrie":
-    trigonometrie.run()
-
-elif page == "Exponentialfunktionen":
-    exponentialfunktionen.run()
-
-elif page == "Änderungsmaße":
-    aenderungsmass.run()
-
-elif page == "Exponentialgleichungen":
-    exponentialgleichungen.run()
-
-elif page == "Beschränkte Zu-/Abnahme":
-    beschraenkte_zu_abnahme.run()
-
-elif page == "Zinseszins":
-    zinseszins.run()
-
-elif page == "Rentenrechnung":
-    rentenrechnung.run()
+# =========================
+#   KAPITEL
+# =========================
+else:
+    module = CHAPTERS[page]
+    chapter = load_chapter(module)
+
+    if module in PLOT_BACKENDS:
+        import plotting  # vom Kapitel bereits geladen
+
+        choices = st.session_state.setdefault(PLOT_CHOICES_KEY, dict(PLOT_BACKENDS))
+        options = list(plotting.BACKENDS)
+        choices[module] = st.sidebar.radio(
+            "Graphen",
+            options,
+            index=options.index(choices[module]),
+            format_func=plotting.BACKENDS.get,
+            key=f"plot_backend_{module}",
+        )
+        st.session_state[plotting.BACKEND_KEY] = choices[module]
+
+    chapter.run()
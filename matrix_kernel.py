@@ -0,0 +1,182 @@
+# matrix_kernel.py
+import math
+from fractions import Fraction
+
+import numpy as np
+
+
+# ==========================================================
+#   MATRIX-KERN (int64 schnell, sonst exakt)
+# ==========================================================
+# Ganzzahlige Matrizen liegen als int64-Arrays vor und werden mit NumPy
+# gerechnet. Sobald ein Ergebnis int64 sprengen könnte, oder wenn Brüche
+# vorkommen, wird auf object-Arrays mit Python-int/Fraction umgeschaltet
+# (beliebige Genauigkeit, exakt). Die Schranken werden vorab über die
+# Beträge geprüft, es gibt also keinen stillen Überlauf.
+
+INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+def as_array(M):
+    """Matrix (Listen/Tupel oder Array) -> int64-Array oder exaktes object-Array."""
+    if isinstance(M, np.ndarray):
+        if M.dtype == np.int64 or M.dtype == object:
+            return M
+        if M.dtype.kind in "iu" and M.dtype.itemsize < 8:
+            return M.astype(np.int64)
+        M = M.tolist()
+    rows = [list(row) for row in M]
+    if all(type(v) is int for row in rows for v in row):
+        try:
+            return np.array(rows, dtype=np.int64)
+        except OverflowError:
+            pass  # zu groß für int64 -> exakt
+    return np.array([[_exact(v) for v in row] for row in rows], dtype=object)
+
+
+def _exact(v):
+    if isinstance(v, (int, np.integer)):
+        return int(v)
+    v = Fraction(v)
+    return v.numerator if v.denominator == 1 else v
+
+
+def _to_object(A):
+    if A.dtype == object:
+        return A
+    return np.array([[int(v) for v in row] for row in A.tolist()], dtype=object)
+
+
+def _max_abs(A) -> int:
+    if A.size == 0:
+        return 0
+    if A.dtype == np.int64:
+        # Betrag als Python-int (abs(INT64_MIN) passt nicht in int64)
+        return max(-int(A.min()), int(A.max()))
+    return max(abs(v) for v in A.flat)
+
+
+def to_tuples(A):
+    """Ergebnis als Tupel von Tupeln mit Python-int/Fraction (für Anzeige und Session)."""
+    if A.dtype == np.int64:
+        return tuple(map(tuple, A.tolist()))
+    return tuple(tuple(_exact(v) for v in row) for row in A.tolist())
+
+
+def is_exact(A) -> bool:
+    """True, wenn A im exakten (object-)Modus ist."""
+    return A.dtype == object
+
+
+# ----------------- Grundrechenarten -----------------
+
+def add(A, B):
+    A, B = as_array(A), as_array(B)
+    if A.shape != B.shape:
+        raise ValueError(f"Dimensionen passen nicht: {A.shape} + {B.shape}")
+    if A.dtype == np.int64 and B.dtype == np.int64 and _max_abs(A) + _max_abs(B) <= INT64_MAX:
+        return A + B
+    return _to_object(A) + _to_object(B)
+
+
+def mul(A, B):
+    A, B = as_array(A), as_array(B)
+    if A.shape[1] != B.shape[0]:
+        raise ValueError(f"Dimensionen passen nicht: {A.shape} · {B.shape}")
+    if A.dtype == np.int64 and B.dtype == np.int64:
+        # |(AB)_ij| <= k * max|A| * max|B|
+        if A.shape[1] * _max_abs(A) * _max_abs(B) <= INT64_MAX:
+            return A @ B
+    return _to_object(A) @ _to_object(B)
+
+
+def power(A, k: int):
+    """A^k durch wiederholtes Quadrieren; k < 0 über die Inverse."""
+    A = as_array(A)
+    n, m = A.shape
+    if n != m:
+        raise ValueError("Potenz nur für quadratische Matrizen")
+    if k < 0:
+        return power(inverse(A), -k)
+    result = np.eye(n, dtype=np.int64) if A.dtype == np.int64 else _to_object(np.eye(n, dtype=np.int64))
+    base = A
+    while k:
+        if k & 1:
+            result = mul(result, base)
+        k >>= 1
+        if k:
+            base = mul(base, base)
+    return result
+
+
+# ----------------- Determinante / Inverse (Bareiss) -----------------
+
+def _integer_rows(A):
+    # Zeilen ganzzahlig machen; Rückgabe (Zeilen, Zeilenfaktoren)
+    if A.dtype == np.int64:
+        return A.tolist(), [1] * A.shape[0]  # schneller Pfad
+    rows, factors = [], []
+    for row in A.tolist():
+        m = math.lcm(*(Fraction(v).denominator for v in row)) if row else 1
+        rows.append([int(v * m) for v in row])
+        factors.append(m)
+    return rows, factors
+
+
+def _bareiss(M, n):
+    # bruchfreie Elimination der ersten n Spalten (in place); -> (det, regulär)
+    prev, sign = 1, 1
+    cols = len(M[0])
+    for c in range(n):
+        p = next((i for i in range(c, n) if M[i][c] != 0), None)
+        if p is None:
+            return 0, False
+        if p != c:
+            M[c], M[p] = M[p], M[c]
+            sign = -sign
+        piv, row_c = M[c][c], M[c]
+        for i in range(c + 1, n):
+            row_i = M[i]
+            f = row_i[c]
+            for j in range(c + 1, cols):
+                row_i[j] = (row_i[j] * piv - f * row_c[j]) // prev
+            row_i[c] = 0
+        prev = piv
+    return sign * M[n - 1][n - 1], True
+
+
+def det(A):
+    """Exakte Determinante (int oder Fraction)."""
+    A = as_array(A)
+    n, m = A.shape
+    if n != m:
+        raise ValueError("Determinante nur für quadratische Matrizen")
+    if n == 0:
+        return 1
+    rows, factors = _integer_rows(A)
+    d, _ = _bareiss(rows, n)
+    return _exact(Fraction(d, math.prod(factors)))
+
+
+def inverse(A):
+    """Exakte Inverse als object-Array; ValueError, wenn A singulär ist."""
+    A = as_array(A)
+    n, m = A.shape
+    if n != m:
+        raise ValueError("Inverse nur für quadratische Matrizen")
+    # mit D = diag(Zeilenfaktoren): (D·A)·X = D  <=>  X = A^-1
+    rows, factors = _integer_rows(A)
+    M = [row + [factors[i] if j == i else 0 for j in range(n)] for i, row in enumerate(rows)]
+    _, regular = _bareiss(M, n)
+    if not regular:
+        raise ValueError("Matrix ist singulär")
+
+    # Rückwärts einsetzen je Spalte, ganzzahlig über den letzten Pivot
+    last = M[n - 1][n - 1]
+    X = [[0] * n for _ in range(n)]
+    for col in range(n):
+        for i in range(n - 1, -1, -1):
+            s = last * M[i][n + col] - sum(M[i][j] * X[j][col] for j in range(i + 1, n))
+            X[i][col] = s // M[i][i]
+    return np.array([[_exact(Fraction(v, last)) for v in row] for row in X], dtype=object)
+
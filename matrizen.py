@@ -1,8 +1,13 @@
 # matrizen.py
 import streamlit as st
-import random
 from fractions import Fraction
 
+import antworten
+import fortschritt
+import latex_cache
+import matrix_kernel
+import problem_pool
+
 # ==========================================================
 #   HELPERS
 # ==========================================================
@@ -12,25 +17,23 @@ def _fmt_frac(x: Fraction) -> str:
         return str(x.numerator)
     return rf"\frac{{{x.numerator}}}{{{x.denominator}}}"
 
-def _mat(rows, cols, lo=-6, hi=9):
-    return [[random.randint(lo, hi) for _ in range(cols)] for __ in range(rows)]
+def _mat(rng, rows, cols, lo=-6, hi=9):
+    return [[rng.randint(lo, hi) for _ in range(cols)] for __ in range(rows)]
+
+def _frozen(M):
+    # Aufgaben werden zwischen Sessions geteilt -> unveränderliche Matrizen
+    return tuple(map(tuple, M))
 
 def _dims_str(A):
     return f"{len(A)}×{len(A[0])}"
 
 def _add(A, B):
-    return [[A[i][j] + B[i][j] for j in range(len(A[0]))] for i in range(len(A))]
+    return matrix_kernel.to_tuples(matrix_kernel.add(A, B))
 
 def _mul(A, B):
-    r, k = len(A), len(A[0])
-    k2, c = len(B), len(B[0])
-    assert k == k2
-    out = [[0 for _ in range(c)] for __ in range(r)]
-    for i in range(r):
-        for j in range(c):
-            out[i][j] = sum(A[i][t] * B[t][j] for t in range(k))
-    return out
+    return matrix_kernel.to_tuples(matrix_kernel.mul(A, B))
 
+@latex_cache.memoized
 def _latex_matrix(M, unknown=None):
     # unknown = (i,j,"x") or None
     lines = []
@@ -39,6 +42,8 @@ def _latex_matrix(M, unknown=None):
         for j, v in enumerate(row):
             if unknown and i == unknown[0] and j == unknown[1]:
                 parts.append(unknown[2])
+            elif isinstance(v, Fraction):
+                parts.append(_fmt_frac(v))
             else:
                 parts.append(str(v))
         lines.append(" & ".join(parts))
@@ -50,24 +55,25 @@ def _latex_matrix(M, unknown=None):
 #   TAB 1 – MATRIX-ADDITION
 # ==========================================================
 
+def _gen_add(rng):
+    n = rng.choice([2, 3])
+    A = _mat(rng, n, n, -6, 9)
+    B = _mat(rng, n, n, -6, 9)
+    return (_frozen(A), _frozen(B))
+
 def _tab_add():
     key = "mat_add"
     if st.button("Neues Beispiel", key="mat_add_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        n = random.choice([2, 3])
-        A = _mat(n, n, -6, 9)
-        B = _mat(n, n, -6, 9)
-        st.session_state[key] = (A, B)
-
-    A, B = st.session_state[key]
+    A, B = problem_pool.current(key, _gen_add)
 
     st.subheader("Matrix-Addition")
     st.markdown("**Aufgabe:** Ermittle das Ergebnis der Addition.")
     st.latex(rf"{_latex_matrix(A)} + {_latex_matrix(B)} = \ ?")
 
     if st.button("Lösung anzeigen", key="mat_add_sol"):
+        fortschritt.loesung(key)
         st.latex(rf"{_latex_matrix(_add(A,B))}")
 
 
@@ -75,28 +81,28 @@ def _tab_add():
 #   TAB 2 – MATRIX-MULTIPLIKATION I
 # ==========================================================
 
-def _tab_mul():
-    key = "mat_mul"
-    if st.button("Neues Beispiel", key="mat_mul_new"):
-        st.session_state.pop(key, None)
+def _gen_mul(rng):
+    r = rng.randint(1, 3)
+    k = rng.randint(1, 3)
+    c = rng.randint(1, 3)
 
-    if key not in st.session_state:
-        r = random.randint(1, 3)
-        k = random.randint(1, 3)
-        c = random.randint(1, 3)
+    A = _mat(rng, r, k, -4, 6)
 
-        A = _mat(r, k, -4, 6)
+    # 50% möglich / 50% nicht möglich
+    if rng.random() < 0.5:
+        B = _mat(rng, k, c, -4, 6)  # möglich
+    else:
+        k_wrong = rng.choice([x for x in [1, 2, 3] if x != k])
+        B = _mat(rng, k_wrong, c, -4, 6)  # nicht möglich
 
-        # 50% möglich / 50% nicht möglich
-        if random.random() < 0.5:
-            B = _mat(k, c, -4, 6)  # möglich
-        else:
-            k_wrong = random.choice([x for x in [1, 2, 3] if x != k])
-            B = _mat(k_wrong, c, -4, 6)  # nicht möglich
+    return (_frozen(A), _frozen(B))
 
-        st.session_state[key] = (A, B)
+def _tab_mul():
+    key = "mat_mul"
+    if st.button("Neues Beispiel", key="mat_mul_new"):
+        st.session_state.pop(key, None)
 
-    A, B = st.session_state[key]
+    A, B = problem_pool.current(key, _gen_mul)
 
     st.subheader("Matrix-Multiplikation I")
     st.markdown("**Aufgabe:** Falls möglich, ermittle das Ergebnis der Multiplikation.")
@@ -104,6 +110,7 @@ def _tab_mul():
     st.latex(rf"{_latex_matrix(A)}\cdot {_latex_matrix(B)} = \ ?")
 
     if st.button("Lösung anzeigen", key="mat_mul_sol"):
+        fortschritt.loesung(key)
         if len(A[0]) != len(B):
             st.error("Nicht definiert: Spaltenzahl der linken Matrix ≠ Zeilenzahl der rechten Matrix.")
         else:
@@ -115,69 +122,78 @@ def _tab_mul():
 #   Anzeige: A*B=C nur als Matrizen (keine Buchstaben)
 # ==========================================================
 
-def _tab_missing():
-    key = "mat_missing"
-    if st.button("Neues Beispiel", key="mat_missing_new"):
-        st.session_state.pop(key, None)
+def _gen_missing(rng):
+    # small and clean: (2x2)*(2x2) or (2x3)*(3x2)
+    r, k, c = rng.choice([(2, 2, 2), (2, 3, 2)])
+
+    A = _mat(rng, r, k, -4, 6)
+    B = _mat(rng, k, c, -4, 6)
+
+    # unknown in A at (i,j)
+    i = rng.randrange(r)
+    j = rng.randrange(k)
 
-    if key not in st.session_state:
-        # small and clean: (2x2)*(2x2) or (2x3)*(3x2)
-        r, k, c = random.choice([(2, 2, 2), (2, 3, 2)])
+    # use product entry (i, col)
+    col = rng.randrange(c)
 
-        A = _mat(r, k, -4, 6)
-        B = _mat(k, c, -4, 6)
+    # ensure coefficient B[j][col] != 0
+    tries = 0
+    while B[j][col] == 0 and tries < 30:
+        j = rng.randrange(k)
+        col = rng.randrange(c)
+        tries += 1
+    if B[j][col] == 0:
+        B[j][col] = rng.choice([-3, -2, -1, 1, 2, 3])
 
-        # unknown in A at (i,j)
-        i = random.randrange(r)
-        j = random.randrange(k)
+    x_true = rng.randint(-5, 5)
+    A[i][j] = x_true
+    Cmat = _mul(A, B)
 
-        # use product entry (i, col)
-        col = random.randrange(c)
+    # hide
+    A[i][j] = "x"
 
-        # ensure coefficient B[j][col] != 0
-        tries = 0
-        while B[j][col] == 0 and tries < 30:
-            j = random.randrange(k)
-            col = random.randrange(c)
-            tries += 1
-        if B[j][col] == 0:
-            B[j][col] = random.choice([-3, -2, -1, 1, 2, 3])
+    return {
+        "A": _frozen(A), "B": _frozen(B), "C": _frozen(Cmat),
+        "pos": (i, j), "use": (i, col),
+        "x_true": x_true
+    }
 
-        x_true = random.randint(-5, 5)
-        A[i][j] = x_true
-        Cmat = _mul(A, B)
+def _solve_missing(data):
+    A, B, Cmat = data["A"], data["B"], data["C"]
+    _, j = data["pos"]
+    ri, cj = data["use"]
+    coeff = B[j][cj]
+    rhs = Cmat[ri][cj]
 
-        # hide
-        A[i][j] = "x"
+    # rest = sum_{t!=j} A[ri][t]*B[t][cj]
+    rest = 0
+    for t in range(len(B)):
+        if t == j:
+            continue
+        rest += A[ri][t] * B[t][cj]
 
-        st.session_state[key] = {
-            "A": A, "B": B, "C": Cmat,
-            "pos": (i, j), "use": (i, col),
-            "x_true": x_true
-        }
+    return {"x": Fraction(rhs - rest, coeff), "coeff": coeff, "rest": rest, "rhs": rhs}
 
-    data = st.session_state[key]
+def _tab_missing():
+    key = "mat_missing"
+    if st.button("Neues Beispiel", key="mat_missing_new"):
+        st.session_state.pop(key, None)
+
+    data = problem_pool.current(key, _gen_missing)
     A, B, Cmat = data["A"], data["B"], data["C"]
     i, j = data["pos"]
-    ri, cj = data["use"]
     x_true = data["x_true"]
 
     st.subheader("Matrix-Multiplikation II")
     st.markdown("**Aufgabe:** Ermittle das fehlende Element.")
     st.latex(rf"{_latex_matrix(A, unknown=(i,j,'x'))}\cdot {_latex_matrix(B)} = {_latex_matrix(Cmat)}")
 
-    if st.button("Lösung anzeigen", key="mat_missing_sol"):
-        coeff = B[j][cj]
-        rhs = Cmat[ri][cj]
-
-        # rest = sum_{t!=j} A[ri][t]*B[t][cj]
-        rest = 0
-        for t in range(len(B)):
-            if t == j:
-                continue
-            rest += A[ri][t] * B[t][cj]
+    antworten.eingabe(key, "mat.fehlend", data, {"x": "x"})
 
-        x = Fraction(rhs - rest, coeff)
+    if st.button("Lösung anzeigen", key="mat_missing_sol"):
+        fortschritt.loesung(key)
+        sol = _solve_missing(data)
+        x, coeff, rest, rhs = sol["x"], sol["coeff"], sol["rest"], sol["rhs"]
 
         st.latex(rf"{coeff}\,x + ({rest}) = {rhs}")
         st.latex(rf"x = \frac{{{rhs} - ({rest})}}{{{coeff}}} = {_fmt_frac(x)}")
@@ -0,0 +1,561 @@
+# plotting.py
+import io
+import json
+import math
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import NamedTuple
+
+import matplotlib.image as mimage
+import matplotlib.pyplot as plt
+import numpy as np
+import streamlit as st
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PathCollection
+from matplotlib.colors import to_hex, to_rgba
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import Polygon
+from matplotlib.text import Annotation
+from matplotlib.ticker import MultipleLocator
+from matplotlib.transforms import Affine2D, Bbox, TransformedBbox
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+import render_cache
+
+
+# ==========================================================
+#   FIGUREN-LEBENSZYKLUS
+# ==========================================================
+# Figuren entstehen nur über subplots()/figure() und werden über close()
+# geschlossen; dabei wird je Session mitgezählt (erzeugt, geschlossen).
+# live_figures() zeigt so, welche Session Figuren liegen lässt.
+
+_TALLY = defaultdict(lambda: [0, 0])   # Session-ID -> [erzeugt, geschlossen]
+_TALLY_LOCK = threading.Lock()
+_FIG_SESSION = {}                      # Figurnummer -> Session-ID
+
+
+def _session_id() -> str:
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else "bare"
+
+
+def subplots(**kwargs):
+    """plt.subplots(), für die aktuelle Session mitgezählt; mit close() schließen."""
+    fig, ax = plt.subplots(**kwargs)
+    session = _session_id()
+    with _TALLY_LOCK:
+        _TALLY[session][0] += 1
+        _FIG_SESSION[fig.number] = session
+    return fig, ax
+
+
+def close(fig):
+    """plt.close(fig) und bei der Session zählen, die die Figur erzeugt hat."""
+    plt.close(fig)
+    with _TALLY_LOCK:
+        session = _FIG_SESSION.pop(fig.number, None)
+        if session is not None:
+            _TALLY[session][1] += 1
+
+
+@contextmanager
+def figure(**kwargs):
+    """Wie plt.subplots(), aber die Figur wird beim Verlassen immer geschlossen.
+
+    Ohne plt.close() bleibt jede an st.pyplot übergebene Figur in pyplots
+    globaler Registry liegen und wächst mit jedem Rerun weiter.
+    """
+    fig, ax = subplots(**kwargs)
+    try:
+        yield fig, ax
+    finally:
+        close(fig)
+
+
+def live_figures(session_id: str | None = None) -> int:
+    """Offene Figuren der Session (Standard: die aktuelle), erzeugt minus geschlossen."""
+    with _TALLY_LOCK:
+        created, closed = _TALLY.get(session_id or _session_id(), (0, 0))
+    return created - closed
+
+
+def open_figures() -> int:
+    """Anzahl aller offenen pyplot-Figuren im Prozess (über alle Sessions).
+
+    Wächst die Zahl über Reruns hinweg, schließt irgendein Pfad seine Figur
+    nicht (sollte zwischen zwei Reruns 0 sein).
+    """
+    return len(plt.get_fignums())
+
+
+# ==========================================================
+#   ACHSEN-VORLAGEN
+# ==========================================================
+# Die Kapitel zeichnen immer wieder dieselben leeren Koordinatensysteme
+# (Achsen durch den Ursprung, Gitter, Teilstriche). Eine AxesTemplate
+# beschreibt so ein System einmal; die draw-Funktionen zeichnen nur noch
+# Kurve und Markierungen.
+#
+# Bei festen Grenzen (xlim und ylim) wird das leere System pro Vorlage und
+# Figurgröße nur einmal gerastert. Pro Bild wird dieser Hintergrund in den
+# Puffer kopiert und nur das Neue darübergezeichnet (Blitting). Gitter,
+# Teilstriche und Zahlen – der teure Teil – werden also nicht neu gerendert.
+# Neue Elemente liegen dabei immer über dem Gitter, auch mit zorder < 1.5.
+
+DPI = 200
+PAD_INCHES = 0.1       # Rand wie savefig(bbox_inches="tight")
+BLITTING = True        # False: immer komplett neu rendern (zum Vergleichen)
+
+
+class AxesTemplate(NamedTuple):
+    xlim: tuple | None = None
+    ylim: tuple | None = None
+    tick: float | None = None       # Abstand der Teilstriche (beide Achsen)
+    origin: bool = False            # Achsen durch (0|0), kein Rahmen oben/rechts
+    grid: tuple = ("-", 1.0)        # (Linienstil, Deckkraft)
+    equal: bool = False             # gleicher Maßstab auf beiden Achsen
+    xlabel: str = ""
+    ylabel: str = ""
+    tight_layout: bool = False      # Ränder der Figur an die Beschriftung anpassen
+
+    @property
+    def fixed(self) -> bool:
+        return self.xlim is not None and self.ylim is not None
+
+    def apply(self, ax):
+        if self.xlim is not None:
+            ax.set_xlim(*self.xlim)
+        if self.ylim is not None:
+            ax.set_ylim(*self.ylim)
+        if self.tick is not None:
+            ax.xaxis.set_major_locator(MultipleLocator(self.tick))
+            ax.yaxis.set_major_locator(MultipleLocator(self.tick))
+        linestyle, alpha = self.grid
+        ax.grid(True, linestyle=linestyle, alpha=alpha)
+        if self.origin:
+            for s in ("right", "top"):
+                ax.spines[s].set_color("none")
+            for s in ("left", "bottom"):
+                ax.spines[s].set_position("zero")
+                ax.spines[s].set_linewidth(1.2)
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel)
+        if self.equal:
+            ax.set_aspect("equal", adjustable="box")
+        if self.tight_layout:
+            ax.figure.tight_layout()
+
+
+# Koordinatenkreuz -10..10 mit Einheitsgitter (lineare/allgemeine Funktionen)
+KOORDINATENKREUZ = AxesTemplate(xlim=(-10, 10), ylim=(-10, 10), tick=1, origin=True, grid=("--", 0.4))
+
+# Zeitverlauf N(t) mit Standardgitter (Wachstum, Zu-/Abnahme)
+ZEITVERLAUF = AxesTemplate(xlabel="t", ylabel="N(t)")
+
+
+class _Background:
+    """Leeres Koordinatensystem einer Vorlage, einmal gerastert."""
+
+    def __init__(self, template: AxesTemplate, figsize):
+        # Layout (tight_layout) wie in plt.subplots() bei der Standard-DPI,
+        # gerastert wird wie von savefig mit DPI
+        self.fig = Figure(figsize=figsize)
+        self.canvas = FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot()
+        template.apply(self.ax)
+        self.fig.set_dpi(DPI)
+        self.frame = self._frame()
+        self.ok = True                  # False: Zustand nicht wiederherstellbar -> verwerfen
+
+        # Achsenlinien liegen über den Kurven (zorder 2.5) -> nicht ins Hintergrundbild
+        self.spines = list(self.ax.spines.values())
+        for s in self.spines:
+            s.set_visible(False)
+        self.canvas.draw()
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for s in self.spines:
+            s.set_visible(True)
+
+        self.children = set(self.ax.get_children())
+        self.bbox = self.fig.get_tightbbox(self.canvas.get_renderer())
+
+    def _frame(self):
+        return self.ax.get_xlim(), self.ax.get_ylim(), self.ax.get_position().bounds
+
+    def render(self, draw):
+        """PNG mit draw(ax) über dem Hintergrund; None, wenn das nicht geht."""
+        ax = self.ax
+        ax.set_prop_cycle(None)  # Farben wie in einer neuen Figur
+        try:
+            draw(ax)
+            new = [a for a in ax.get_children() if a not in self.children]
+            if self._frame() != self.frame:
+                return None  # draw hat Grenzen oder Lage der Achsen verändert
+
+            renderer = self.canvas.get_renderer()
+            self.canvas.restore_region(self.background)
+            # gleiche Reihenfolge wie Axes.draw: nach zorder, sonst wie get_children()
+            layer = [a for a in ax.get_children() if a in new or a in self.spines]
+            for a in sorted(layer, key=lambda a: a.get_zorder()):
+                ax.draw_artist(a)
+
+            # Bildausschnitt wie bbox_inches="tight", inkl. Beschriftungen außerhalb der Achsen
+            extents = [a.get_tightbbox(renderer) for a in new if a.get_visible()]
+            extents = [b.transformed(self.fig.dpi_scale_trans.inverted()) for b in extents if b is not None]
+            bbox = Bbox.union([self.bbox, *extents]).padded(PAD_INCHES)
+            if not self.fig.bbox_inches.contains(bbox.x0, bbox.y0) or \
+                    not self.fig.bbox_inches.contains(bbox.x1, bbox.y1):
+                return None  # ragt aus der Figur -> savefig würde sie vergrößern
+
+            pixels = np.asarray(self.canvas.buffer_rgba())
+            x0 = round(bbox.x0 * DPI)
+            y0 = round(pixels.shape[0] - bbox.y1 * DPI)
+            # Bildgröße wie savefig (FigureCanvasBase.get_width_height)
+            w, h = (int(v + 1e-8) for v in TransformedBbox(Bbox.from_bounds(0, 0, *bbox.size),
+                                                           Affine2D().scale(DPI)).max)
+            crop = pixels[y0:y0 + h, x0:x0 + w]
+            buf = io.BytesIO()
+            mimage.imsave(buf, crop, format="png", dpi=DPI)
+            return buf.getvalue()
+        finally:
+            for a in ax.get_children():
+                if a not in self.children:
+                    a.remove()
+            self._restore()
+
+    def _restore(self):
+        # Grenzen und Lage der Achsen wie vor draw, sonst nicht mehr verwenden
+        if self._frame() == self.frame:
+            return
+        (x0, x1), (y0, y1), bounds = self.frame
+        self.ax.set_xlim(x0, x1)
+        self.ax.set_ylim(y0, y1)
+        self.ax.set_position(bounds)
+        self.ok = self._frame() == self.frame
+
+
+# Hintergründe je (Vorlage, Figurgröße). Streamlit rendert Sessions parallel in
+# eigenen Threads -> jeder Hintergrund wird exklusiv ausgeliehen.
+_backgrounds = {}
+_backgrounds_lock = threading.Lock()
+
+
+def _blit(template: AxesTemplate, draw, figsize):
+    key = (template, tuple(figsize))
+    with _backgrounds_lock:
+        free = _backgrounds.setdefault(key, [])
+        bg = free.pop() if free else None
+    if bg is None:
+        bg = _Background(template, figsize)
+    try:
+        data = bg.render(draw)
+    except BaseException:
+        bg.ok = False   # unbekannter Zustand nach Ausnahme in draw
+        raise
+    finally:
+        if bg.ok:
+            with _backgrounds_lock:
+                free.append(bg)
+    return data
+
+
+# ==========================================================
+#   ADAPTIVE ABTASTUNG VON KURVEN
+# ==========================================================
+# Statt f an hunderten gleichverteilten Stellen auszuwerten, wird [x0, x1]
+# halbiert, solange die Kurve merklich von der Sehne abweicht. Geprüft wird
+# bei 1/4, 1/2 und 3/4 jedes Intervalls (alle Intervalle einer Ebene in
+# einem vektorisierten Aufruf); damit sind Polynome bis Grad 3 pro
+# Intervall exakt erkannt. Eine Gerade braucht 2 Punkte, eine Parabel einige
+# Dutzend. Intervalle, die samt Abweichung ganz über oder unter ylim
+# liegen, werden nicht verfeinert.
+
+SAMPLE_TOL = 5e-4          # erlaubte Abweichung, Anteil der Fensterhöhe (~0.5 px)
+SAMPLE_MAX_DEPTH = 14      # höchstens 2^14 Intervalle
+_PROBES = np.array([0.25, 0.5, 0.75])
+
+
+def sample_curve(f, xlim, ylim=None, tol: float = SAMPLE_TOL):
+    """Stützstellen (x, y) für den Graphen von f im Fenster xlim × ylim.
+
+    f muss NumPy-Arrays auswerten können. Ohne ylim wird die Fensterhöhe
+    aus einer groben Probe geschätzt und nichts abgeschnitten.
+    """
+    x0, x1 = map(float, xlim)
+    if ylim is None:
+        probe = np.asarray(f(np.linspace(x0, x1, 17)), dtype=float)
+        span = float(np.nanmax(probe) - np.nanmin(probe)) or 1.0
+    else:
+        y0, y1 = map(float, ylim)
+        span = y1 - y0
+    eps = tol * span
+
+    a, b = np.array([x0]), np.array([x1])
+    fa, fb = np.asarray(f(a), dtype=float), np.asarray(f(b), dtype=float)
+    xs, ys = [a, b], [fa, fb]
+    for _ in range(SAMPLE_MAX_DEPTH):
+        t = a[:, None] + (b - a)[:, None] * _PROBES
+        ft = np.asarray(f(t), dtype=float)
+        chord = fa[:, None] + (fb - fa)[:, None] * _PROBES
+        dev = np.abs(ft - chord).max(axis=1)
+        split = dev > eps
+        if ylim is not None:
+            low = np.minimum(np.minimum(fa, fb), ft.min(axis=1)) - dev
+            high = np.maximum(np.maximum(fa, fb), ft.max(axis=1)) + dev
+            split &= (high >= y0) & (low <= y1)
+        if not split.any():
+            break
+        a, b, fa, fb, t, ft = a[split], b[split], fa[split], fb[split], t[split], ft[split]
+        mid, fmid = t[:, 1], ft[:, 1]
+        xs.append(mid)
+        ys.append(fmid)
+        a, b = np.concatenate([a, mid]), np.concatenate([mid, b])
+        fa, fb = np.concatenate([fa, fmid]), np.concatenate([fmid, fb])
+
+    x, y = np.concatenate(xs), np.concatenate(ys)
+    order = np.argsort(x, kind="stable")
+    return x[order], y[order]
+
+
+# ==========================================================
+#   VEKTORGRAFIK IM BROWSER (Vega-Lite)
+# ==========================================================
+# Statt eines PNG vom Server wird eine Vega-Lite-Spezifikation geschickt;
+# der Browser zeichnet. Die draw-Funktionen bleiben dieselben: sie zeichnen
+# auf eine (nie gerasterte) Figur mit Achsen-Vorlage, danach werden deren
+# Elemente in Vega-Lite-Ebenen übersetzt. Unterstützt werden Linien (auch
+# axhline/axvline), Streupunkte, Polygone (ax.fill) und Beschriftungen ohne
+# Pfeil – für alles andere gibt vega_spec() None zurück, dann wird das PNG
+# verwendet.
+
+VEGA_WIDTH = 640       # Breite der Zeichenfläche in Pixel
+PX_PER_PT = 96 / 72    # Linienbreiten und Schrift: Punkt -> CSS-Pixel
+DECIMALS = 4           # Koordinaten runden (kleinere Nutzlast)
+
+
+def _vega_frame(template: AxesTemplate, ax, height: int) -> dict:
+    # Skalen und Achsen wie in der Vorlage; Grenzen nach draw() (evtl. automatisch)
+    enc = {}
+    xlim, ylim = ax.get_xlim(), ax.get_ylim()
+    # (Kanal, Grenzen, Beschriftung, Grenzen und Pixelgröße der jeweils anderen Richtung)
+    for channel, lim, label, other, size in (("x", xlim, template.xlabel, ylim, height),
+                                             ("y", ylim, template.ylabel, xlim, VEGA_WIDTH)):
+        lo, hi = float(lim[0]), float(lim[1])
+        linestyle, alpha = template.grid
+        axis = {
+            "title": label or None,
+            "grid": True,
+            "gridOpacity": alpha,
+            "gridColor": "#b0b0b0",
+            "domainColor": "black",
+            "tickColor": "black",
+            "labelColor": "black",
+            "labelFontSize": 13,
+            "labelFlush": False,
+            "format": "~r",
+            "tickCount": 8,
+        }
+        if linestyle == "--":
+            axis["gridDash"] = [4, 3]
+        if template.tick is not None:
+            first = math.ceil(lo / template.tick)
+            axis["values"] = [round(k * template.tick, 10)
+                              for k in range(first, math.floor(hi / template.tick) + 1)]
+        if template.origin and other[0] < 0 < other[1]:
+            # Achse durch den Ursprung: um den Abstand der 0 vom Rand verschieben
+            axis["offset"] = -round(size * (0 - other[0]) / (other[1] - other[0]), 1)
+            axis["domainWidth"] = 1.2 * PX_PER_PT
+        enc[channel] = {"scale": {"domain": [lo, hi], "nice": False, "zero": False}, "axis": axis}
+    return enc
+
+
+def _xy(points) -> list:
+    pts = np.round(np.asarray(points, dtype=float), DECIMALS)
+    return [{"x": x, "y": y} for x, y in pts.tolist() if math.isfinite(x) and math.isfinite(y)]
+
+
+def _vega_layer(artist, ax):
+    """Eine Vega-Lite-Ebene zu einem matplotlib-Element; None, wenn nicht unterstützt."""
+    color = lambda c: to_hex(c, keep_alpha=False)
+    if isinstance(artist, Line2D):
+        style = {"stroke": color(artist.get_color()), "strokeWidth": artist.get_linewidth() * PX_PER_PT}
+        if artist.get_linestyle() == "--":
+            style["strokeDash"] = [6, 4]
+        transform = artist.get_transform()
+        # axhline/axvline: ein Datensatz, Lage über datum
+        if transform is ax.get_yaxis_transform(which="grid"):
+            return {"data": {"values": [{}]}, "mark": {"type": "rule", **style},
+                    "encoding": {"y": {"datum": float(artist.get_ydata()[0])}}}
+        if transform is ax.get_xaxis_transform(which="grid"):
+            return {"data": {"values": [{}]}, "mark": {"type": "rule", **style},
+                    "encoding": {"x": {"datum": float(artist.get_xdata()[0])}}}
+        if transform is not ax.transData:
+            return None
+        return {"data": {"values": _xy(artist.get_xydata())},
+                "mark": {"type": "line", "clip": True, **style}}
+
+    if isinstance(artist, PathCollection):
+        face, edge = artist.get_facecolor(), artist.get_edgecolor()
+        return {
+            "data": {"values": _xy(artist.get_offsets())},
+            "mark": {
+                "type": "point", "filled": True, "clip": True,
+                "fill": color(face[0]) if len(face) else "white",
+                "stroke": color(edge[0]) if len(edge) else "black",
+                "strokeWidth": float(artist.get_linewidths()[0]) * PX_PER_PT,
+                "size": float(artist.get_sizes()[0]) * PX_PER_PT ** 2,
+                "opacity": 1,
+            },
+        }
+
+    if isinstance(artist, Polygon):
+        if artist.get_transform() is not ax.transData:
+            return None
+        values = [dict(p, i=k) for k, p in enumerate(_xy(artist.get_xy()))]
+        face = to_rgba(artist.get_facecolor())
+        return {
+            "data": {"values": values},
+            "mark": {"type": "line", "fill": color(face), "fillOpacity": face[3], "strokeOpacity": 0, "clip": True},
+            "encoding": {"order": {"field": "i", "type": "quantitative"}},
+        }
+
+    if isinstance(artist, Annotation):
+        if artist.arrow_patch is not None or artist.xycoords != "data" or \
+                artist.anncoords not in ("offset points", "data"):
+            return None
+        x, y = artist.xy
+        dx, dy = artist.xyann if artist.anncoords == "offset points" else (0, 0)
+        return {
+            "data": {"values": [{"x": float(x), "y": float(y)}]},
+            "mark": {
+                "type": "text", "text": artist.get_text(),
+                "dx": dx * PX_PER_PT, "dy": -dy * PX_PER_PT,
+                "align": artist.get_horizontalalignment(), "baseline": "alphabetic",
+                "color": color(artist.get_color()),
+                "fontSize": artist.get_fontsize() * PX_PER_PT,
+                "fontWeight": "bold" if artist.get_fontweight() in ("bold", 700) else "normal",
+            },
+        }
+    return None
+
+
+def vega_spec(template: AxesTemplate, draw, figsize=None):
+    """Vega-Lite-Spezifikation (dict) der Zeichnung; None, wenn etwas nicht übersetzbar ist."""
+    figsize = figsize or plt.rcParams["figure.figsize"]
+    fig = Figure(figsize=figsize)
+    ax = fig.add_subplot()
+    template.apply(ax)
+    before = set(ax.get_children())
+    draw(ax)
+
+    layers = []
+    for artist in ax.get_children():
+        if artist in before or not artist.get_visible():
+            continue
+        layer = _vega_layer(artist, ax)
+        if layer is None:
+            return None
+        layers.append(layer)
+
+    height = round(VEGA_WIDTH * figsize[1] / figsize[0])
+    if template.equal:
+        (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+        height = round(VEGA_WIDTH * abs(y1 - y0) / abs(x1 - x0))
+    frame = _vega_frame(template, ax, height)
+    for layer in layers:
+        enc = layer.setdefault("encoding", {})
+        for channel in ("x", "y"):
+            if channel in enc:
+                enc[channel] = {**frame[channel], **enc[channel], "type": "quantitative"}
+            elif layer["mark"]["type"] != "rule":
+                enc[channel] = {"field": channel, "type": "quantitative", **frame[channel]}
+    return {
+        "$schema": "https://vega.github.io/schema/vega-lite/v5.json",
+        "width": VEGA_WIDTH,
+        "height": height,
+        "layer": layers,
+        "config": {"view": {"stroke": None if template.origin else "black"}},
+    }
+
+
+# ==========================================================
+#   AUSWAHL DER DARSTELLUNG
+# ==========================================================
+# "png": matplotlib rastert auf dem Server (Standard)
+# "svg": matplotlib-Vektorgrafik, der Browser zeichnet
+# "vega": Vega-Lite-Spezifikation, der Browser zeichnet
+# Welche Darstellung ein Kapitel nutzt, legt main.py pro Kapitel fest.
+
+BACKEND_KEY = "plot_backend"
+BACKENDS = {"png": "PNG (Server)", "svg": "SVG (Browser)", "vega": "Vega-Lite (Browser)"}
+
+
+def backend() -> str:
+    return st.session_state.get(BACKEND_KEY, "png")
+
+
+# ==========================================================
+#   GECACHTE BILDER
+# ==========================================================
+
+def render(fig, fmt: str = "png"):
+    """Figur rastern wie st.pyplot (PNG) bzw. als SVG-Text."""
+    buf = io.BytesIO()
+    fig.savefig(buf, format=fmt, bbox_inches="tight", dpi=DPI)
+    data = buf.getvalue()
+    return data.decode("utf-8") if fmt == "svg" else data
+
+
+def cached_image(name: str, params, draw, fmt: str = "png", template: AxesTemplate | None = None,
+                 **fig_kwargs):
+    """Bild zu (name, params) aus dem Cache holen oder einmal mit draw(ax) erzeugen.
+
+    params muss die Zeichnung vollständig bestimmen (inkl. Lösungs-Flag).
+    Mit template wird das Koordinatensystem vorab eingerichtet; draw zeichnet
+    dann nur noch Kurven und Markierungen.
+    """
+    key = render_cache.cache_key(name, params, fmt, template, sorted(fig_kwargs.items()))
+    data = render_cache.CACHE.get(key)
+    if data is None:
+        if BLITTING and template is not None and template.fixed and fmt == "png" \
+                and set(fig_kwargs) <= {"figsize"}:
+            data = _blit(template, draw, fig_kwargs.get("figsize", plt.rcParams["figure.figsize"]))
+        if data is None:
+            with figure(**fig_kwargs) as (fig, ax):
+                if template is not None:
+                    template.apply(ax)
+                draw(ax)
+                data = render(fig, fmt)
+        render_cache.CACHE.put(key, data)
+    return data
+
+
+def cached_spec(name: str, params, draw, template: AxesTemplate, **fig_kwargs):
+    """Wie cached_image, aber die Vega-Lite-Spezifikation (None: nicht übersetzbar)."""
+    key = render_cache.cache_key(name, params, "vega", template, sorted(fig_kwargs.items()))
+    data = render_cache.CACHE.get(key)
+    if data is None:
+        spec = vega_spec(template, draw, fig_kwargs.get("figsize")) if set(fig_kwargs) <= {"figsize"} else None
+        data = json.dumps(spec, separators=(",", ":")) if spec is not None else ""
+        render_cache.CACHE.put(key, data)
+    return json.loads(data) if data else None
+
+
+def show(name: str, params, draw, fmt: str | None = None, template: AxesTemplate | None = None,
+         **fig_kwargs):
+    """Ersatz für st.pyplot: zeigt das (gecachte) Bild in Containerbreite.
+
+    fmt=None: Darstellung des Kapitels (backend()); "vega" braucht eine Vorlage
+    und fällt sonst auf PNG zurück.
+    """
+    fmt = fmt or backend()
+    if fmt == "vega":
+        spec = cached_spec(name, params, draw, template, **fig_kwargs) if template is not None else None
+        if spec is not None:
+            st.vega_lite_chart(spec=spec, theme=None, width="content")
+            return
+        fmt = "png"
+    st.image(cached_image(name, params, draw, fmt, template, **fig_kwargs), width="stretch")
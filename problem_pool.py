@@ -0,0 +1,144 @@
+# problem_pool.py
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import streamlit as st
+
+import aufgabenraum
+import fortschritt
+import gesehen
+import seeding
+
+
+# ==========================================================
+#   AUFGABEN-POOLS
+# ==========================================================
+# Pro Generator liegt ein Vorrat fertiger Aufgaben bereit. "Neues Beispiel"
+# nimmt nur ein Element heraus (O(1)); ein Hintergrund-Thread füllt nach.
+# Die Pools gelten prozessweit, also für alle Sessions gemeinsam.
+# Jedes Element ist ein Paar (seed, aufgabe) mit aufgabe == generator(Random(seed)).
+
+POOL_SIZE = 32
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="problem-pool")
+
+
+class ProblemPool:
+    def __init__(self, generator, size: int = POOL_SIZE):
+        self.generator = generator
+        self.size = size
+        self.low_water = size // 2
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._refilling = False
+
+    def _make(self):
+        seed = seeding.new_seed()
+        return seed, seeding.generate(self.generator, seed)
+
+    def pop(self):
+        try:
+            item = self._items.popleft()
+        except IndexError:
+            # Pool (noch) leer -> synchron erzeugen, wie bisher
+            item = self._make()
+        self._schedule_refill()
+        return item
+
+    def _schedule_refill(self):
+        with self._lock:
+            if self._refilling or len(self._items) > self.low_water:
+                return
+            self._refilling = True
+        _EXECUTOR.submit(self._refill)
+
+    def _refill(self):
+        try:
+            while len(self._items) < self.size:
+                self._items.append(self._make())
+        finally:
+            with self._lock:
+                self._refilling = False
+
+    def __len__(self):
+        return len(self._items)
+
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def pool_for(generator, size: int = POOL_SIZE) -> ProblemPool:
+    pool = _POOLS.get(generator)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.setdefault(generator, ProblemPool(generator, size))
+    return pool
+
+
+def draw_seeded(generator):
+    """Nächstes Paar (seed, aufgabe) des Generators aus dem Pool.
+
+    Vollständig aufgezählte Generatoren (aufgabenraum) brauchen keinen Pool:
+    eine Indexziehung genügt.
+    """
+    index = aufgabenraum.index_for(generator)
+    if index is not None:
+        return index.draw()
+    return pool_for(generator).pop()
+
+
+def draw(generator):
+    """Nächste Aufgabe des Generators aus dem Pool."""
+    return draw_seeded(generator)[1]
+
+
+# ==========================================================
+#   SESSION
+# ==========================================================
+
+MAX_TRIES = 20   # Ziehungen, bis eine noch nicht gesehene Aufgabe kommt
+
+
+def _draw_unseen(generator, gen_id):
+    # möglichst neu in Session und Klasse, sonst wenigstens in der Session;
+    # sind alle Kandidaten schon gesehen, die am längsten nicht mehr gezeigte
+    index = aufgabenraum.index_for(generator)
+    if index is not None:
+        # aufgezählter Raum: direkt aus den noch nicht gesehenen Positionen
+        seed, problem = aufgabenraum.draw_unseen(index)
+        return seed, problem, gesehen.fingerprint(gen_id, problem)
+    best, best_rank = None, None
+    for _ in range(MAX_TRIES):
+        seed, problem = draw_seeded(generator)
+        fp = gesehen.fingerprint(gen_id, problem)
+        status = gesehen.status(fp)
+        if status == 0:
+            return seed, problem, fp
+        rank = (status, gesehen.seen_at(fp))
+        if best is None or rank < best_rank:
+            best, best_rank = (seed, problem, fp), rank
+    return best
+
+
+def renew(key: str, generator):
+    """Neue Aufgabe aus dem Pool ziehen und nur ihre ProblemRef in der Session ablegen."""
+    gen_id = seeding.generator_id(generator)
+    seed, problem, fp = _draw_unseen(generator, gen_id)
+    gesehen.mark(fp)
+    ref = seeding.ProblemRef(gen_id, seed)
+    seeding.remember(ref, problem)
+    st.session_state[key] = ref
+    index = aufgabenraum.index_for(generator)
+    fortschritt.neu(key, None if index is None else index.position_of(seed))
+    return problem
+
+
+def current(key: str, generator):
+    """Aktuelle Aufgabe der Session unter key (bei Bedarf eine neue)."""
+    ref = st.session_state.get(key)
+    if not isinstance(ref, seeding.ProblemRef):
+        # fehlt noch oder alte Session-Daten im früheren Format
+        return renew(key, generator)
+    return seeding.load(ref)
@@ -1,13 +1,17 @@
 # quadratische_funktionen.py
 import streamlit as st
-import random
 import math
 from fractions import Fraction
 
+import fortschritt
+import latex_cache
+import problem_pool
+
 # ==========================================================
 #   HELPERS
 # ==========================================================
 
+@latex_cache.memoized
 def _latex_quad(a, b, c, var="x"):
     def term(coeff, t):
         if coeff == 0:
@@ -41,44 +45,51 @@ def _fmt2(x):
 #   TAB 1 – DISKRIMINANTE / ANZAHL NULLSTELLEN (+ Nullstellen als Punkte)
 # ==========================================================
 
-def _gen_quadratic_eq():
+def _gen_quadratic_eq(rng):
     while True:
-        a = random.choice([-3, -2, -1, 1, 2, 3])
-        b = random.randint(-12, 12)
-        c = random.randint(-12, 12)
+        a = rng.choice([-3, -2, -1, 1, 2, 3])
+        b = rng.randint(-12, 12)
+        c = rng.randint(-12, 12)
         if b == 0 and c == 0:
             continue
         D = b*b - 4*a*c
         if abs(D) <= 400:
             return a, b, c, D
 
+def _solve_quadratic_eq(problem):
+    # reelle Nullstellen aufsteigend sortiert
+    a, b, c, D = problem
+    if D > 0:
+        sqrtD = math.sqrt(D)
+        return {"D": D, "roots": sorted([(-b - sqrtD) / (2*a), (-b + sqrtD) / (2*a)])}
+    if D == 0:
+        return {"D": D, "roots": [(-b) / (2*a)]}
+    return {"D": D, "roots": []}
+
 def _tab1():
     key = "quad_tab1"
     if st.button("Neues Beispiel", key="quad_tab1_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        st.session_state[key] = _gen_quadratic_eq()
-
-    a, b, c, D = st.session_state[key]
+    problem = problem_pool.current(key, _gen_quadratic_eq)
+    a, b, c, D = problem
 
     st.subheader("Diskriminante & Nullstellen")
     st.markdown("**Aufgabe:** Ermittle die Anzahl der Nullstellen und begründe deine Antwort mit der Diskriminante.")
     st.latex(rf"{_latex_quad(a,b,c)} = 0")
 
     if st.button("Lösung anzeigen", key="quad_tab1_sol"):
+        fortschritt.loesung(key)
         st.latex(rf"D = b^2 - 4ac = ({b})^2 - 4\cdot({a})\cdot({c}) = {D}")
 
+        roots = _solve_quadratic_eq(problem)["roots"]
         if D > 0:
             st.success("Da \(D>0\), gibt es **2 reelle Nullstellen**.")
-            sqrtD = math.sqrt(D)
-            x1 = (-b - sqrtD) / (2*a)
-            x2 = (-b + sqrtD) / (2*a)
-            lo, hi = sorted([x1, x2])
+            lo, hi = roots
             st.latex(rf"N_1({ _fmt2(lo) }/0),\quad N_2({ _fmt2(hi) }/0)")
         elif D == 0:
             st.success("Da \(D=0\), gibt es **1 reelle (doppelte) Nullstelle**.")
-            x0 = (-b) / (2*a)
+            x0 = roots[0]
             st.latex(rf"N_1({ _fmt2(x0) }/0)")
         else:
             st.success("Da \(D<0\), gibt es **keine reellen Nullstellen**.")
@@ -87,14 +98,14 @@ def _tab1():
 #   TAB 2 – ERLÖS / GEWINN (2 Buttons, Gewinnspanne nach innen runden)
 # ==========================================================
 
-def _gen_economics():
+def _gen_economics(rng):
     while True:
-        m = random.choice([-9,-8,-7,-6,-5,-4,-3,-2,-1]) / 10  # -0.9..-0.1
-        n = random.randint(12, 30)
+        m = rng.choice([-9,-8,-7,-6,-5,-4,-3,-2,-1]) / 10  # -0.9..-0.1
+        n = rng.randint(12, 30)
 
-        u = random.choice([1,2,3]) / 10                        # 0.1..0.3
-        v = random.randint(2, 10) / 10                         # 0.2..1.0
-        w = random.randint(10, 60)
+        u = rng.choice([1,2,3]) / 10                        # 0.1..0.3
+        v = rng.randint(2, 10) / 10                         # 0.2..1.0
+        w = rng.randint(10, 60)
 
         A = m - u               # <0
         B = n - v
@@ -116,6 +127,17 @@ def _gen_economics():
 
         return dict(m=m, n=n, u=u, v=v, w=w, A=A, B=B, C=C, x1=lo, x2=hi)
 
+def _solve_economics(d):
+    A, B, C = d["A"], d["B"], d["C"]
+    x_star = -B / (2*A)
+    return {
+        # Gewinnspanne nach innen runden
+        "lo_in": math.ceil(d["x1"]),
+        "hi_in": math.floor(d["x2"]),
+        "x_star": x_star,
+        "G_star": A*x_star*x_star + B*x_star + C,
+    }
+
 def _tab2():
     key = "quad_tab2"
     stage_key = "quad_tab2_stage"  # 0=none, 1=E shown, 2=profit shown
@@ -124,18 +146,15 @@ def _tab2():
         st.session_state.pop(key, None)
         st.session_state.pop(stage_key, None)
 
-    if key not in st.session_state:
-        st.session_state[key] = _gen_economics()
     if stage_key not in st.session_state:
         st.session_state[stage_key] = 0
 
-    d = st.session_state[key]
+    d = problem_pool.current(key, _gen_economics)
     stage = st.session_state[stage_key]
 
     m, n = d["m"], d["n"]
     u, v, w = d["u"], d["v"], d["w"]
     A, B, C = d["A"], d["B"], d["C"]
-    x1, x2 = d["x1"], d["x2"]
 
     st.subheader("Erlös- und Gewinnfunktion")
 
@@ -164,12 +183,8 @@ def _tab2():
     if stage >= 2:
         st.latex(rf"G(x)= {A:.2f}x^2 + {B:.2f}x {C:+.0f}".replace(".", ","))
 
-        # Gewinnspanne nach innen runden:
-        lo_in = math.ceil(x1)
-        hi_in = math.floor(x2)
-
-        x_star = -B / (2*A)
-        G_star = A*x_star*x_star + B*x_star + C
+        sol = _solve_economics(d)
+        lo_in, hi_in, G_star = sol["lo_in"], sol["hi_in"], sol["G_star"]
 
         st.markdown(f"**Gewinnspanne:** von **{lo_in}** bis **{hi_in}**")
         st.markdown(f"**Max. Gewinn:** **{_money(G_star)} €**")
@@ -0,0 +1,66 @@
+# render_cache.py
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+# ==========================================================
+#   RENDER-CACHE (PNG/SVG-Bytes, inhaltsadressiert)
+# ==========================================================
+
+def cache_key(*parts) -> str:
+    """Hash über die Aufgabenparameter; gleiche Aufgabe -> gleicher Schlüssel."""
+    return hashlib.sha256(repr(parts).encode("utf-8")).hexdigest()
+
+
+class RenderCache:
+    """LRU-Cache für gerenderte Bilder mit Obergrenze in Bytes.
+
+    Wird von allen Sessions geteilt, daher mit Lock.
+    """
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data):
+        n = len(data)
+        if n > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._items[key] = data
+            self.size += n
+            while self.size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def stats(self) -> dict:
+        return {"entries": len(self), "bytes": self.size, "hits": self.hits, "misses": self.misses}
+
+
+CACHE = RenderCache()
@@ -1,58 +1,73 @@
+import math
+
+import numpy as np
 import streamlit as st
-import random
+
+import aufgabenraum
+import cashflow
+import fortschritt
+import problem_pool
 
 
 def euro(x):
     return f"{x:,.2f} €".replace(",", "X").replace(".", ",").replace("X", ".")
 
 
+def _gen_renten_erkennen(rng):
+    return {
+        "R": rng.choice([500, 800, 1000, 1200, 1500]),
+        "n": rng.randint(4, 10),
+        "i": rng.choice([2, 2.5, 3, 3.5, 4, 5]),
+        "typ": rng.choice(["BW_nach", "BW_vor", "EW_nach", "EW_vor"])
+    }
+
+
+def _solve_renten_erkennen(d):
+    # Barwert: Wert bei 0, Endwert: Wert bei n (nach der letzten Rate bzw. Ende der Laufzeit)
+    rate, zeitpunkt = d["typ"].split("_")
+    flows = cashflow.annuity(d["R"], d["n"], vorschuessig=(zeitpunkt == "vor"))
+    t_ref = 0 if rate == "BW" else d["n"]
+    return {"q": 1 + d["i"] / 100, "wert": cashflow.value_at(flows, d["i"], t_ref)}
+
+
 def _mode_renten_erkennen():
     key = "rente_task"
 
     if st.button("Neues Beispiel", key="rente_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        st.session_state[key] = {
-            "R": random.choice([500, 800, 1000, 1200, 1500]),
-            "n": random.randint(4, 10),
-            "i": random.choice([2, 2.5, 3, 3.5, 4, 5]),
-            "typ": random.choice(["BW_nach", "BW_vor", "EW_nach", "EW_vor"])
-        }
-
-    d = st.session_state[key]
+    d = problem_pool.current(key, _gen_renten_erkennen)
     R, n, i, typ = d["R"], d["n"], d["i"], d["typ"]
-    q = 1 + i / 100
+    sol = _solve_renten_erkennen(d)
+    q, wert = sol["q"], sol["wert"]
 
     st.subheader("Rentenrechnung erkennen und berechnen")
 
     if typ == "BW_nach":
         text = f"Frau Berger erhält am Ende jedes Jahres {euro(R)}, insgesamt {n} Jahre lang. Zinssatz: {i} % p.a. Wie viel ist diese Zahlungsreihe heute wert?"
         formel = r"B = R \cdot \frac{q^n - 1}{q-1} \cdot \frac{1}{q^n}"
-        wert = R * (q**n - 1) / (q - 1) * (1 / q**n)
         art = "Barwert, nachschüssig"
 
     elif typ == "BW_vor":
         text = f"Herr Müller erhält zu Beginn jedes Jahres {euro(R)}, insgesamt {n} Jahre lang. Zinssatz: {i} % p.a. Wie viel ist diese Zahlungsreihe heute wert?"
         formel = r"B = R \cdot \frac{q^n - 1}{q-1} \cdot \frac{1}{q^{n-1}}"
-        wert = R * (q**n - 1) / (q - 1) * (1 / q**(n - 1))
         art = "Barwert, vorschüssig"
 
     elif typ == "EW_nach":
         text = f"Frau Novak zahlt am Ende jedes Jahres {euro(R)} ein, insgesamt {n} Jahre lang. Zinssatz: {i} % p.a. Wie viel ist direkt nach der letzten Einzahlung vorhanden?"
         formel = r"E = R \cdot \frac{q^n - 1}{q-1}"
-        wert = R * (q**n - 1) / (q - 1)
         art = "Endwert, nachschüssig"
 
     else:
         text = f"Herr Steiner zahlt zu Beginn jedes Jahres {euro(R)} ein, insgesamt {n} Jahre lang. Zinssatz: {i} % p.a. Wie viel ist am Ende der Laufzeit vorhanden?"
         formel = r"E = R \cdot \frac{q^n - 1}{q-1} \cdot q"
-        wert = R * (q**n - 1) / (q - 1) * q
         art = "Endwert, vorschüssig"
 
     st.markdown(f"**Aufgabe:** {text}")
+    aufgabenraum.caption(_gen_renten_erkennen)
 
     if st.button("Lösung anzeigen", key="rente_sol"):
+        fortschritt.loesung(key)
         st.write(f"Gemeint ist: **{art}**")
         st.latex(fr"q = {q:.4f}")
         st.latex(formel)
@@ -60,6 +75,111 @@ def _mode_renten_erkennen():
         st.success(f"Ergebnis: {euro(wert)}")
 
 
+# ==========================================================
+#   TILGUNGS- UND SPARPLAN (vektorisiert)
+# ==========================================================
+# Ganzer Plan mit NumPy in geschlossener Form statt Periode für Periode:
+# 360 Monatsperioden dauern so deutlich unter 1 ms. Zinssatz i wie oben
+# in % p.a. (effektiv), m Perioden pro Jahr mit konformem Faktor
+# q_m = (1 + i/100)^(1/m), siehe cashflow.period_factor.
+
+def _geom(q, qk, k):
+    # (q^k - 1) / (q - 1), für q = 1 gleich k
+    return k.astype(float) if q == 1 else (qk - 1) / (q - 1)
+
+
+def tilgungsplan(K, i, n, m=1, art="annuitaet"):
+    """Plan eines Kredits K über n Perioden; art "annuitaet" oder "raten".
+
+    Spalten (NumPy-Arrays): Periode, Zinsen, Tilgung, Rate, Restschuld.
+    """
+    q = cashflow.period_factor(i, m)
+    k = np.arange(1, n + 1)
+    if art == "annuitaet":
+        qk = q ** k
+        A = K / _geom(q, qk[-1:], k[-1:])[0] * q ** n
+        restschuld = K * qk - A * _geom(q, qk, k)
+        restschuld[-1] = 0.0  # Rundungsrest der geschlossenen Form
+        vorher = np.concatenate(([K], restschuld[:-1]))
+        zinsen = vorher * (q - 1)
+        tilgung = A - zinsen
+        rate = np.full(n, A)
+    else:
+        tilgung = np.full(n, K / n)
+        restschuld = K - tilgung * k
+        restschuld[-1] = 0.0
+        zinsen = (K - tilgung * (k - 1)) * (q - 1)
+        rate = zinsen + tilgung
+    return {"Periode": k, "Zinsen": zinsen, "Tilgung": tilgung, "Rate": rate, "Restschuld": restschuld}
+
+
+def sparplan(R, i, n, m=1, vorschuessig=False):
+    """Sparplan mit Rate R über n Perioden.
+
+    Spalten (NumPy-Arrays): Periode, Einzahlung, Zinsen, Kontostand (jeweils am Periodenende).
+    """
+    q = cashflow.period_factor(i, m)
+    k = np.arange(1, n + 1)
+    stand = R * _geom(q, q ** k, k) * (q if vorschuessig else 1)
+    zinsen = stand - np.concatenate(([0.0], stand[:-1])) - R
+    return {"Periode": k, "Einzahlung": np.full(n, float(R)), "Zinsen": zinsen, "Kontostand": stand}
+
+
+PLAN_PAGE_SIZE = 12
+PERIODEN = {1: "jährlich", 2: "halbjährlich", 4: "vierteljährlich", 12: "monatlich"}
+
+
+def _mode_tilgungsplan():
+    st.subheader("Tilgungs- und Sparplan")
+
+    art = st.radio("Art", ["Annuitätendarlehen", "Ratendarlehen", "Sparplan"], horizontal=True, key="tp_art")
+    c1, c2, c3, c4 = st.columns(4)
+    if art == "Sparplan":
+        betrag = c1.number_input("Rate in €", min_value=1.0, value=200.0, step=50.0, key="tp_rate")
+    else:
+        betrag = c1.number_input("Kredit in €", min_value=100.0, value=200000.0, step=1000.0, key="tp_kredit")
+    i = c2.number_input("Zinssatz in % p.a.", min_value=0.0, max_value=20.0, value=4.0, step=0.25, key="tp_i")
+    jahre = c3.number_input("Laufzeit in Jahren", min_value=1, max_value=30, value=30, key="tp_jahre")
+    m = c4.selectbox("Zahlungen", list(PERIODEN), index=3, format_func=PERIODEN.get, key="tp_m")
+    n = int(jahre) * m
+
+    if art == "Sparplan":
+        vorschuessig = st.checkbox("vorschüssig", key="tp_vor")
+        plan = sparplan(betrag, i, n, m, vorschuessig)
+        st.markdown(
+            f"**Endwert:** {euro(plan['Kontostand'][-1])} &nbsp;·&nbsp; "
+            f"**Summe Zinsen:** {euro(plan['Zinsen'].sum())}"
+        )
+        money = ["Einzahlung", "Zinsen", "Kontostand"]
+    else:
+        plan = tilgungsplan(betrag, i, n, m, "annuitaet" if art == "Annuitätendarlehen" else "raten")
+        st.markdown(
+            f"**Erste Rate:** {euro(plan['Rate'][0])} &nbsp;·&nbsp; "
+            f"**Summe Zinsen:** {euro(plan['Zinsen'].sum())}"
+        )
+        money = ["Zinsen", "Tilgung", "Rate", "Restschuld"]
+
+    # Seitenweise anzeigen (eine Seite = 12 Perioden)
+    pages = math.ceil(n / PLAN_PAGE_SIZE)
+    # Startwert und Begrenzung nur über die Session (kein value=, sonst Streamlit-Warnung)
+    st.session_state["tp_page"] = min(st.session_state.get("tp_page", 1), pages)
+    page = st.number_input(f"Seite (von {pages})", min_value=1, max_value=pages, key="tp_page")
+    sl = slice((page - 1) * PLAN_PAGE_SIZE, page * PLAN_PAGE_SIZE)
+
+    st.dataframe(
+        {col: values[sl] for col, values in plan.items()},
+        hide_index=True,
+        column_config={col: st.column_config.NumberColumn(format="%.2f €") for col in money},
+    )
+
+
 def run():
     st.title("Rentenrechnung")
-    _mode_renten_erkennen()
\ No newline at end of file
+
+    tab1, tab2 = st.tabs(["Renten erkennen", "Tilgungs- & Sparplan"])
+
+    with tab1:
+        _mode_renten_erkennen()
+
+    with tab2:
+        _mode_tilgungsplan()
\ No newline at end of file
@@ -0,0 +1,79 @@
+# seeding.py
+import importlib
+import random
+import secrets
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+
+# ==========================================================
+#   REPRODUZIERBARE ZUFALLSZAHLEN
+# ==========================================================
+# Alle Aufgaben-Generatoren bekommen ihren Zufallsgenerator als erstes
+# Argument (rng: random.Random). Eine Aufgabe ist damit vollständig durch
+# (Generator-ID, Seed) beschrieben und lässt sich jederzeit neu erzeugen.
+
+def new_seed() -> int:
+    return secrets.randbits(32)
+
+
+def make_rng(seed: int | None = None) -> random.Random:
+    return random.Random(new_seed() if seed is None else seed)
+
+
+def generator_id(generator) -> str:
+    """z.B. "lineare_gleichungssysteme._gen_tab1"."""
+    return f"{generator.__module__}.{generator.__name__}"
+
+
+def resolve(gen_id: str):
+    module, _, name = gen_id.rpartition(".")
+    return getattr(importlib.import_module(module), name)
+
+
+def generate(generator, seed: int):
+    """Aufgabe zu (Generator, Seed) erzeugen; generator als Funktion oder ID."""
+    if isinstance(generator, str):
+        generator = resolve(generator)
+    return generator(random.Random(seed))
+
+
+# ==========================================================
+#   KOMPAKTE AUFGABEN-REFERENZ
+# ==========================================================
+# In st.session_state liegt pro Aufgabe nur eine ProblemRef (ein Tupel aus
+# Generator-ID und Seed, ~100 Bytes; die ID-Strings sind Modulkonstanten und
+# werden geteilt). Die vollständige Aufgabe kommt aus einem prozessweiten
+# LRU-Speicher oder wird bei Bedarf deterministisch neu erzeugt. Aufgaben
+# aus diesem Speicher werden von mehreren Sessions gelesen und dürfen daher
+# nicht verändert werden.
+
+class ProblemRef(NamedTuple):
+    gen_id: str   # "<modul>.<generator>", siehe generator_id()
+    seed: int     # 32-bit Seed für random.Random
+
+
+MEMO_SIZE = 4096
+
+_MEMO = OrderedDict()
+_MEMO_LOCK = threading.Lock()
+
+
+def remember(ref: ProblemRef, problem):
+    with _MEMO_LOCK:
+        _MEMO[ref] = problem
+        _MEMO.move_to_end(ref)
+        while len(_MEMO) > MEMO_SIZE:
+            _MEMO.popitem(last=False)
+
+
+def load(ref: ProblemRef):
+    with _MEMO_LOCK:
+        problem = _MEMO.get(ref)
+        if problem is not None:
+            _MEMO.move_to_end(ref)
+            return problem
+    problem = generate(ref.gen_id, ref.seed)
+    remember(ref, problem)
+    return problem
@@ -0,0 +1,86 @@
+# tests/test_antworten.py
+import random
+from fractions import Fraction
+
+import pytest
+
+import antworten
+import arbeitsblatt
+from antworten import EXAKT, FAKTOR, GELD, PROZENT, check, parse
+
+
+@pytest.mark.parametrize("text, value", [
+    ("0,75", Fraction(3, 4)),
+    ("1.234,56 €", Fraction(123456, 100)),
+    ("-2", Fraction(-2)),
+    ("−2,5", Fraction(-5, 2)),
+    ("3/4", Fraction(3, 4)),
+    ("-7/2", Fraction(-7, 2)),
+    ("x = 0,75", Fraction(3, 4)),
+    ("K_n=100", Fraction(100)),
+    ("3,46 %", Fraction(346, 100)),
+    ("1.5", Fraction(3, 2)),
+])
+def test_parse(text, value):
+    assert parse(text) == value
+
+
+@pytest.mark.parametrize("text", ["", "  ", "abc", "1/0", "€"])
+def test_parse_invalid(text):
+    assert parse(text) is None
+    assert check(text, 1, EXAKT) is None
+
+
+def test_exact_fraction():
+    assert check("-3/4", -0.75, EXAKT)
+    assert check("-0,75", Fraction(-3, 4), EXAKT)
+    assert not check("-0,7", Fraction(-3, 4), EXAKT)
+    assert not check("1/3", 0.333, EXAKT)
+
+
+@pytest.mark.parametrize("rule, expected, right, wrong", [
+    # beide Nachbarn einer genau halben Stelle gelten (2,675 -> 2,67 oder 2,68)
+    (GELD, 2.675, ["2,68", "2,67", "2,675", "2.68 €"], ["2,66", "2,69", "2,7"]),
+    (GELD, 1234.5, ["1.234,50", "1234,5", "1234,505"], ["1.234,51", "1234,4949"]),
+    (FAKTOR, 1.03 ** (1 / 12), ["1,0025", "1,00247"], ["1,0024", "1,0026", "1,003"]),
+    (FAKTOR, 0.95, ["0,95", "0,9500", "0,95005"], ["0,9499", "0,9501"]),
+    (PROZENT, 3.456789, ["3,46", "3,46 %", "3,4568"], ["3,45", "3,47", "3,5"]),
+    (PROZENT, 0.005, ["0,01", "0,00", "0"], ["0,02", "-0,01"]),
+])
+def test_rounding_boundaries(rule, expected, right, wrong):
+    for text in right:
+        assert check(text, expected, rule) is True, text
+    for text in wrong:
+        assert check(text, expected, rule) is False, text
+
+
+def _answers(rng, solution, rules):
+    # je Feld richtig, gerundet, falsch, leer oder unlesbar
+    answers = {}
+    for field, rule in rules.items():
+        value = solution.get(field)
+        if value is None:
+            continue
+        expected = antworten._expected(value, rule)
+        if rule.kind == "exact":
+            right = str(expected)
+        else:
+            right = f"{float(expected):.{rule.decimals}f}".replace(".", ",")
+        answers[field] = rng.choice([right, right, f"{float(expected) + 1:.2f}", "", "abc"])
+    return answers
+
+
+@pytest.mark.parametrize("name", ["lgs.text", "lgs.3x3", "zz.barwert", "zz.kest", "zz.unbekannt",
+                                  "quad.erloes_gewinn", "bza.standard", "expgl.gemischt"])
+def test_check_batch_matches_check(name):
+    rng = random.Random(1)
+    items = arbeitsblatt.generate(name, 60, seed=3, vectorized=False)
+    problems = [it["problem"] for it in items]
+    solutions = [it["solution"] for it in items]
+    answers = [_answers(rng, s, antworten.RULES[name]) for s in solutions]
+
+    single = [antworten.check_task(name, p, a) for p, a in zip(problems, answers)]
+    assert antworten.check_batch(name, problems, answers) == single
+    assert antworten.check_batch(name, problems, answers, solutions) == single
+    assert any(True in r.values() for r in single)
+    assert any(False in r.values() for r in single)
@@ -0,0 +1,88 @@
+# tests/test_cashflow.py
+import math
+import warnings
+
+import pytest
+
+import cashflow
+
+
+@pytest.fixture(autouse=True)
+def fresh(monkeypatch):
+    # ohne Cache-Treffer und mit festem Warmstart
+    monkeypatch.setattr(cashflow, "_warm", dict(cashflow._warm))
+    cashflow._solve_rate.cache_clear()
+    cashflow._solve_term.cache_clear()
+    yield
+    cashflow._solve_rate.cache_clear()
+    cashflow._solve_term.cache_clear()
+
+
+def _loan(i, m, n, K=100_000.0):
+    # Kredit K, n nachschüssige Raten passend zum effektiven Jahreszins i
+    q = cashflow.period_factor(i, m)
+    R = K * (q - 1) / (1 - q ** -n)
+    return [(0, -K), *cashflow.annuity(R, n)], R
+
+
+def test_known_irr():
+    assert cashflow.solve_rate([(0, -1000), (1, 1100)]) == pytest.approx(10.0, abs=1e-9)
+    assert cashflow.solve_rate([(0, -100), (1, 0), (2, 121)]) == pytest.approx(10.0, abs=1e-9)
+    flows, _ = _loan(4.5, 1, 20)
+    assert cashflow.solve_rate(flows) == pytest.approx(4.5, abs=1e-9)
+
+
+def test_target_and_reference_time():
+    # 1000 wachsen in 3 Jahren auf 1331: 10 %
+    assert cashflow.solve_rate([(0, 1000)], target=1331, t_ref=3) == pytest.approx(10.0, abs=1e-9)
+
+
+@pytest.mark.parametrize("flows", [
+    [(0, 100), (1, 100)],
+    [(0, -100), (1, -50), (5, -10)],
+])
+def test_no_sign_change(flows):
+    assert cashflow.solve_rate(flows) is None
+
+
+def test_long_monthly_flow_without_overflow():
+    flows, _ = _loan(5.0, 12, 360)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert cashflow.solve_rate(flows, m=12) == pytest.approx(5.0, abs=1e-8)
+        assert cashflow.solve_rate(flows, t_ref=360, m=12) == pytest.approx(5.0, abs=1e-8)
+        # dieselben Zahlungen als 360 Jahre: exp(dt·x) würde am Rand des
+        # Intervalls überlaufen, EXP_LIMIT begrenzt es
+        i = cashflow.solve_rate(flows, t_ref=360)
+        assert math.isfinite(i)
+        assert cashflow.value_at(flows, i, 360) == pytest.approx(0.0, abs=1e-6 * 100_000)
+
+
+def test_term_with_growth():
+    assert cashflow.solve_term(1000, 2000, 5) == pytest.approx(math.log(2) / math.log(1.05), rel=1e-12)
+    flows, R = _loan(6.0, 12, 240)
+    assert cashflow.solve_term(-100_000, 0, 6.0, R, m=12) == pytest.approx(240, abs=1e-8)
+
+
+def test_term_without_interest():
+    # q == 1: lineares Wachstum K0 + R·n
+    assert cashflow.solve_term(100, 200, 0, 10) == pytest.approx(10.0, abs=1e-12)
+    assert cashflow.solve_term(-500, 0, 0, 25, m=12) == pytest.approx(20.0, abs=1e-12)
+    assert cashflow.solve_term(100, 50, 0, 10) is None
+
+
+def test_independent_of_warm_start():
+    problems = [_loan(i, m, n)[0] for i, m, n in [(0.5, 12, 360), (12.0, 1, 5), (-3.0, 1, 10),
+                                                  (250.0, 1, 3), (4.0, 4, 80)]]
+    ms = [12, 1, 1, 1, 4]
+
+    forward = [cashflow.solve_rate(f, m=m) for f, m in zip(problems, ms)]
+    cashflow._solve_rate.cache_clear()
+    backward = [cashflow.solve_rate(f, m=m) for f, m in reversed(list(zip(problems, ms)))][::-1]
+    cashflow._solve_rate.cache_clear()
+    cashflow._warm_set("rate", math.log(5.0))      # weit weg von jeder Lösung
+    far = [cashflow.solve_rate(f, m=m) for f, m in zip(problems, ms)]
+
+    assert forward == pytest.approx([0.5, 12.0, -3.0, 250.0, 4.0], abs=1e-8)
+    assert backward == pytest.approx(forward, rel=1e-10, abs=1e-10)
+    assert far == pytest.approx(forward, rel=1e-10, abs=1e-10)
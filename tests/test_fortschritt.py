@@ -0,0 +1,75 @@
+# tests/test_fortschritt.py
+import sqlite3
+import time
+
+import pytest
+
+import fortschritt
+
+
+def _rows(n, student="Mia"):
+    return [
+        (student, "zinseszins", "zz_barwert", fortschritt.NEU, "zinseszins._gen_barwert", k, None, time.time(), None)
+        for k in range(n)
+    ]
+
+
+def _count(path, table="events"):
+    conn = fortschritt.connect(path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def writer(tmp_path, monkeypatch):
+    monkeypatch.setattr(fortschritt, "DB_PATH", str(tmp_path / "fortschritt.db"))
+    return fortschritt._Writer()
+
+
+def _fail_once(monkeypatch):
+    add_counts = fortschritt._add_counts
+    calls = []
+
+    def flaky(conn, rows):
+        calls.append(len(rows))
+        if len(calls) == 1:
+            raise sqlite3.OperationalError("database is locked")
+        add_counts(conn, rows)
+
+    monkeypatch.setattr(fortschritt, "_add_counts", flaky)
+    return calls
+
+
+def test_failed_flush_keeps_events(writer, monkeypatch):
+    _fail_once(monkeypatch)
+    for row in _rows(5):
+        writer._queue.append(row)
+
+    writer.flush()                      # schlägt fehl, ohne Ausnahme
+    assert len(writer._queue) == 5
+    assert _count(fortschritt.DB_PATH) == 0
+
+    writer._queue.append(_rows(1, "Ben")[0])
+    writer.flush()
+    assert not writer._queue
+    assert _count(fortschritt.DB_PATH) == 6
+    assert _count(fortschritt.DB_PATH, "totals") == 2
+
+
+def test_background_thread_survives_failure(writer, monkeypatch):
+    monkeypatch.setattr(fortschritt, "FLUSH_INTERVAL", 0.01)
+    calls = _fail_once(monkeypatch)
+    for row in _rows(3):
+        writer.put(row)
+
+    deadline = time.time() + 5
+    while len(calls) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    writer.put(_rows(1)[0])
+    while _count(fortschritt.DB_PATH) < 4 and time.time() < deadline:
+        time.sleep(0.01)
+
+    assert len(calls) >= 2
+    assert _count(fortschritt.DB_PATH) == 4
@@ -0,0 +1,97 @@
+# tests/test_gesehen.py
+import random
+from types import SimpleNamespace
+
+import pytest
+
+import gesehen
+
+
+def _fps(n, seed=1):
+    rng = random.Random(seed)
+    return [rng.getrandbits(64) for _ in range(n)]
+
+
+def test_fingerprint_canonical():
+    a = gesehen.fingerprint("g", {"a": 2.0, "b": [1, 2]})
+    assert a == gesehen.fingerprint("g", {"b": (1, 2), "a": 2})
+    assert a != gesehen.fingerprint("h", {"a": 2, "b": [1, 2]})
+    assert a != gesehen.fingerprint("g", {"a": 2.5, "b": [1, 2]})
+
+
+def test_seen_set_evicts_least_recently_seen():
+    seen = gesehen.SeenSet(capacity=3)
+    for fp in (1, 2, 3):
+        seen.add(fp)
+    seen.add(1)                      # 1 wieder gesehen: jetzt ist 2 am ältesten
+    seen.add(4)
+    assert 2 not in seen
+    assert [fp in seen for fp in (1, 3, 4)] == [True, True, True]
+    assert len(seen) == 3
+
+    seen.add(5)                      # dann 3
+    assert 3 not in seen and 1 in seen
+    assert seen.seen_at(3) == -1
+    assert seen.seen_at(1) < seen.seen_at(4) < seen.seen_at(5)
+
+
+def test_bloom_rotation_keeps_recent():
+    capacity = 500
+    bloom = gesehen.BloomFilter(capacity, 0.01)
+    fps = _fps(5 * capacity + 123)
+    for n, fp in enumerate(fps, 1):
+        bloom.add(fp)
+        # die letzten capacity Einträge sind immer noch da (alter oder neuer Filter)
+        if n % 97 == 0:
+            assert all(f in bloom for f in fps[max(0, n - capacity):n])
+
+    assert all(fp in bloom for fp in fps[-capacity:])
+    forgotten = fps[: 3 * capacity]
+    assert sum(fp in bloom for fp in forgotten) < 0.05 * len(forgotten)
+
+
+def test_bloom_fp_rate():
+    bloom = gesehen.BloomFilter(2000, 0.01)
+    for fp in _fps(2000):
+        bloom.add(fp)
+    other = _fps(20_000, seed=2)
+    assert sum(fp in bloom for fp in other) / len(other) < 0.02
+
+
+@pytest.fixture
+def session(monkeypatch):
+    state = {}
+    monkeypatch.setattr(gesehen, "st", SimpleNamespace(session_state=state))
+    monkeypatch.setattr(gesehen, "_CLASSES", {})
+    return state
+
+
+def test_status_seen_at_mark(session):
+    a, b, c = _fps(3)
+    assert gesehen.status(a) == 0 and gesehen.seen_at(a) == -1
+
+    gesehen.mark(a)
+    gesehen.mark(b)
+    assert gesehen.status(a) == 2
+    assert 0 < gesehen.seen_at(a) < gesehen.seen_at(b)
+    assert gesehen.status(c) == 0           # ohne Klasse kein Status 1
+
+
+def test_status_in_class(session):
+    a, b = _fps(2)
+    session[gesehen.KLASSE_KEY] = "4B"
+    gesehen.mark(a)
+
+    # andere Session derselben Klasse (Groß-/Kleinschreibung egal)
+    session.clear()
+    session[gesehen.KLASSE_KEY] = " 4b "
+    assert gesehen.status(a) == 1
+    assert gesehen.seen_at(a) == -1
+    assert gesehen.status(b) == 0
+
+    gesehen.mark(a)
+    assert gesehen.status(a) == 2
+
+    session[gesehen.KLASSE_KEY] = "4C"
+    session.pop(gesehen.SESSION_KEY)
+    assert gesehen.status(a) == 0
@@ -0,0 +1,97 @@
+# tests/test_lineare_gleichungssysteme.py
+import random
+from fractions import Fraction
+
+import pytest
+
+from lineare_gleichungssysteme import _bareiss, _integer_rows, _solve_nxn
+
+
+def _rank(rows):
+    # Vergleich: Gauß mit Brüchen
+    M = [[Fraction(v) for v in row] for row in rows]
+    r = 0
+    for c in range(len(M[0]) if M else 0):
+        p = next((i for i in range(r, len(M)) if M[i][c] != 0), None)
+        if p is None:
+            continue
+        M[r], M[p] = M[p], M[r]
+        for i in range(len(M)):
+            if i != r and M[i][c] != 0:
+                f = M[i][c] / M[r][c]
+                M[i] = [a - f * b for a, b in zip(M[i], M[r])]
+        r += 1
+    return r
+
+
+def _check(A, rhs, sol):
+    n = len(A[0])
+    rank_A = _rank(A)
+    rank_Ab = _rank([list(row) + [b] for row, b in zip(A, rhs)])
+    if rank_Ab > rank_A:
+        assert sol == {"L": "none"}
+    elif rank_A < n:
+        assert sol == {"L": "inf", "rank": rank_A}
+    else:
+        assert sol["L"] == "one"
+        assert all(type(v) is Fraction for v in sol["x"])
+        for row, b in zip(A, rhs):
+            assert sum(Fraction(a) * v for a, v in zip(row, sol["x"])) == b
+
+
+def test_unique_2x2():
+    assert _solve_nxn([[2, 3], [4, -1]], [8, 2]) == {"L": "one", "x": [Fraction(1), Fraction(2)]}
+    assert _solve_nxn([[3, 1], [1, 2]], [1, 1]) == {"L": "one", "x": [Fraction(1, 5), Fraction(2, 5)]}
+
+
+def test_none_and_infinite_2x2():
+    assert _solve_nxn([[1, 2], [2, 4]], [3, 7]) == {"L": "none"}
+    assert _solve_nxn([[1, 2], [2, 4]], [3, 6]) == {"L": "inf", "rank": 1}
+
+
+def test_fraction_entries():
+    A = [[Fraction(1, 2), Fraction(1, 3)], [Fraction(1, 4), -1]]
+    rhs = [Fraction(5, 6), Fraction(-3, 4)]
+    assert _solve_nxn(A, rhs) == {"L": "one", "x": [Fraction(1), Fraction(1)]}
+    assert _integer_rows(A, rhs) == [[3, 2, 5], [1, -4, -3]]
+
+
+def test_zero_pivot_in_first_row():
+    assert _solve_nxn([[0, 1], [1, 1]], [2, 3]) == {"L": "one", "x": [Fraction(1), Fraction(2)]}
+    A = [[0, 0, 1], [0, 2, 1], [3, 1, 1]]
+    assert _solve_nxn(A, [3, 5, 6]) == {"L": "one", "x": [Fraction(2, 3), Fraction(1), Fraction(3)]}
+
+
+def test_singular_3x3():
+    A = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    assert _solve_nxn(A, [6, 15, 24]) == {"L": "inf", "rank": 2}
+    assert _solve_nxn(A, [6, 15, 25]) == {"L": "none"}
+    assert _solve_nxn([[1, 1, 1]] * 3, [1, 1, 1]) == {"L": "inf", "rank": 1}
+
+
+def test_rank_deficient_rectangular():
+    # 3 Gleichungen, 2 Unbekannte, eine davon überzählig
+    assert _solve_nxn([[1, 1], [2, 2], [1, -1]], [3, 6, 1]) == {"L": "one", "x": [Fraction(2), Fraction(1)]}
+    assert _solve_nxn([[1, 1], [2, 2], [1, -1]], [3, 7, 1]) == {"L": "none"}
+    # 2 Gleichungen, 3 Unbekannte
+    assert _solve_nxn([[1, 2, 3], [2, 4, 6]], [1, 2]) == {"L": "inf", "rank": 1}
+    assert _solve_nxn([[1, 0, 1], [0, 1, 1]], [1, 2]) == {"L": "inf", "rank": 2}
+    # Spalte ohne Pivot in der Mitte
+    assert _solve_nxn([[1, 2, 0], [2, 4, 1], [3, 6, 1]], [1, 3, 4]) == {"L": "inf", "rank": 2}
+
+
+def test_bareiss_pivots_and_zero_rows():
+    M = _integer_rows([[1, 2, 3], [2, 4, 6], [1, 0, 1]], [1, 2, 1])
+    assert _bareiss(M) == [0, 1]
+    assert M[2] == [0, 0, 0, 0]
+
+
+@pytest.mark.parametrize("m, n", [(2, 2), (3, 3), (4, 4), (3, 2), (2, 3), (5, 4)])
+def test_random_against_fractions(m, n):
+    rng = random.Random(m * 10 + n)
+    for _ in range(300):
+        A = [[rng.randint(-3, 3) for _ in range(n)] for _ in range(m)]
+        if rng.random() < 0.3 and m > 1:
+            A[-1] = [rng.randint(-2, 2) * a for a in A[0]]     # Rang absichtlich kleiner
+        rhs = [rng.randint(-5, 5) for _ in range(m)]
+        _check(A, rhs, _solve_nxn(A, rhs))
@@ -0,0 +1,37 @@
+# tests/test_plotting.py
+import matplotlib
+
+matplotlib.use("Agg")
+
+import plotting
+
+
+def test_unclosed_figure_is_counted():
+    before = plotting.live_figures()
+    fig, _ = plotting.subplots()
+    assert plotting.live_figures() == before + 1
+
+    plotting.close(fig)
+    assert plotting.live_figures() == before
+
+
+def test_figure_closes_on_error():
+    before = plotting.live_figures()
+    try:
+        with plotting.figure():
+            assert plotting.live_figures() == before + 1
+            raise ValueError
+    except ValueError:
+        pass
+    assert plotting.live_figures() == before
+
+
+def test_tally_per_session(monkeypatch):
+    monkeypatch.setattr(plotting, "_session_id", lambda: "A")
+    fig, _ = plotting.subplots()
+    monkeypatch.setattr(plotting, "_session_id", lambda: "B")
+    assert plotting.live_figures() == 0
+    assert plotting.live_figures("A") == 1
+
+    plotting.close(fig)                 # zählt bei der erzeugenden Session
+    assert plotting.live_figures("A") == 0
@@ -1,8 +1,11 @@
 # trigonometrie.py
 import streamlit as st
-import random
 import math
 
+import aufgabenraum
+import fortschritt
+import problem_pool
+
 # ==========================================================
 #   HELPERS
 # ==========================================================
@@ -14,26 +17,26 @@ def fmt(x, nd=2):
 #   GENERATOR
 # ==========================================================
 
-def gen_problem():
+def gen_problem(rng):
     # rechter Winkel bei C
-    alpha = random.choice([20, 25, 30, 35, 40, 45, 50, 55, 60])
+    alpha = rng.choice([20, 25, 30, 35, 40, 45, 50, 55, 60])
     beta = 90 - alpha
 
-    mode = random.choice(["two_sides", "side_angle"])
+    mode = rng.choice(["two_sides", "side_angle"])
 
-    c = random.choice([8, 9, 10, 12, 15, 18])
+    c = rng.choice([8, 9, 10, 12, 15, 18])
     a = c * math.sin(math.radians(alpha))
     b = c * math.cos(math.radians(alpha))
 
     given = {}
 
     if mode == "two_sides":
-        give = random.choice([("a","b"), ("a","c"), ("b","c")])
+        give = rng.choice([("a","b"), ("a","c"), ("b","c")])
         for k in give:
             given[k] = {"a": a, "b": b, "c": c}[k]
     else:
-        side = random.choice(["a","b","c"])
-        ang = random.choice(["alpha","beta"])
+        side = rng.choice(["a","b","c"])
+        ang = rng.choice(["alpha","beta"])
         given[side] = {"a": a, "b": b, "c": c}[side]
         given[ang] = {"alpha": alpha, "beta": beta}[ang]
 
@@ -43,6 +46,12 @@ def gen_problem():
         "given": given
     }
 
+def solve_problem(p):
+    return {
+        "a": p["a"], "b": p["b"], "c": p["c"],
+        "alpha": p["alpha"], "beta": p["beta"], "gamma": 90,
+    }
+
 # ==========================================================
 #   TAB 1
 # ==========================================================
@@ -53,10 +62,7 @@ def tab1():
     if st.button("Neues Beispiel", key="trig_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        st.session_state[key] = gen_problem()
-
-    p = st.session_state[key]
+    p = problem_pool.current(key, gen_problem)
     g = p["given"]
 
     st.subheader("Rechtwinkliges Dreieck")
@@ -76,14 +82,17 @@ def tab1():
 
     st.markdown("**Gegeben:** " + ", ".join(tags))
     st.markdown("**Aufgabe:** Bestimme die restlichen Seiten und Winkel des Dreiecks.")
+    aufgabenraum.caption(gen_problem)
 
     if st.button("Lösung anzeigen", key="trig_sol"):
+        fortschritt.loesung(key)
+        s = solve_problem(p)
         st.markdown("**Lösung:**")
         st.latex(
-            rf"a \approx {fmt(p['a'])},\quad b \approx {fmt(p['b'])},\quad c = {fmt(p['c'])}"
+            rf"a \approx {fmt(s['a'])},\quad b \approx {fmt(s['b'])},\quad c = {fmt(s['c'])}"
         )
         st.latex(
-            rf"\alpha = {p['alpha']}^\circ,\quad \beta = {p['beta']}^\circ,\quad \gamma = 90^\circ"
+            rf"\alpha = {s['alpha']}^\circ,\quad \beta = {s['beta']}^\circ,\quad \gamma = {s['gamma']}^\circ"
         )
 
 # ==========================================================
@@ -0,0 +1,155 @@
+# uebersicht.py
+from datetime import date, datetime
+
+import pandas as pd
+import streamlit as st
+
+import aufgabenraum
+import fortschritt
+
+
+# ==========================================================
+#   ÜBERSICHT FÜR LEHRKRÄFTE
+# ==========================================================
+# Liest nur die Zähler-Tabellen aus fortschritt (totals, daily), nie den
+# Ereignis-Verlauf; die Seite bleibt damit auch nach einem Semester mit
+# hunderten Schüler*innen schnell.
+
+# Session-Schlüssel der Aufgabe -> Tab im Kapitel
+TABS = {
+    "poly_problem_coeff_v1": "Besondere Punkte einer Funktion",
+    "variable_problem_v2": "Abhängige & unabhängige Variablen",
+    "t1_prob": "Zeichnen (leicht)",
+    "t2_prob": "Zeichnen (schwer)",
+    "t3_prob": "Ermitteln (einfach)",
+    "t4_prob": "Ermitteln (schwer)",
+    "t5_prob": "Differenzenquotient",
+    "lgs_tab1": "Eindeutig lösbar",
+    "lgs_tab2": "Textaufgaben",
+    "lgs_tab3": "Lösungsmenge + Grafik",
+    "mat_add": "Matrix-Addition",
+    "mat_mul": "Matrix-Multiplikation I",
+    "mat_missing": "Matrix-Multiplikation II",
+    "quad_tab1": "Diskriminante",
+    "quad_tab2": "Erlös & Gewinn",
+    "trig_tab1": "Rechtwinkliges Dreieck",
+    "expfkt_graph": "Funktion aus Graph",
+    "expfkt_fun": "Funktion aus Textangabe",
+    "expfkt_linexp": "Linear vs. Exponentiell",
+    "aend_abs": "Absolute Änderung",
+    "aend_mittel": "Mittlere Änderung",
+    "aend_rel": "Relative Änderung",
+    "af_single": "Änderungsfaktor",
+    "af_ges": "Gesamter Änderungsfaktor",
+    "af_mittel": "Mittlerer Änderungsfaktor",
+    "exp_example_mixed": "Gemischt",
+    "exp_example_AB": "Variante A",
+    "exp_example_CD": "Variante B",
+    "exp_example_F": "Variante C",
+    "bza_data": "Beschränkte Zu-/Abnahme",
+    "zz_barwert": "Barwert",
+    "zz_endwert": "Endwert",
+    "zz_barwert_mehrere": "Barwert mehrere Zahlungen",
+    "zz_endwert_mehrere": "Endwert mehrere Zahlungen",
+    "zz_angebote": "Angebote vergleichen",
+    "zz_kest": "KESt",
+    "zz_theoretisch": "Theoretische Verzinsung",
+    "zz_unterjaehrig": "Unterjährige Verzinsung",
+    "zz_unbekannt": "Zinssatz / Laufzeit gesucht",
+    "rente_task": "Renten erkennen",
+}
+
+ZEITRAUM = {"Heute": 1, "Letzte 7 Tage": 7, "Letzte 30 Tage": 30, "Gesamt": None}
+
+SPALTEN = {
+    "neu": "Aufgaben",
+    "antwort": "Antworten geprüft",
+    "richtig": "davon richtig",
+    "loesung": "Lösung angezeigt",
+}
+
+
+def _quote(richtig, antwort):
+    return f"{richtig / antwort:.0%}" if antwort else "–"
+
+
+def run(chapters: dict):
+    """chapters: Seitentitel -> Modulname (wie main.CHAPTERS)."""
+    st.title("Übersicht für Lehrkräfte")
+
+    fortschritt.flush()  # eigene, noch nicht geschriebene Ereignisse
+    titles = {module: title for title, module in chapters.items()}
+    order = {module: k for k, module in enumerate(chapters.values())}
+
+    zeitraum = st.radio("Zeitraum", list(ZEITRAUM), index=1, horizontal=True)
+    days = ZEITRAUM[zeitraum]
+
+    conn = fortschritt.connect()
+    try:
+        stats = fortschritt.tab_stats(days, conn=conn)
+        verlauf = fortschritt.daily_stats(30, conn=conn)
+    finally:
+        conn.close()
+
+    if not stats:
+        st.info("Im gewählten Zeitraum gibt es noch keine Aktivität.")
+        return
+
+    # ----------------- Summen -----------------
+    cols = st.columns(len(SPALTEN))
+    for col, (field, label) in zip(cols, SPALTEN.items()):
+        col.metric(label, sum(r[field] for r in stats))
+
+    # ----------------- je Kapitel und Tab -----------------
+    st.subheader("Kapitel und Tabs")
+    tab_order = {key: k for k, key in enumerate(TABS)}
+    stats = sorted(stats, key=lambda r: (order.get(r["chapter"], len(order)), tab_order.get(r["problem_key"], len(TABS))))
+    rows = []
+    for r in stats:
+        row = {
+            "Kapitel": titles.get(r["chapter"], r["chapter"]),
+            "Tab": TABS.get(r["problem_key"], r["problem_key"]),
+            **{label: r[field] for field, label in SPALTEN.items()},
+            "Quote": _quote(r["richtig"], r["antwort"]),
+        }
+        if days is None:
+            row["Schüler*innen"] = r["schueler"]
+        rows.append(row)
+    st.dataframe(pd.DataFrame(rows), hide_index=True, width="stretch")
+
+    # ----------------- Verlauf -----------------
+    if verlauf:
+        st.subheader("Aktivität der letzten 30 Tage")
+        df = pd.DataFrame(
+            [{SPALTEN[f]: r[f] for f in ("neu", "antwort", "loesung")} for r in verlauf],
+            index=[date.fromordinal(r["day"]) for r in verlauf],
+        )
+        st.bar_chart(df)
+
+    # ----------------- je Schüler*in -----------------
+    st.subheader("Schüler*innen (gesamt)")
+    shown = list(dict.fromkeys(r["chapter"] for r in stats))
+    chapter = st.selectbox("Kapitel", shown, format_func=lambda m: titles.get(m, m))
+    raeume = [g for g in aufgabenraum.RAEUME if g.rpartition(".")[0] == chapter]
+    conn = fortschritt.connect()
+    try:
+        schueler = fortschritt.student_stats(chapter, conn=conn)
+        abdeckung, groesse = aufgabenraum.coverage_by_student(raeume, conn=conn)
+    finally:
+        conn.close()
+    rows = []
+    for r in schueler:
+        row = {
+            "Name": r["student"],
+            **{label: r[field] for field, label in SPALTEN.items()},
+            "Quote": _quote(r["richtig"], r["antwort"]),
+        }
+        if raeume:
+            done = abdeckung.get(r["student"], 0)
+            row["Abdeckung"] = f"{done} / {groesse} ({done / groesse:.0%})"
+        row["Zuletzt aktiv"] = datetime.fromtimestamp(r["last"]).strftime("%d.%m.%Y %H:%M")
+        rows.append(row)
+    st.dataframe(pd.DataFrame(rows), hide_index=True, width="stretch")
+    if raeume:
+        st.caption("Abdeckung: verschiedene gesehene Aufgaben aus den vollständig "
+                   "aufgezählten Aufgabenräumen dieses Kapitels.")
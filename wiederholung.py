@@ -0,0 +1,174 @@
+# wiederholung.py
+import heapq
+import itertools
+import threading
+
+import streamlit as st
+
+import fortschritt
+import problem_pool
+import seeding
+
+
+# ==========================================================
+#   ADAPTIVE AUFGABENWAHL (verteiltes Wiederholen)
+# ==========================================================
+# Für Tabs mit mehreren Aufgabenfamilien (z.B. LGS Form A/B/C,
+# Exponentialgleichungen Typ A–F) wählt ein Plan je Schüler*in die nächste
+# Familie. Die Familien sind nach Schwierigkeit geordnet; jede steckt in
+# einer Box wie bei einer Lernkartei:
+#
+#   richtig                        -> Box + 1, wieder dran nach 2^Box Aufgaben
+#   falsch oder Lösung angezeigt   -> Box 0, gleich wieder dran
+#
+# Es zählt nur das erste Ergebnis je Aufgabe.
+# Die nächste, schwierigere Familie kommt dazu, sobald nichts fällig ist und
+# alle bisherigen mindestens einmal richtig gelöst wurden. Gezählt wird in
+# Aufgaben (Takten), nicht in Zeit.
+#
+# Fällige Familien liegen in einem Heap (heapq) nach Fälligkeit: Auswahl
+# und Umplanen kosten O(log n), unabhängig von der Länge des Verlaufs.
+# Der Verlauf wird nur einmal pro Prozess aus fortschritt nachgespielt,
+# danach hält der Plan sich über fortschritt-Ereignisse aktuell.
+
+MAX_BOX = 5   # längster Abstand 2^5 = 32 Aufgaben
+
+
+class Plan:
+    def __init__(self, families):
+        self.families = list(families)   # Generator-IDs, leicht -> schwer
+        self.step = 0
+        self.box = {}                    # Familie -> Box (nur bereits eingeführte)
+        self._heap = []                  # (fällig, seq, familie); veraltete Einträge bleiben liegen
+        self._entry = {}                 # familie -> gültiger (fällig, seq)
+        self._seq = itertools.count()
+        self._new = 0                    # erste noch nicht eingeführte Familie (Index)
+        self._unsolved = 0               # eingeführte Familien in Box 0
+        self.current = None              # zuletzt gewählte Familie
+        self.graded = True               # aktuelle Aufgabe schon bewertet?
+
+    def _push(self, family, due):
+        entry = (due, next(self._seq))
+        self._entry[family] = entry
+        heapq.heappush(self._heap, (*entry, family))
+
+    def _top(self):
+        # veraltete Einträge erst beim Ansehen entfernen (lazy deletion)
+        while self._heap and self._entry.get(self._heap[0][2]) != self._heap[0][:2]:
+            heapq.heappop(self._heap)
+        return self._heap[0] if self._heap else None
+
+    def _interval(self, family) -> int:
+        return 2 ** self.box[family]
+
+    def _set_box(self, family, box):
+        self._unsolved += (box == 0) - (self.box.get(family, 1) == 0)
+        self.box[family] = box
+
+    def next(self) -> str:
+        """Nächste Familie wählen (und als gewählt vormerken)."""
+        self.step += 1
+        top = self._top()
+        while self._new < len(self.families) and self.families[self._new] in self.box:
+            self._new += 1
+        if self._new < len(self.families) and (top is None or top[0] > self.step) and not self._unsolved:
+            family = self.families[self._new]   # schwieriger werden
+        elif top is not None:
+            family = top[2]              # fällig bzw. am frühesten fällig
+        else:
+            family = self.families[0]
+        self.select(family)
+        return family
+
+    def select(self, family):
+        """family wird als nächste Aufgabe bearbeitet (auch beim Nachspielen)."""
+        if family not in self.box:
+            self._set_box(family, 0)
+        self.current, self.graded = family, False
+        # vorläufig umplanen; ohne Bewertung (nur „Neues Beispiel“) bleibt es dabei
+        self._push(family, self.step + self._interval(family))
+
+    def grade(self, correct: bool):
+        """Erste Bewertung der aktuellen Aufgabe; weitere werden ignoriert."""
+        if self.graded or self.current is None:
+            return
+        family = self.current
+        self._set_box(family, min(self.box[family] + 1, MAX_BOX) if correct else 0)
+        self.graded = True
+        self._push(family, self.step + self._interval(family))
+
+
+# ----------------- Pläne je Schüler*in -----------------
+
+_PLANS = {}                    # (student, key) -> Plan
+_LOCK = threading.Lock()
+
+
+def _replay(plan: Plan, student: str, key: str, chapter: str):
+    fortschritt.flush()
+    for e in fortschritt.events(student, chapter):
+        if e["problem_key"] != key:
+            continue
+        if e["kind"] == fortschritt.NEU:
+            if e["gen_id"] in plan.families:
+                plan.step += 1
+                plan.select(e["gen_id"])
+            else:
+                plan.current = None      # Aufgabe aus der früheren, zufälligen Auswahl
+        else:
+            _apply(plan, e["kind"], e["correct"])
+
+
+def _apply(plan: Plan, kind: str, correct):
+    if kind == fortschritt.ANTWORT and correct is not None:
+        plan.grade(bool(correct))
+    elif kind == fortschritt.LOESUNG:
+        plan.grade(False)
+
+
+def plan_for(key: str, generators) -> Plan:
+    families = [seeding.generator_id(g) for g in generators]
+    student = fortschritt.student()
+    plan = _PLANS.get((student, key))
+    if plan is not None and plan.families == families:
+        return plan
+    # Nachspielen (Datenbank) ohne Lock; eingesetzt wird unter dem Lock, es
+    # gewinnt der zuerst fertige Plan (wie aufgabenraum._seen)
+    new = Plan(families)
+    _replay(new, student, key, generators[0].__module__)
+    with _LOCK:
+        plan = _PLANS.get((student, key))
+        if plan is None or plan.families != families:
+            plan = _PLANS[student, key] = new
+    return plan
+
+
+def _on_event(student, key, kind, ref, correct):
+    # "neu" ist schon in Plan.next() verbucht
+    if kind == fortschritt.NEU:
+        return
+    with _LOCK:
+        plan = _PLANS.get((student, key))
+        if plan is not None and ref.gen_id == plan.current:
+            _apply(plan, kind, correct)
+
+
+fortschritt.subscribe(_on_event)
+
+
+# ----------------- wie problem_pool.renew / current -----------------
+
+def renew(key: str, generators):
+    """Neue Aufgabe aus der vom Plan gewählten Familie (generators: leicht -> schwer)."""
+    plan = plan_for(key, generators)
+    with _LOCK:
+        family = plan.next()
+    return problem_pool.renew(key, generators[plan.families.index(family)])
+
+
+def current(key: str, generators):
+    """Aktuelle Aufgabe der Session unter key (bei Bedarf eine neue vom Plan)."""
+    ref = st.session_state.get(key)
+    if not isinstance(ref, seeding.ProblemRef):
+        return renew(key, generators)
+    return seeding.load(ref)
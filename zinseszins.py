@@ -1,15 +1,20 @@
+import math
+
 import streamlit as st
-import random
-import matplotlib.pyplot as plt
+
+import antworten
+import aufgabenraum
+import cashflow
+import fortschritt
+import plotting
+import problem_pool
 
 
 def euro(x):
     return f"{x:,.2f} €".replace(",", "X").replace(".", ",").replace("X", ".")
 
 
-def _draw_timeline(payments, n_max, title=None):
-    fig, ax = plt.subplots(figsize=(9, 2.4))
-
+def _plot_timeline(ax, payments, n_max, title=None):
     ax.hlines(0, 0, n_max + 0.4, linewidth=2)
     ax.annotate(
         "",
@@ -38,29 +43,38 @@ def _draw_timeline(payments, n_max, title=None):
 
     ax.set_ylim(-0.5, 1.35)
     ax.axis("off")
-    st.pyplot(fig)
+
+
+def _draw_timeline(payments, n_max, title=None):
+    plotting.show(
+        "zz_timeline", (tuple(payments), n_max, title),
+        lambda ax: _plot_timeline(ax, payments, n_max, title),
+        figsize=(9, 2.4),
+    )
+
+
+def _gen_barwert(rng):
+    return {
+        "name": rng.choice(["Frau Berger", "Herr Müller", "Frau Novak", "Herr Steiner"]),
+        "ziel": rng.choice(["eine Reise", "ein neues Auto", "eine Ausbildung"]),
+        "K_n": rng.choice([2000, 3000, 5000, 8000, 10000]),
+        "n": rng.randint(2, 8),
+        "i": rng.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
+    }
+
+
+def _solve_barwert(d):
+    q = 1 + d["i"] / 100
+    return {"q": q, "K_0": cashflow.present_value(cashflow.single(d["n"], d["K_n"]), d["i"])}
 
 
 def _mode_barwert():
     key = "zz_barwert"
 
-    if key in st.session_state and "K_n" not in st.session_state[key]:
-        st.session_state.pop(key, None)
-
     if st.button("Neues Beispiel", key="zz_barwert_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        st.session_state[key] = {
-            "name": random.choice(["Frau Berger", "Herr Müller", "Frau Novak", "Herr Steiner"]),
-            "ziel": random.choice(["eine Reise", "ein neues Auto", "eine Ausbildung"]),
-            "K_n": random.choice([2000, 3000, 5000, 8000, 10000]),
-            "n": random.randint(2, 8),
-            "i": random.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
-        }
-
-    d = st.session_state[key]
-    q = 1 + d["i"] / 100
+    d = problem_pool.current(key, _gen_barwert)
 
     st.subheader("Barwert berechnen")
 
@@ -70,8 +84,12 @@ def _mode_barwert():
         f"Wie viel muss heute angelegt werden?"
     )
 
+    antworten.eingabe(key, "zz.barwert", d, {"K_0": "K₀ (€)"})
+
     if st.button("Lösung anzeigen", key="zz_barwert_sol"):
-        K_0 = d["K_n"] * q ** (-d["n"])
+        fortschritt.loesung(key)
+        sol = _solve_barwert(d)
+        q, K_0 = sol["q"], sol["K_0"]
 
         _draw_timeline([(d["n"], d["K_n"])], d["n"], "Abzinsung auf jetzt")
 
@@ -83,26 +101,28 @@ def _mode_barwert():
         st.success(f"Heute müssen {euro(K_0)} angelegt werden.")
 
 
+def _gen_endwert(rng):
+    return {
+        "name": rng.choice(["Frau Berger", "Herr Müller", "Frau Novak", "Herr Steiner"]),
+        "ziel": rng.choice(["eine Reise", "ein neues Auto", "eine Ausbildung"]),
+        "K_0": rng.choice([1000, 2000, 3000, 5000]),
+        "n": rng.randint(2, 8),
+        "i": rng.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
+    }
+
+
+def _solve_endwert(d):
+    q = 1 + d["i"] / 100
+    return {"q": q, "K_n": cashflow.value_at(cashflow.single(0, d["K_0"]), d["i"], d["n"])}
+
+
 def _mode_endwert():
     key = "zz_endwert"
 
-    if key in st.session_state and "K_0" not in st.session_state[key]:
-        st.session_state.pop(key, None)
-
     if st.button("Neues Beispiel", key="zz_endwert_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        st.session_state[key] = {
-            "name": random.choice(["Frau Berger", "Herr Müller", "Frau Novak", "Herr Steiner"]),
-            "ziel": random.choice(["eine Reise", "ein neues Auto", "eine Ausbildung"]),
-            "K_0": random.choice([1000, 2000, 3000, 5000]),
-            "n": random.randint(2, 8),
-            "i": random.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
-        }
-
-    d = st.session_state[key]
-    q = 1 + d["i"] / 100
+    d = problem_pool.current(key, _gen_endwert)
 
     st.subheader("Endwert berechnen")
 
@@ -112,8 +132,12 @@ def _mode_endwert():
         f"Wie viel Geld ist in {d['n']} Jahren vorhanden?"
     )
 
+    antworten.eingabe(key, "zz.endwert", d, {"K_n": "Kₙ (€)"})
+
     if st.button("Lösung anzeigen", key="zz_endwert_sol"):
-        K_n = d["K_0"] * q ** d["n"]
+        fortschritt.loesung(key)
+        sol = _solve_endwert(d)
+        q, K_n = sol["q"], sol["K_n"]
 
         _draw_timeline([(0, d["K_0"])], d["n"], f"Aufzinsung bis Jahr {d['n']}")
 
@@ -125,28 +149,31 @@ def _mode_endwert():
         st.success(f"In {d['n']} Jahren sind {euro(K_n)} vorhanden.")
 
 
+def _gen_barwert_mehrere(rng):
+    n = rng.randint(2, 8)
+    return {
+        "name": rng.choice(["Frau Berger", "Herr Müller", "Frau Novak", "Herr Steiner"]),
+        "ziel": rng.choice(["eine Reise", "ein neues Auto", "eine Ausbildung"]),
+        "K_0": rng.choice([1000, 2000, 3000]),
+        "K_n": rng.choice([2000, 3000, 5000, 8000]),
+        "n": n,
+        "i": rng.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
+    }
+
+
+def _solve_barwert_mehrere(d):
+    q = 1 + d["i"] / 100
+    payments = [(0, d["K_0"]), (d["n"], d["K_n"])]
+    return {"q": q, "BW": cashflow.present_value(payments, d["i"])}
+
+
 def _mode_barwert_mehrere():
     key = "zz_barwert_mehrere"
 
-    if key in st.session_state and "name" not in st.session_state[key]:
-        st.session_state.pop(key, None)
-
     if st.button("Neues Beispiel", key="zz_barwert_mehrere_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        n = random.randint(2, 8)
-        st.session_state[key] = {
-            "name": random.choice(["Frau Berger", "Herr Müller", "Frau Novak", "Herr Steiner"]),
-            "ziel": random.choice(["eine Reise", "ein neues Auto", "eine Ausbildung"]),
-            "K_0": random.choice([1000, 2000, 3000]),
-            "K_n": random.choice([2000, 3000, 5000, 8000]),
-            "n": n,
-            "i": random.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
-        }
-
-    d = st.session_state[key]
-    q = 1 + d["i"] / 100
+    d = problem_pool.current(key, _gen_barwert_mehrere)
 
     st.subheader("Barwert mehrerer Zahlungen")
 
@@ -157,9 +184,13 @@ def _mode_barwert_mehrere():
         f"Wie groß ist der Barwert dieser Zahlungen?"
     )
 
+    antworten.eingabe(key, "zz.barwert_mehrere", d, {"BW": "Barwert (€)"})
+
     if st.button("Lösung anzeigen", key="zz_barwert_mehrere_sol"):
+        fortschritt.loesung(key)
+        sol = _solve_barwert_mehrere(d)
+        q, BW = sol["q"], sol["BW"]
         payments = [(0, d["K_0"]), (d["n"], d["K_n"])]
-        BW = d["K_0"] + d["K_n"] * q ** (-d["n"])
 
         _draw_timeline(payments, d["n"], "Abzinsung auf jetzt")
 
@@ -171,28 +202,31 @@ def _mode_barwert_mehrere():
         st.success(f"Der Barwert beträgt {euro(BW)}.")
 
 
+def _gen_endwert_mehrere(rng):
+    n = rng.randint(2, 8)
+    return {
+        "name": rng.choice(["Frau Berger", "Herr Müller", "Frau Novak", "Herr Steiner"]),
+        "ziel": rng.choice(["eine Reise", "ein neues Auto", "eine Ausbildung"]),
+        "K_0": rng.choice([1000, 2000, 3000]),
+        "K_n": rng.choice([2000, 3000, 5000, 8000]),
+        "n": n,
+        "i": rng.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
+    }
+
+
+def _solve_endwert_mehrere(d):
+    q = 1 + d["i"] / 100
+    payments = [(0, d["K_0"]), (d["n"], d["K_n"])]
+    return {"q": q, "EW": cashflow.future_value(payments, d["i"], d["n"])}
+
+
 def _mode_endwert_mehrere():
     key = "zz_endwert_mehrere"
 
-    if key in st.session_state and "name" not in st.session_state[key]:
-        st.session_state.pop(key, None)
-
     if st.button("Neues Beispiel", key="zz_endwert_mehrere_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        n = random.randint(2, 8)
-        st.session_state[key] = {
-            "name": random.choice(["Frau Berger", "Herr Müller", "Frau Novak", "Herr Steiner"]),
-            "ziel": random.choice(["eine Reise", "ein neues Auto", "eine Ausbildung"]),
-            "K_0": random.choice([1000, 2000, 3000]),
-            "K_n": random.choice([2000, 3000, 5000, 8000]),
-            "n": n,
-            "i": random.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
-        }
-
-    d = st.session_state[key]
-    q = 1 + d["i"] / 100
+    d = problem_pool.current(key, _gen_endwert_mehrere)
 
     st.subheader("Endwert mehrerer Zahlungen")
 
@@ -203,9 +237,13 @@ def _mode_endwert_mehrere():
         f"Wie viel Geld ist direkt nach der zweiten Einzahlung vorhanden?"
     )
 
+    antworten.eingabe(key, "zz.endwert_mehrere", d, {"EW": "Endwert (€)"})
+
     if st.button("Lösung anzeigen", key="zz_endwert_mehrere_sol"):
+        fortschritt.loesung(key)
+        sol = _solve_endwert_mehrere(d)
+        q, EW = sol["q"], sol["EW"]
         payments = [(0, d["K_0"]), (d["n"], d["K_n"])]
-        EW = d["K_0"] * q ** d["n"] + d["K_n"]
 
         _draw_timeline(payments, d["n"], f"Aufzinsung bis Jahr {d['n']}")
 
@@ -217,38 +255,48 @@ def _mode_endwert_mehrere():
         st.success(f"Der Endwert beträgt {euro(EW)}.")
 
 
-def _mode_angebote():
-    key = "zz_angebote"
+def _gen_angebote(rng):
+    n_max = rng.randint(3, 6)
 
-    if key in st.session_state and "angebot_a" not in st.session_state[key]:
-        st.session_state.pop(key, None)
+    angebot_a = sorted([
+        (0, rng.choice([20000, 30000, 40000])),
+        (rng.randint(1, n_max), rng.choice([20000, 30000, 40000])),
+    ])
 
-    if st.button("Neues Beispiel", key="zz_angebote_new"):
-        st.session_state.pop(key, None)
+    angebot_b = sorted([
+        (0, rng.choice([10000, 20000, 30000])),
+        (rng.randint(1, n_max), rng.choice([20000, 30000, 40000])),
+        (rng.randint(1, n_max), rng.choice([10000, 20000, 30000])),
+    ])
 
-    if key not in st.session_state:
-        n_max = random.randint(3, 6)
+    return {
+        "angebot_a": angebot_a,
+        "angebot_b": angebot_b,
+        "i": rng.choice([2, 2.5, 3, 3.5, 4]),
+        "n_max": n_max,
+    }
 
-        angebot_a = sorted([
-            (0, random.choice([20000, 30000, 40000])),
-            (random.randint(1, n_max), random.choice([20000, 30000, 40000])),
-        ])
 
-        angebot_b = sorted([
-            (0, random.choice([10000, 20000, 30000])),
-            (random.randint(1, n_max), random.choice([20000, 30000, 40000])),
-            (random.randint(1, n_max), random.choice([10000, 20000, 30000])),
-        ])
+def _solve_angebote(d):
+    q = 1 + d["i"] / 100
+    BW_A = cashflow.present_value(d["angebot_a"], d["i"])
+    BW_B = cashflow.present_value(d["angebot_b"], d["i"])
+    besser = "A" if BW_A > BW_B else "B" if BW_B > BW_A else None
+    # Zinssatz, bei dem beide Angebote gleich viel wert sind (None, wenn es keinen gibt)
+    differenz = list(d["angebot_a"]) + [(t, -b) for t, b in d["angebot_b"]]
+    i_gleich = cashflow.solve_rate(differenz)
+    if i_gleich is not None and not 0 < i_gleich < 50:
+        i_gleich = None
+    return {"q": q, "BW_A": BW_A, "BW_B": BW_B, "besser": besser, "i_gleich": i_gleich}
 
-        st.session_state[key] = {
-            "angebot_a": angebot_a,
-            "angebot_b": angebot_b,
-            "i": random.choice([2, 2.5, 3, 3.5, 4]),
-            "n_max": n_max,
-        }
 
-    d = st.session_state[key]
-    q = 1 + d["i"] / 100
+def _mode_angebote():
+    key = "zz_angebote"
+
+    if st.button("Neues Beispiel", key="zz_angebote_new"):
+        st.session_state.pop(key, None)
+
+    d = problem_pool.current(key, _gen_angebote)
 
     st.subheader("Angebote vergleichen")
 
@@ -270,8 +318,9 @@ def _mode_angebote():
     )
 
     if st.button("Lösung anzeigen", key="zz_angebote_sol"):
-        BW_A = sum(betrag * q ** (-t) for t, betrag in d["angebot_a"])
-        BW_B = sum(betrag * q ** (-t) for t, betrag in d["angebot_b"])
+        fortschritt.loesung(key)
+        sol = _solve_angebote(d)
+        q, BW_A, BW_B = sol["q"], sol["BW_A"], sol["BW_B"]
 
         st.markdown("### Zeitachsen")
 
@@ -299,27 +348,42 @@ def _mode_angebote():
         st.latex(fr"BW_A = {rech_a} = {BW_A:.2f}")
         st.latex(fr"BW_B = {rech_b} = {BW_B:.2f}")
 
-        if BW_A > BW_B:
+        if sol["besser"] == "A":
             st.success(f"Man sollte Angebot A wählen, weil der Barwert mit {euro(BW_A)} größer ist.")
-        elif BW_B > BW_A:
+        elif sol["besser"] == "B":
             st.success(f"Man sollte Angebot B wählen, weil der Barwert mit {euro(BW_B)} größer ist.")
         else:
             st.success("Beide Angebote sind gleichwertig.")
 
+        if sol["i_gleich"] is not None:
+            st.info(
+                f"Bei einem Vergleichszinssatz von ca. {sol['i_gleich']:.2f} % p.a. "
+                f"wären beide Angebote gleichwertig."
+            )
+
+def _gen_kest(rng):
+    return {
+        "art": rng.choice(["ohne_zu_mit", "mit_zu_ohne"]),
+        "i": rng.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
+    }
+
+
+KEST_FAKTOR = 0.75
+
+
+def _solve_kest(d):
+    if d["art"] == "ohne_zu_mit":
+        return {"i_mit": d["i"] * KEST_FAKTOR}
+    return {"i_ohne": d["i"] / KEST_FAKTOR}
+
+
 def _mode_kest():
     key = "zz_kest"
 
     if st.button("Neues Beispiel", key="zz_kest_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        st.session_state[key] = {
-            "art": random.choice(["ohne_zu_mit", "mit_zu_ohne"]),
-            "i": random.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
-        }
-
-    d = st.session_state[key]
-    faktor = 0.75
+    d = problem_pool.current(key, _gen_kest)
 
     st.subheader("KESt")
 
@@ -328,9 +392,11 @@ def _mode_kest():
             f"**Aufgabe:** Der Zinssatz ohne KESt beträgt {d['i']} % p.a. "
             f"Berechne den Zinssatz mit KESt."
         )
+        aufgabenraum.caption(_gen_kest)
 
         if st.button("Lösung anzeigen", key="zz_kest_sol_btn"):
-            i_mit = d["i"] * faktor
+            fortschritt.loesung(key)
+            i_mit = _solve_kest(d)["i_mit"]
 
             st.latex(r"i_{\text{mit}} = i_{\text{ohne}} \cdot 0{,}75")
             st.latex(fr"i_{{\text{{mit}}}} = {d['i']:.2f}\cdot 0.75 = {i_mit:.3f}\%")
@@ -342,38 +408,46 @@ def _mode_kest():
             f"**Aufgabe:** Der Zinssatz mit KESt beträgt {d['i']} % p.a. "
             f"Berechne den Zinssatz ohne KESt."
         )
+        aufgabenraum.caption(_gen_kest)
 
         if st.button("Lösung anzeigen", key="zz_kest_sol_btn"):
-            i_ohne = d["i"] / faktor
+            fortschritt.loesung(key)
+            i_ohne = _solve_kest(d)["i_ohne"]
 
             st.latex(r"i_{\text{ohne}} = \frac{i_{\text{mit}}}{0{,}75}")
             st.latex(fr"i_{{\text{{ohne}}}} = \frac{{{d['i']:.2f}}}{{0.75}} = {i_ohne:.3f}\%")
 
             st.success(f"Der Zinssatz ohne KESt beträgt {i_ohne:.3f} % p.a.")
 
+def _gen_theoretische_verzinsung(rng):
+    return {
+        "art": rng.choice(["endwert", "barwert"]),
+        "ganze_jahre": rng.randint(1, 3),
+        "ganze_monate": rng.randint(1, 10),
+        "ganze_tage": rng.choice([5, 10, 15, 20, 25]),
+        "K_0": rng.choice([1000, 2000, 3000, 5000]),
+        "K_n": rng.choice([2000, 3000, 5000, 8000]),
+        "i": rng.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
+    }
+
+
+def _solve_theoretische_verzinsung(d):
+    q = 1 + d["i"] / 100
+    n = d["ganze_jahre"] + d["ganze_monate"] / 12 + d["ganze_tage"] / 360
+    if d["art"] == "endwert":
+        return {"q": q, "n": n, "K_n": cashflow.value_at(cashflow.single(0, d["K_0"]), d["i"], n)}
+    return {"q": q, "n": n, "K_0": cashflow.present_value(cashflow.single(n, d["K_n"]), d["i"])}
+
+
 def _mode_theoretische_verzinsung():
     key = "zz_theoretisch"
 
-    if key in st.session_state and "ganze_jahre" not in st.session_state[key]:
-        st.session_state.pop(key, None)
-
     if st.button("Neues Beispiel", key="zz_theoretisch_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        st.session_state[key] = {
-            "art": random.choice(["endwert", "barwert"]),
-            "ganze_jahre": random.randint(1, 3),
-            "ganze_monate": random.randint(1, 10),
-            "ganze_tage": random.choice([5, 10, 15, 20, 25]),
-            "K_0": random.choice([1000, 2000, 3000, 5000]),
-            "K_n": random.choice([2000, 3000, 5000, 8000]),
-            "i": random.choice([2, 2.5, 3, 3.5, 4, 4.5, 5]),
-        }
-
-    d = st.session_state[key]
-    q = 1 + d["i"] / 100
-    n = d["ganze_jahre"] + d["ganze_monate"] / 12 + d["ganze_tage"] / 360
+    d = problem_pool.current(key, _gen_theoretische_verzinsung)
+    sol = _solve_theoretische_verzinsung(d)
+    q, n = sol["q"], sol["n"]
 
     st.subheader("Theoretische Verzinsung")
 
@@ -387,7 +461,8 @@ def _mode_theoretische_verzinsung():
         )
 
         if st.button("Lösung anzeigen", key="zz_theoretisch_sol"):
-            K_n = d["K_0"] * q ** n
+            fortschritt.loesung(key)
+            K_n = sol["K_n"]
 
             st.latex(
                 fr"n = {d['ganze_jahre']} + \frac{{{d['ganze_monate']}}}{{12}} + "
@@ -405,7 +480,8 @@ def _mode_theoretische_verzinsung():
         )
 
         if st.button("Lösung anzeigen", key="zz_theoretisch_sol"):
-            K_0 = d["K_n"] * q ** (-n)
+            fortschritt.loesung(key)
+            K_0 = sol["K_0"]
 
             st.latex(
                 fr"n = {d['ganze_jahre']} + \frac{{{d['ganze_monate']}}}{{12}} + "
@@ -416,33 +492,40 @@ def _mode_theoretische_verzinsung():
             st.latex(fr"K_0 = {d['K_n']:.2f}\cdot {q:.4f}^{{-{n:.4f}}} = {K_0:.2f}")
             st.success(f"Der Barwert beträgt {euro(K_0)}.")
 
+def _gen_unterjaehrig(rng):
+    return {
+        "gesucht": rng.choice(["endwert", "barwert"]),
+        "m": rng.choice([2, 4, 12]),
+        "i_a": rng.choice([2, 2.5, 3, 3.5, 4, 5]),
+        "n_perioden": rng.randint(3, 14),
+        "K_0": rng.choice([1000, 2000, 3000, 5000]),
+        "K_n": rng.choice([2000, 3000, 5000, 8000]),
+    }
+
+
+def _solve_unterjaehrig(d):
+    m, n_p = d["m"], d["n_perioden"]
+    q_m = cashflow.period_factor(d["i_a"], m)
+    sol = {"q_a": 1 + d["i_a"] / 100, "i_m": q_m - 1, "q_m": q_m, "n_jahre": n_p / m}
+    if d["gesucht"] == "endwert":
+        sol["K_n"] = cashflow.value_at(cashflow.single(0, d["K_0"]), d["i_a"], n_p, m)
+    else:
+        sol["K_0"] = cashflow.present_value(cashflow.single(n_p, d["K_n"]), d["i_a"], m)
+    return sol
+
+
 def _mode_unterjaehrig():
     key = "zz_unterjaehrig"
 
-    if key in st.session_state and "m" not in st.session_state[key]:
-        st.session_state.pop(key, None)
-
     if st.button("Neues Beispiel", key="zz_unterjaehrig_new"):
         st.session_state.pop(key, None)
 
-    if key not in st.session_state:
-        st.session_state[key] = {
-            "gesucht": random.choice(["endwert", "barwert"]),
-            "m": random.choice([2, 4, 12]),
-            "i_a": random.choice([2, 2.5, 3, 3.5, 4, 5]),
-            "n_perioden": random.randint(3, 14),
-            "K_0": random.choice([1000, 2000, 3000, 5000]),
-            "K_n": random.choice([2000, 3000, 5000, 8000]),
-        }
-
-    d = st.session_state[key]
+    d = problem_pool.current(key, _gen_unterjaehrig)
 
+    sol = _solve_unterjaehrig(d)
     m = d["m"]
     i_a = d["i_a"] / 100
-    q_a = 1 + i_a
-    i_m = q_a ** (1 / m) - 1
-    q_m = 1 + i_m
-    n_jahre = d["n_perioden"] / m
+    q_a, i_m, q_m, n_jahre = sol["q_a"], sol["i_m"], sol["q_m"], sol["n_jahre"]
 
     periode = {2: "Semester", 4: "Quartale", 12: "Monate"}[m]
 
@@ -455,8 +538,11 @@ def _mode_unterjaehrig():
             f"Die Laufzeit beträgt {d['n_perioden']} {periode}. Berechne den Endwert."
         )
 
+        antworten.eingabe(key, "zz.unterjaehrig", d, {"K_n": "Kₙ (€)"})
+
         if st.button("Lösung anzeigen", key="zz_unterjaehrig_sol"):
-            K_n = d["K_0"] * q_a ** n_jahre
+            fortschritt.loesung(key)
+            K_n = sol["K_n"]
 
             st.markdown("### Variante 1: Zeit umrechnen")
             st.latex(fr"n = \frac{{{d['n_perioden']}}}{{{m}}} = {n_jahre:.4f}")
@@ -477,8 +563,11 @@ def _mode_unterjaehrig():
             f"Der effektive Jahreszinssatz beträgt {d['i_a']} % p.a. Berechne den Barwert."
         )
 
+        antworten.eingabe(key, "zz.unterjaehrig", d, {"K_0": "K₀ (€)"})
+
         if st.button("Lösung anzeigen", key="zz_unterjaehrig_sol"):
-            K_0 = d["K_n"] * q_a ** (-n_jahre)
+            fortschritt.loesung(key)
+            K_0 = sol["K_0"]
 
             st.markdown("### Variante 1: Zeit umrechnen")
             st.latex(fr"n = \frac{{{d['n_perioden']}}}{{{m}}} = {n_jahre:.4f}")
@@ -493,10 +582,82 @@ def _mode_unterjaehrig():
 
             st.success(f"Der Barwert beträgt {euro(K_0)}.")
 
+
+def _gen_unbekannt(rng):
+    K_0 = rng.choice([1000, 2000, 3000, 5000, 10000])
+    if rng.random() < 0.5:
+        n = rng.randint(3, 15)
+        i = rng.choice([1.5, 2, 2.5, 3, 3.5, 4, 4.5, 5, 6])
+        K_n = round(K_0 * (1 + i / 100) ** n, 2)
+        return {"gesucht": "i", "K_0": K_0, "K_n": K_n, "n": n}
+    return {
+        "gesucht": "n",
+        "K_0": K_0,
+        "K_n": round(K_0 * rng.choice([1.25, 1.5, 2, 2.5, 3])),
+        "i": rng.choice([1.5, 2, 2.5, 3, 3.5, 4, 4.5, 5, 6]),
+    }
+
+
+def _solve_unbekannt(d):
+    if d["gesucht"] == "i":
+        i = cashflow.solve_rate([(0, -d["K_0"]), (d["n"], d["K_n"])])
+        return {"i": i, "q": 1 + i / 100}
+    n = cashflow.solve_term(d["K_0"], d["K_n"], d["i"])
+    return {"n": n, "n_jahre": math.ceil(n - 1e-9), "q": 1 + d["i"] / 100}
+
+
+def _mode_unbekannt():
+    key = "zz_unbekannt"
+
+    if st.button("Neues Beispiel", key="zz_unbekannt_new"):
+        st.session_state.pop(key, None)
+
+    d = problem_pool.current(key, _gen_unbekannt)
+
+    st.subheader("Zinssatz oder Laufzeit gesucht")
+
+    if d["gesucht"] == "i":
+        st.markdown(
+            f"**Aufgabe:** Ein Kapital von {euro(d['K_0'])} ist nach {d['n']} Jahren "
+            f"auf {euro(d['K_n'])} angewachsen. Berechne den Jahreszinssatz."
+        )
+
+        antworten.eingabe(key, "zz.unbekannt", d, {"i": "i (% p.a.)"})
+
+        if st.button("Lösung anzeigen", key="zz_unbekannt_sol"):
+            fortschritt.loesung(key)
+            sol = _solve_unbekannt(d)
+            st.latex(r"K_n = K_0 \cdot q^n \quad\Rightarrow\quad q = \sqrt[n]{\frac{K_n}{K_0}}")
+            st.latex(
+                fr"q = \sqrt[{d['n']}]{{\frac{{{d['K_n']:.2f}}}{{{d['K_0']:.2f}}}}} = {sol['q']:.6f}"
+            )
+            st.latex(fr"i = q - 1 = {sol['q'] - 1:.6f}")
+            st.success(f"Der Zinssatz beträgt ca. {sol['i']:.2f} % p.a.")
+
+    else:
+        st.markdown(
+            f"**Aufgabe:** Ein Kapital von {euro(d['K_0'])} wird mit {d['i']} % p.a. verzinst. "
+            f"Nach wie vielen Jahren sind mindestens {euro(d['K_n'])} vorhanden?"
+        )
+
+        antworten.eingabe(key, "zz.unbekannt", d, {"n_jahre": "Jahre"})
+
+        if st.button("Lösung anzeigen", key="zz_unbekannt_sol"):
+            fortschritt.loesung(key)
+            sol = _solve_unbekannt(d)
+            st.latex(r"K_n = K_0 \cdot q^n \quad\Rightarrow\quad n = \frac{\ln(K_n / K_0)}{\ln q}")
+            st.latex(
+                fr"n = \frac{{\ln({d['K_n']:.2f} / {d['K_0']:.2f})}}{{\ln {sol['q']:.4f}}} = {sol['n']:.4f}"
+            )
+            st.success(
+                f"Nach {sol['n_jahre']} Jahren sind mindestens {euro(d['K_n'])} vorhanden "
+                f"(genau: n ≈ {sol['n']:.2f})."
+            )
+
 def run():
     st.title("Zinseszins")
 
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8 = st.tabs([
+    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = st.tabs([
         "Barwert",
         "Endwert",
         "Barwert mehrere Zahlungen",
@@ -505,6 +666,7 @@ def run():
         "KESt",
         "Theoretische Verzinsung",
         "Unterjährige Verzinsung",
+        "Zinssatz / Laufzeit gesucht",
     ])
 
     with tab1:
@@ -529,4 +691,7 @@ def run():
         _mode_theoretische_verzinsung()
 
     with tab8:
-        _mode_unterjaehrig()
\ No newline at end of file
+        _mode_unterjaehrig()
+
+    with tab9:
+        _mode_unbekannt()